@@ -0,0 +1,192 @@
+"""Minimal emulation of the Slurm accounting commands used by Keystone.
+
+This module emulates the subset of `sacctmgr` and `sshare` calls issued by
+the Slurm plugin, answering queries from a JSON state file instead of a live
+Slurm installation. It is intended for development and load testing only.
+The state file location is read from the `KEYSTONE_FAKE_SLURM_STATE`
+environment variable and is expected to have the following structure:
+
+```json
+{"clusters": {"<cluster>": {"<account>": {"pi": "<username>", "users": ["<username>"], "limit": 0, "usage": 0}}}}
+```
+
+Limits and usage values are stored in minutes, matching the units reported
+by Slurm. The module is executed as a script with the emulated command name
+as the first argument (e.g., `python fakeslurm.py sacctmgr show ...`) and
+must not import Django so it can run outside the application environment.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+__all__ = ['sacctmgr', 'sshare', 'write_executables']
+
+STATE_VARIABLE = 'KEYSTONE_FAKE_SLURM_STATE'
+
+
+def _format_tres(billing: int) -> str:
+    """Return a TRES string with the given billing value."""
+
+    return f'cpu=0,mem=0,energy=0,node=0,billing={billing},fs/disk=0,vmem=0,pages=0'
+
+
+def _select_accounts(state: dict, conditions: dict) -> list[tuple[str, str, dict]]:
+    """Return the cluster, account, and account data matching `where` conditions.
+
+    Args:
+        state: The emulated Slurm state.
+        conditions: Lowercase condition names mapped to their value.
+
+    Returns:
+        A list of matching `(cluster name, account name, account data)` tuples.
+    """
+
+    cluster_names = conditions['cluster'].split(',') if 'cluster' in conditions else sorted(state['clusters'])
+    account_names = set(conditions['account'].split(',')) if 'account' in conditions else None
+
+    selected = []
+    for cluster_name in cluster_names:
+        for account_name, account in sorted(state['clusters'].get(cluster_name, {}).items()):
+            if account_names is None or account_name in account_names:
+                selected.append((cluster_name, account_name, account))
+
+    return selected
+
+
+def _parse_conditions(args: list[str]) -> dict[str, str]:
+    """Parse `key=value` command arguments into a dictionary with lowercase keys."""
+
+    return {
+        key.lower(): value
+        for key, _, value in (arg.partition('=') for arg in args if '=' in arg and not arg.startswith('-'))
+    }
+
+
+def sacctmgr(args: list[str], state: dict) -> str:
+    """Emulate a call to `sacctmgr`.
+
+    Args:
+        args: Command line arguments passed to `sacctmgr`.
+        state: The emulated Slurm state, modified in place by `modify` calls.
+
+    Returns:
+        The emulated command output.
+    """
+
+    if 'set' in args:
+        where, updates = args[:args.index('set')], _parse_conditions(args[args.index('set') + 1:])
+
+    else:
+        where, updates = args, dict()
+
+    conditions = _parse_conditions(where)
+    fields = [name.lower() for name in conditions.pop('format', '').split(',') if name]
+    accounts = _select_accounts(state, conditions)
+
+    if 'modify' in args:
+        billing = int(updates['grptresmins'].partition('billing=')[2])
+        for _, _, account in accounts:
+            account['limit'] = billing
+
+        return ''
+
+    if 'account' in args:
+        # Account records are reported once regardless of the number of clusters
+        rows = {name: {'account': name, 'descr': account['pi']} for _, name, account in accounts}
+        return '\n'.join('|'.join(row.get(f, '') for f in fields) for row in rows.values())
+
+    rows = []
+    for cluster_name, account_name, account in accounts:
+        rows.append({'account': account_name, 'user': '', 'grptresmins': f'billing={account["limit"]}'})
+        rows.extend({'account': account_name, 'user': user, 'grptresmins': ''} for user in account['users'])
+
+    return '\n'.join('|'.join(row.get(f, '') for f in fields) for row in rows)
+
+
+def sshare(args: list[str], state: dict) -> str:
+    """Emulate a call to `sshare`.
+
+    Args:
+        args: Command line arguments passed to `sshare`.
+        state: The emulated Slurm state.
+
+    Returns:
+        The emulated command output.
+    """
+
+    conditions, fields = dict(), []
+    for flag, value in zip(args, args[1:] + ['']):
+        if flag == '-A':
+            conditions['account'] = value
+
+        elif flag == '-M':
+            conditions['cluster'] = value
+
+        elif flag.startswith('--format='):
+            fields = [name.lower() for name in flag.removeprefix('--format=').split(',')]
+
+    rows = []
+    for cluster_name, account_name, account in _select_accounts(state, conditions):
+        rows.append({'account': account_name, 'user': '', 'grptresraw': _format_tres(account['usage'])})
+        if '-a' in args:
+            rows.extend({'account': account_name, 'user': user, 'grptresraw': _format_tres(0)} for user in account['users'])
+
+    return '\n'.join('|'.join(row.get(f, '') for f in fields) for row in rows)
+
+
+def write_executables(directory: Path) -> list[Path]:
+    """Write executable `sacctmgr` and `sshare` wrappers backed by a state file in the given directory.
+
+    Args:
+        directory: The directory containing the `state.json` file.
+
+    Returns:
+        The paths of the written executables.
+    """
+
+    paths = []
+    for command in ('sacctmgr', 'sshare'):
+        path = directory / command
+        path.write_text(
+            '#!/bin/sh\n'
+            f'{STATE_VARIABLE}="{directory.resolve() / "state.json"}" '
+            f'exec "{sys.executable}" "{Path(__file__).resolve()}" {command} "$@"\n'
+        )
+        path.chmod(0o755)
+        paths.append(path)
+
+    return paths
+
+
+def main(argv: list[str]) -> int:
+    """Execute an emulated Slurm command and print its output.
+
+    Args:
+        argv: The emulated command name followed by its arguments.
+
+    Returns:
+        The command exit code.
+    """
+
+    commands = {'sacctmgr': sacctmgr, 'sshare': sshare}
+    if not argv or argv[0] not in commands:
+        print(f'Usage: fakeslurm.py {{{",".join(commands)}}} [ARGS]', file=sys.stderr)
+        return 1
+
+    state_path = Path(os.environ[STATE_VARIABLE])
+    state = json.loads(state_path.read_text())
+    output = commands[argv[0]](argv[1:], state)
+
+    if argv[0] == 'sacctmgr' and 'modify' in argv:
+        state_path.write_text(json.dumps(state))
+
+    if output:
+        print(output)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,342 @@
+"""Populate the application database with synthetic records for load testing.
+
+Records are generated from a seeded random number generator, so the same
+seed and scale always produce the same dataset (relative to the current
+date). Each unit of scale creates 1,000 users, 100 research groups, 1,000
+allocation requests, 2,000 allocations, 2,000 notifications, and 5,000
+request logs. Generated usernames, group names, and cluster names are
+prefixed with `gen_` and the command refuses to run if generated users
+already exist.
+
+A matching fake Slurm state can optionally be written to a directory along
+with `sacctmgr` and `sshare` executables emulating a Slurm installation.
+Add the directory to the front of the `PATH` variable to point the
+Slurm plugin at the fake installation.
+
+## Arguments
+
+| Argument     | Description                                                      |
+|--------------|------------------------------------------------------------------|
+| --scale      | Multiplier controlling the number of generated records           |
+| --seed       | Seed for the random number generator                             |
+| --batch-size | Number of records inserted per database query                    |
+| --slurm-dir  | Write a fake Slurm state and executables to the given directory  |
+"""
+
+import json
+import random
+from argparse import ArgumentParser
+from datetime import date, timedelta
+from pathlib import Path
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Sum
+
+from apps.admin_utils import fakeslurm
+from apps.allocations.models import Allocation, AllocationRequest, AllocationRequestReview, Cluster
+from apps.logging.models import RequestLog
+from apps.notifications.models import Notification
+from apps.users.models import GroupMembership, ResearchGroup, User
+
+PREFIX = 'gen_'
+
+
+class Command(BaseCommand):
+    """Populate the application database with synthetic records for load testing."""
+
+    help = __doc__
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        """Add command-line arguments to the parser.
+
+        Args:
+          parser: The argument parser instance.
+        """
+
+        group = parser.add_argument_group('generate_data options')
+        group.add_argument('--scale', type=int, default=1, help='Multiplier controlling the number of generated records.')
+        group.add_argument('--seed', type=int, default=0, help='Seed for the random number generator.')
+        group.add_argument('--batch-size', type=int, default=1000, help='Number of records inserted per database query.')
+        group.add_argument('--slurm-dir', type=Path, help='Write a fake Slurm state and executables to the given directory.')
+
+    def handle(self, *args, **options) -> None:
+        """Handle the command execution.
+
+        Args:
+          *args: Additional positional arguments.
+          **options: Additional keyword arguments.
+        """
+
+        if options['scale'] < 1:
+            raise CommandError('The scale must be a positive integer.')
+
+        if User.objects.filter(username__startswith=PREFIX).exists():
+            raise CommandError('Generated records already exist in the database.')
+
+        self.rng = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+        scale = options['scale']
+
+        with transaction.atomic():
+            clusters = self.generate_clusters()
+            users = self.generate_users(1000 * scale)
+            groups = self.generate_groups(users, 100 * scale)
+            requests = self.generate_requests(groups, users, 1000 * scale)
+            self.generate_allocations(requests, clusters)
+            self.generate_notifications(users, 2000 * scale)
+            self.generate_request_logs(users, 5000 * scale)
+
+        if options['slurm_dir']:
+            self.stdout.write(self.style.SUCCESS('Writing fake Slurm state...'))
+            self.write_slurm_state(options['slurm_dir'], clusters, groups)
+
+    def bulk_create(self, model: type, objects: list) -> list:
+        """Insert records into the database in batches and report progress.
+
+        Args:
+            model: The model class of the records.
+            objects: The unsaved model instances.
+
+        Returns:
+            The created model instances.
+        """
+
+        self.stdout.write(self.style.SUCCESS(f'Generating {len(objects)} {model._meta.verbose_name_plural}...'))
+        return model.objects.bulk_create(objects, batch_size=self.batch_size)
+
+    def random_date(self, start: int, end: int) -> date:
+        """Return a random date within a range of days relative to today.
+
+        Args:
+            start: The start of the range in days from today.
+            end: The end of the range in days from today.
+
+        Returns:
+            A random date.
+        """
+
+        return date.today() + timedelta(days=self.rng.randint(start, end))
+
+    def generate_clusters(self) -> list[Cluster]:
+        """Create a fixed set of Slurm clusters."""
+
+        return self.bulk_create(Cluster, [Cluster(name=f'{PREFIX}cluster{i}') for i in range(3)])
+
+    def generate_users(self, count: int) -> list[User]:
+        """Create user accounts with unusable passwords.
+
+        Args:
+            count: The number of users to create.
+
+        Returns:
+            The created users.
+        """
+
+        password = make_password(None)
+        return self.bulk_create(User, [
+            User(
+                username=f'{PREFIX}user{i}',
+                password=password,
+                first_name=f'First{i}',
+                last_name=f'Last{i}',
+                email=f'{PREFIX}user{i}@example.com',
+                is_ldap_user=self.rng.random() < 0.5
+            ) for i in range(count)
+        ])
+
+    def generate_groups(self, users: list[User], count: int) -> list[ResearchGroup]:
+        """Create research groups and assign users as PIs, admins, and members.
+
+        Args:
+            users: The users to assign to research groups.
+            count: The number of research groups to create.
+
+        Returns:
+            The created research groups.
+        """
+
+        groups = self.bulk_create(ResearchGroup, [
+            ResearchGroup(name=f'{PREFIX}group{i}', pi=users[i]) for i in range(count)
+        ])
+
+        # Each group is given one admin and up to eleven members in addition to the PI
+        admins, members = [], []
+        for group in groups:
+            admin, *others = (user for user in self.rng.sample(users, k=12) if user != group.pi)
+            admins.append(ResearchGroup.admins.through(researchgroup=group, user=admin))
+            members.extend(ResearchGroup.members.through(researchgroup=group, user=user) for user in others)
+
+        ResearchGroup.admins.through.objects.bulk_create(admins, batch_size=self.batch_size)
+        ResearchGroup.members.through.objects.bulk_create(members, batch_size=self.batch_size)
+
+        # Bulk inserts do not trigger the signals maintaining the membership table
+        GroupMembership.objects.rebuild()
+        return groups
+
+    def generate_requests(self, groups: list[ResearchGroup], users: list[User], count: int) -> list[AllocationRequest]:
+        """Create allocation requests with reviews and assignees.
+
+        Requests are spread over past, active, and upcoming allocation periods.
+
+        Args:
+            groups: The research groups submitting requests.
+            users: The users assigned to requests.
+            count: The number of requests to create.
+
+        Returns:
+            The created allocation requests.
+        """
+
+        requests = []
+        for i in range(count):
+            active = self.random_date(-730, 30)
+            requests.append(AllocationRequest(
+                title=f'Allocation request {i}',
+                description='Synthetic allocation request. ' * self.rng.randint(1, 20),
+                status=self.rng.choice(AllocationRequest.StatusChoices.values),
+                active=active,
+                expire=active + timedelta(days=365),
+                group=self.rng.choice(groups)
+            ))
+
+        requests = self.bulk_create(AllocationRequest, requests)
+
+        AllocationRequest.assignees.through.objects.bulk_create(
+            [
+                AllocationRequest.assignees.through(allocationrequest=request, user=user)
+                for request in requests for user in self.rng.sample(users, k=self.rng.randint(0, 2))
+            ],
+            batch_size=self.batch_size
+        )
+
+        self.bulk_create(AllocationRequestReview, [
+            AllocationRequestReview(
+                request=request,
+                reviewer=self.rng.choice(users),
+                status=self.rng.choice(AllocationRequestReview.StatusChoices.values)
+            ) for request in requests if request.status != AllocationRequest.StatusChoices.PENDING
+        ])
+
+        return requests
+
+    def generate_allocations(self, requests: list[AllocationRequest], clusters: list[Cluster]) -> list[Allocation]:
+        """Create allocations on two clusters for every allocation request.
+
+        Args:
+            requests: The allocation requests to create allocations for.
+            clusters: The clusters to allocate service units on.
+
+        Returns:
+            The created allocations.
+        """
+
+        allocations = []
+        for request in requests:
+            for cluster in self.rng.sample(clusters, k=2):
+                requested = self.rng.randrange(10_000, 1_000_000, 1000)
+                approved = request.status == AllocationRequest.StatusChoices.APPROVED
+                expired = approved and request.expire <= date.today()
+                allocations.append(Allocation(
+                    request=request,
+                    cluster=cluster,
+                    requested=requested,
+                    awarded=requested if approved else None,
+                    final=self.rng.randint(0, requested) if expired else None
+                ))
+
+        return self.bulk_create(Allocation, allocations)
+
+    def generate_notifications(self, users: list[User], count: int) -> list[Notification]:
+        """Create user notifications.
+
+        Args:
+            users: The users receiving notifications.
+            count: The number of notifications to create.
+
+        Returns:
+            The created notifications.
+        """
+
+        return self.bulk_create(Notification, [
+            Notification(
+                user=self.rng.choice(users),
+                subject=f'Notification {i}',
+                message='Synthetic notification message.',
+                notification_type=self.rng.choice(Notification.NotificationType.values),
+                read=self.rng.random() < 0.5
+            ) for i in range(count)
+        ])
+
+    def generate_request_logs(self, users: list[User], count: int) -> list[RequestLog]:
+        """Create HTTP request logs.
+
+        Args:
+            users: The users submitting requests.
+            count: The number of request logs to create.
+
+        Returns:
+            The created request logs.
+        """
+
+        routes = ['allocations/allocations/', 'allocations/requests/', 'research/grants/', 'users/users/']
+        logs = []
+        for _ in range(count):
+            route = self.rng.choice(routes)
+            logs.append(RequestLog(
+                method=self.rng.choice(['GET', 'GET', 'GET', 'POST', 'PATCH']),
+                endpoint=f'/{route}',
+                route=route,
+                response_code=self.rng.choice([200, 200, 200, 201, 403, 404]),
+                body_request='',
+                body_response='',
+                remote_address=f'10.0.{self.rng.randint(0, 255)}.{self.rng.randint(0, 255)}',
+                duration=self.rng.lognormvariate(-3, 1),
+                query_count=self.rng.randint(1, 10),
+                user=self.rng.choice(users)
+            ))
+
+        return self.bulk_create(RequestLog, logs)
+
+    def write_slurm_state(self, directory: Path, clusters: list[Cluster], groups: list[ResearchGroup]) -> None:
+        """Write a fake Slurm state matching the generated research groups and allocations.
+
+        Every research group is given an account on each generated cluster.
+        Account limits match the awarded service units and usage values are
+        randomly distributed around the account limit.
+
+        Args:
+            directory: The directory to write the state file and executables to.
+            clusters: The generated clusters.
+            groups: The generated research groups.
+        """
+
+        awarded = dict()
+        for group_id, cluster_id, total in (
+            Allocation.objects.filter(request__group__name__startswith=PREFIX, awarded__isnull=False)
+            .values_list('request__group_id', 'cluster_id').annotate(total=Sum('awarded')).order_by()
+        ):
+            awarded[group_id, cluster_id] = total
+
+        usernames = dict(User.objects.filter(username__startswith=PREFIX).values_list('pk', 'username'))
+        group_users = dict()
+        memberships = GroupMembership.objects.filter(group__name__startswith=PREFIX)
+        for group_id, user_id in memberships.values_list('group_id', 'user_id'):
+            group_users.setdefault(group_id, []).append(usernames[user_id])
+
+        state = {'clusters': dict()}
+        for cluster in clusters:
+            accounts = state['clusters'][cluster.name] = dict()
+            for group in groups:
+                limit = awarded.get((group.pk, cluster.pk), 0)
+                accounts[group.name] = {
+                    'pi': usernames[group.pi_id],
+                    'users': sorted(group_users.get(group.pk, [])),
+                    'limit': limit * 60,
+                    'usage': int(limit * 60 * self.rng.uniform(0, 1.2)),
+                }
+
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / 'state.json').write_text(json.dumps(state))
+        fakeslurm.write_executables(directory)
@@ -0,0 +1,100 @@
+"""Unit tests for the `generate_data` management command."""
+
+from io import StringIO
+
+from django.core.management import call_command, CommandError
+from django.db import transaction
+from django.test import TestCase
+
+from apps.allocations.models import Allocation, AllocationRequest
+from apps.logging.models import RequestLog
+from apps.notifications.models import Notification
+from apps.users.models import ResearchGroup, User
+
+
+def generate_data(**options) -> None:
+    """Run the `generate_data` command at the smallest scale using the given options."""
+
+    call_command('generate_data', scale=1, stdout=StringIO(), **options)
+
+
+def get_fingerprint() -> dict[str, list[tuple]]:
+    """Return the content of generated records independent of their primary keys."""
+
+    return {
+        'users': list(User.objects.order_by('username').values_list('username', 'is_ldap_user')),
+        'groups': list(ResearchGroup.objects.order_by('name').values_list('name', 'pi__username')),
+        'requests': list(
+            AllocationRequest.objects.order_by('title')
+            .values_list('title', 'status', 'active', 'expire', 'group__name')
+        ),
+        'allocations': list(
+            Allocation.objects.order_by('request__title', 'cluster__name')
+            .values_list('request__title', 'cluster__name', 'requested', 'awarded', 'final')
+        ),
+        'notifications': list(
+            Notification.objects.order_by('subject')
+            .values_list('subject', 'user__username', 'notification_type', 'read')
+        ),
+        'logs': list(
+            RequestLog.objects.order_by('pk')
+            .values_list('method', 'route', 'response_code', 'remote_address', 'duration', 'user__username')
+        ),
+    }
+
+
+class RecordCounts(TestCase):
+    """Test the number of generated records."""
+
+    def test_records_scale(self) -> None:
+        """Test the number of generated records matches the requested scale."""
+
+        generate_data()
+
+        self.assertEqual(1000, User.objects.count())
+        self.assertEqual(100, ResearchGroup.objects.count())
+        self.assertEqual(1000, AllocationRequest.objects.count())
+        self.assertEqual(2000, Allocation.objects.count())
+        self.assertEqual(2000, Notification.objects.count())
+        self.assertEqual(5000, RequestLog.objects.count())
+
+
+class Reproducibility(TestCase):
+    """Test generated data is determined by the random seed."""
+
+    def generate_fingerprint(self, seed: int) -> dict[str, list[tuple]]:
+        """Generate records using the given seed and return their fingerprint before discarding them."""
+
+        with transaction.atomic():
+            generate_data(seed=seed)
+            fingerprint = get_fingerprint()
+            transaction.set_rollback(True)
+
+        return fingerprint
+
+    def test_same_seed_same_output(self) -> None:
+        """Test generating data twice with the same seed produces identical records."""
+
+        self.assertEqual(self.generate_fingerprint(1), self.generate_fingerprint(1))
+
+    def test_different_seed_different_output(self) -> None:
+        """Test generating data with different seeds produces different records."""
+
+        self.assertNotEqual(self.generate_fingerprint(1), self.generate_fingerprint(2))
+
+
+class InvalidArguments(TestCase):
+    """Test the command refuses to run with invalid arguments or database state."""
+
+    def test_invalid_scale(self) -> None:
+        """Test an error is raised for non-positive scales."""
+
+        with self.assertRaises(CommandError):
+            call_command('generate_data', scale=0, stdout=StringIO())
+
+    def test_existing_records(self) -> None:
+        """Test an error is raised if generated records already exist."""
+
+        User.objects.create(username='gen_user0')
+        with self.assertRaises(CommandError):
+            generate_data()
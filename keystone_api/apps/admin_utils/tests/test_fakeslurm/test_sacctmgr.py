@@ -0,0 +1,75 @@
+"""Unit tests for the `sacctmgr` function."""
+
+from shlex import split
+
+from django.test import SimpleTestCase
+
+from apps.admin_utils.fakeslurm import sacctmgr
+from plugins.slurm import parse_account_billing
+
+
+def create_state() -> dict:
+    """Return an emulated Slurm state with two accounts on two clusters."""
+
+    return {'clusters': {
+        'cluster1': {
+            'group1': {'pi': 'pi1', 'users': ['pi1', 'user1'], 'limit': 600, 'usage': 60},
+            'group2': {'pi': 'pi2', 'users': ['pi2'], 'limit': 1200, 'usage': 0},
+        },
+        'cluster2': {
+            'group1': {'pi': 'pi1', 'users': ['pi1', 'user1'], 'limit': 0, 'usage': 0},
+        },
+    }}
+
+
+class ShowAccounts(SimpleTestCase):
+    """Test the emulation of account queries."""
+
+    def test_account_names(self) -> None:
+        """Test account names are returned once regardless of the number of clusters."""
+
+        output = sacctmgr(split('show -nP account withassoc where parents=root format=Account'), create_state())
+        self.assertEqual({'group1', 'group2'}, set(output.split()))
+
+    def test_account_names_by_cluster(self) -> None:
+        """Test account names are filtered by cluster."""
+
+        output = sacctmgr(split('show -nP account withassoc where parents=root format=Account cluster=cluster2'), create_state())
+        self.assertEqual({'group1'}, set(output.split()))
+
+    def test_account_description(self) -> None:
+        """Test the account description is the PI username."""
+
+        output = sacctmgr(split('show -nP account where account=group2 format=Descr'), create_state())
+        self.assertEqual('pi2', output)
+
+
+class ShowAssociations(SimpleTestCase):
+    """Test the emulation of association queries."""
+
+    def test_account_users(self) -> None:
+        """Test usernames are returned for the associations of an account."""
+
+        output = sacctmgr(split('show -nP association where account=group1 format=user cluster=cluster1'), create_state())
+        self.assertEqual({'pi1', 'user1'}, set(output.split()))
+
+    def test_cluster_limits(self) -> None:
+        """Test account limits are reported in a format parsable by the Slurm plugin."""
+
+        cmd = split('show -nP association where cluster=cluster1 format=Account,User,GrpTRESMins')
+        self.assertEqual({'group1': 10, 'group2': 20}, parse_account_billing(sacctmgr(cmd, create_state())))
+
+
+class ModifyAccounts(SimpleTestCase):
+    """Test the emulation of account modifications."""
+
+    def test_limits_updated(self) -> None:
+        """Test limits are updated for the selected accounts on the selected cluster only."""
+
+        state = create_state()
+        cmd = split('modify -i account where account=group1,group2 cluster=cluster1 set GrpTresMins=billing=3000')
+        sacctmgr(cmd, state)
+
+        self.assertEqual(3000, state['clusters']['cluster1']['group1']['limit'])
+        self.assertEqual(3000, state['clusters']['cluster1']['group2']['limit'])
+        self.assertEqual(0, state['clusters']['cluster2']['group1']['limit'])
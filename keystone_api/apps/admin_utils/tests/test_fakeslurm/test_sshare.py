@@ -0,0 +1,38 @@
+"""Unit tests for the `sshare` function."""
+
+import re
+from shlex import split
+
+from django.test import SimpleTestCase
+
+from apps.admin_utils.fakeslurm import sshare
+from plugins.slurm import parse_account_billing
+
+
+class ShowUsage(SimpleTestCase):
+    """Test the emulation of usage queries."""
+
+    state = {'clusters': {
+        'cluster1': {
+            'group1': {'pi': 'pi1', 'users': ['pi1'], 'limit': 600, 'usage': 120},
+            'group2': {'pi': 'pi2', 'users': ['pi2'], 'limit': 600, 'usage': 240},
+        },
+    }}
+
+    def test_account_usage(self) -> None:
+        """Test the usage of a single account matches the format expected by the Slurm plugin."""
+
+        output = sshare(split('-nP -A group1 -M cluster1 --format=GrpTRESRaw'), self.state)
+        self.assertEqual(['120'], re.findall(r'billing=(.*),fs', output))
+
+    def test_cluster_usages(self) -> None:
+        """Test the usage of all accounts is reported in a format parsable by the Slurm plugin."""
+
+        output = sshare(split('-a -nP -M cluster1 --format=Account,User,GrpTRESRaw'), self.state)
+        self.assertEqual({'group1': 2, 'group2': 4}, parse_account_billing(output))
+
+    def test_user_records_included(self) -> None:
+        """Test user level records are included when the `-a` flag is given."""
+
+        output = sshare(split('-a -nP -M cluster1 --format=Account,User,GrpTRESRaw'), self.state)
+        self.assertIn('group1|pi1|', output)
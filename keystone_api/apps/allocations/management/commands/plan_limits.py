@@ -0,0 +1,101 @@
+"""A Django management command for previewing changes to Slurm usage limits.
+
+Calculates the updated TRES billing limit for every Slurm account without
+modifying Slurm or the application database. The resulting plan is written as
+JSON or CSV along with the time spent in each phase of the calculation.
+
+## Arguments
+
+| Argument    | Description                                                      |
+|-------------|------------------------------------------------------------------|
+| --cluster   | Only plan changes for the given cluster (repeatable)             |
+| --format    | The output format (`json` or `csv`)                              |
+| --output    | Write the report to a file instead of STDOUT                     |
+"""
+
+import csv
+import json
+import sys
+from argparse import ArgumentParser
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.allocations.models import Cluster
+from apps.allocations.tasks import plan_limits_for_cluster
+
+
+class Command(BaseCommand):
+    """Preview changes to Slurm usage limits without applying them."""
+
+    help = __doc__
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        """Add command-line arguments to the parser.
+
+        Args:
+          parser: The argument parser instance.
+        """
+
+        parser.add_argument('--cluster', action='append', help='Only plan changes for the given cluster.')
+        parser.add_argument('--format', choices=['json', 'csv'], default='json', help='The output format.')
+        parser.add_argument('--output', help='Write the report to a file instead of STDOUT.')
+
+    def handle(self, *args, **options) -> None:
+        """Handle the command execution.
+
+        Args:
+          *args: Additional positional arguments.
+          **options: Additional keyword arguments.
+        """
+
+        clusters = Cluster.objects.filter(enabled=True)
+        if options['cluster']:
+            clusters = clusters.filter(name__in=options['cluster'])
+            missing = set(options['cluster']) - set(clusters.values_list('name', flat=True))
+            if missing:
+                raise CommandError(f'Unknown or disabled clusters: {", ".join(sorted(missing))}')
+
+        plans = [plan_limits_for_cluster(cluster) for cluster in clusters]
+
+        stream = open(options['output'], 'w', newline='') if options['output'] else sys.stdout
+        try:
+            if options['format'] == 'csv':
+                self.write_csv(plans, stream)
+
+            else:
+                json.dump(plans, stream, indent=2)
+                stream.write('\n')
+
+        finally:
+            if stream is not sys.stdout:
+                stream.close()
+
+        for plan in plans:
+            timing = ', '.join(f'{phase}={seconds:.3f}s' for phase, seconds in plan['timing'].items())
+            self.stderr.write(
+                f"{plan['cluster']}: {plan['changed']} changed, {plan['unchanged']} unchanged ({timing})"
+            )
+
+    @staticmethod
+    def write_csv(plans: list[dict], stream) -> None:
+        """Write planned limit changes as CSV with one row per account.
+
+        Args:
+            plans: Plans generated by `plan_limits_for_cluster`.
+            stream: The file-like object to write to.
+        """
+
+        writer = csv.writer(stream)
+        writer.writerow(['cluster', 'account', 'current_limit', 'updated_limit', 'change', 'changed', 'closing_allocations'])
+        for plan in plans:
+            for row in plan['accounts']:
+                closing = ';'.join(f'{pk}={final}' for pk, final in row['closing'].items())
+                writer.writerow([
+                    plan['cluster'],
+                    row['account'],
+                    row['current_limit'],
+                    row['updated_limit'],
+                    row['change'],
+                    row['changed'],
+                    closing
+                ])
@@ -6,10 +6,11 @@ every database model. Managers are commonly exposed as an attribute of the
 associated model class called `objects`.
 """
 
+from collections.abc import Iterable
 from datetime import date
 from typing import TYPE_CHECKING
 
-from django.db.models import Manager, QuerySet, Sum
+from django.db.models import Manager, Q, QuerySet, Sum
 
 from apps.users.models import ResearchGroup
 
@@ -74,6 +75,33 @@ class AllocationManager(Manager):
             final=None, request__expire__lte=date.today()
         ).order_by("request__expire")
 
+    def expiring_allocations_by_account(
+        self, cluster: 'Cluster', accounts: Iterable[ResearchGroup]
+    ) -> dict[int, list]:
+        """Retrieve expiring allocations for multiple accounts on a cluster using a single query.
+
+        Args:
+            cluster: object representing the cluster.
+            accounts: The accounts to retrieve allocations for.
+
+        Returns:
+            A dictionary mapping account primary keys to expiring Allocation objects ordered by expiration date.
+        """
+
+        allocations = {account.pk: [] for account in accounts}
+        queryset = self.filter(
+            cluster=cluster,
+            request__group__in=allocations.keys(),
+            request__status='AP',
+            final=None,
+            request__expire__lte=date.today()
+        ).select_related('request').order_by('request__expire')
+
+        for allocation in queryset:
+            allocations[allocation.request.group_id].append(allocation)
+
+        return allocations
+
     def active_service_units(self, account: ResearchGroup, cluster: 'Cluster') -> int:
         """Calculate the total service units across all active allocations for an account and cluster.
 
@@ -123,3 +151,43 @@ class AllocationManager(Manager):
         return self.approved_allocations(account, cluster).filter(
             request__expire__lte=date.today()
         ).aggregate(Sum("final"))['final__sum'] or 0
+
+    def service_unit_totals(
+        self, cluster: 'Cluster', accounts: Iterable[ResearchGroup] | None = None
+    ) -> dict[int, dict[str, int]]:
+        """Calculate active, expiring, and historical service units for multiple accounts on a cluster.
+
+        Totals are calculated using a single grouped query and are equivalent to calling
+        `active_service_units`, `expiring_service_units`, and `historical_usage` for each account.
+
+        Args:
+            cluster: object representing the cluster.
+            accounts: Optionally limit results to the given accounts (defaults to all accounts).
+
+        Returns:
+            A dictionary mapping account primary keys to their `active`, `expiring`, and `historical` totals.
+        """
+
+        today = date.today()
+        queryset = self.filter(cluster=cluster, request__status='AP')
+        totals = dict()
+
+        if accounts is not None:
+            account_ids = [account.pk for account in accounts]
+            queryset = queryset.filter(request__group__in=account_ids)
+            totals = {pk: {'active': 0, 'expiring': 0, 'historical': 0} for pk in account_ids}
+
+        rows = queryset.order_by().values('request__group').annotate(
+            active=Sum('awarded', filter=Q(request__active__lte=today, request__expire__gt=today)),
+            expiring=Sum('awarded', filter=Q(final=None, request__expire__lte=today)),
+            historical=Sum('final', filter=Q(request__expire__lte=today)),
+        )
+
+        for row in rows:
+            totals[row['request__group']] = {
+                'active': row['active'] or 0,
+                'expiring': row['expiring'] or 0,
+                'historical': row['historical'] or 0,
+            }
+
+        return totals
@@ -0,0 +1,27 @@
+# Generated by Django 5.1.2 on 2026-10-18 03:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('allocations', '0007_alter_allocationrequestreview_reviewer'),
+        ('users', '0007_researchgroup_is_active_alter_researchgroup_pi'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PendingLimitUpdate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('due', models.DateField()),
+                ('cluster', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='allocations.cluster')),
+                ('group', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='users.researchgroup')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('group', 'cluster', 'due'), name='unique_pending_limit_update')],
+            },
+        ),
+    ]
@@ -24,6 +24,7 @@ __all__ = [
     'AllocationRequestReview',
     'Attachment',
     'Cluster',
+    'PendingLimitUpdate',
     'RGModelInterface',
 ]
 
@@ -155,3 +156,28 @@ class Cluster(models.Model):
         """Return the cluster name as a string."""
 
         return str(self.name)
+
+
+class PendingLimitUpdate(models.Model):
+    """A Slurm account awaiting recalculation of its usage limit on a given cluster.
+
+    Records are created when allocation data changes and are consumed by the
+    incremental limits task once the `due` date is reached.
+    """
+
+    due = models.DateField()
+
+    group: ResearchGroup = models.ForeignKey(ResearchGroup, on_delete=models.CASCADE)
+    cluster: Cluster = models.ForeignKey(Cluster, on_delete=models.CASCADE)
+
+    class Meta:
+        """Database model settings."""
+
+        constraints = [
+            models.UniqueConstraint(fields=['group', 'cluster', 'due'], name='unique_pending_limit_update'),
+        ]
+
+    def __str__(self) -> str:  # pragma: nocover
+        """Return a human-readable summary of the pending update."""
+
+        return f'Limit update for {self.group} on {self.cluster} due {self.due}'
@@ -8,7 +8,7 @@ predefined access rules.
 
 from rest_framework import permissions
 
-from apps.users.models import ResearchGroup
+from apps.users.membership import get_membership
 from .models import RGModelInterface
 
 __all__ = [
@@ -35,18 +35,17 @@ class GroupAdminCreateGroupRead(permissions.BasePermission):
         # belongs to. Deny permissions if the group is not provided or does not exist.
         try:
             group_id = request.data.get('group', None)
-            group = ResearchGroup.objects.get(pk=group_id)
 
-        except (ResearchGroup.DoesNotExist, Exception):
+        except Exception:
             return False
 
-        return request.user in group.get_privileged_members()
+        return get_membership(request).is_privileged(group_id)
 
     def has_object_permission(self, request, view, obj: RGModelInterface) -> bool:
         """Return whether the incoming HTTP request has permission to access a database record."""
 
         is_staff = request.user.is_staff
-        is_group_member = request.user in obj.get_research_group().get_all_members()
+        is_group_member = get_membership(request).is_member(obj.get_research_group())
 
         if request.method in permissions.SAFE_METHODS:
             return is_group_member or is_staff
@@ -89,5 +88,5 @@ class StaffWriteGroupRead(permissions.BasePermission):
         if request.user.is_staff:
             return True
 
-        user_is_in_group = request.user in obj.get_research_group().get_all_members()
+        user_is_in_group = get_membership(request).is_member(obj.get_research_group())
         return request.method in permissions.SAFE_METHODS and user_is_in_group
@@ -5,30 +5,35 @@ redirecting URLs, issuing notifications, and handling HTTP responses.
 """
 
 import logging
+from typing import Callable, Iterable
 
 from apps.allocations.models import AllocationRequest
 from apps.notifications.models import Notification
-from apps.notifications.shortcuts import send_notification_template
+from apps.notifications.shortcuts import NotificationEmail, render_notification_batch
 from apps.users.models import User
 
 log = logging.getLogger(__name__)
 
+UPCOMING_EXPIRATION_TEMPLATE = 'upcoming_expiration_email.html'
+PAST_EXPIRATION_TEMPLATE = 'past_expiration_email.html'
 
-def send_notification_upcoming_expiration(user: User, request: AllocationRequest) -> None:
-    """Send a notification to alert a user their allocation request will expire soon.
+
+def get_upcoming_expiration_arguments(user: User, request: AllocationRequest, threshold: int) -> dict:
+    """Return the arguments used to render a notification on the upcoming expiration of an allocation request.
 
     Args:
         user: The user to notify.
         request: The allocation request to notify the user about.
-    """
+        threshold: The expiration threshold in days that triggered the notification.
 
-    log.info(f'Sending notification to user "{user.username}" on upcoming expiration for request {request.id}.')
+    Returns:
+        Keyword arguments for `render_notification_template` excluding the template name.
+    """
 
     days_until_expire = request.get_days_until_expire()
-    send_notification_template(
+    return dict(
         user=user,
         subject=f'You have an allocation expiring on {request.expire}',
-        template='upcoming_expiration_email.html',
         context={
             'user': user,
             'request': request,
@@ -37,24 +42,26 @@ def send_notification_upcoming_expiration(user: User, request: AllocationRequest
         notification_type=Notification.NotificationType.request_expiring,
         notification_metadata={
             'request_id': request.id,
-            'days_to_expire': days_until_expire
+            'days_to_expire': days_until_expire,
+            'expiration_threshold': threshold
         }
     )
 
 
-def send_notification_past_expiration(user: User, request: AllocationRequest) -> None:
-    """Send a notification to alert a user their allocation request has expired.
+def get_past_expiration_arguments(user: User, request: AllocationRequest) -> dict:
+    """Return the arguments used to render a notification on the expiration of an allocation request.
 
     Args:
         user: The user to notify.
         request: The allocation request to notify the user about.
+
+    Returns:
+        Keyword arguments for `render_notification_template` excluding the template name.
     """
 
-    log.info(f'Sending notification to user "{user.username}" on expiration of request {request.id}.')
-    send_notification_template(
+    return dict(
         user=user,
         subject='One of your allocations has expired',
-        template='past_expiration_email.html',
         context={
             'user': user,
             'request': request
@@ -64,3 +71,56 @@ def send_notification_past_expiration(user: User, request: AllocationRequest) ->
             'request_id': request.id
         }
     )
+
+
+def _build_notification_batch(
+    template: str,
+    get_arguments: Callable[..., dict],
+    plan: Iterable[tuple]
+) -> tuple[list[NotificationEmail], list[tuple[User, AllocationRequest, Exception]]]:
+    """Render notifications for multiple users and allocation requests in a single batch.
+
+    Args:
+        template: The name of the template file to render.
+        get_arguments: Function returning the rendering arguments for each entry in the plan.
+        plan: Tuples of arguments for `get_arguments`, starting with a user and allocation request.
+
+    Returns:
+        The rendered notifications and a list of failed users and requests paired with the raised error.
+    """
+
+    notifications, failures = render_notification_batch(
+        template, (get_arguments(*arguments) for arguments in plan)
+    )
+
+    return notifications, [(kwargs['user'], kwargs['context']['request'], error) for kwargs, error in failures]
+
+
+def build_notifications_upcoming_expiration(
+    plan: Iterable[tuple[User, AllocationRequest, int]]
+) -> tuple[list[NotificationEmail], list[tuple[User, AllocationRequest, Exception]]]:
+    """Render notifications alerting users their allocation requests will expire soon.
+
+    Args:
+        plan: Users paired with the allocation request to notify them about and the expiration threshold reached.
+
+    Returns:
+        The rendered notifications and a list of failed users and requests paired with the raised error.
+    """
+
+    return _build_notification_batch(UPCOMING_EXPIRATION_TEMPLATE, get_upcoming_expiration_arguments, plan)
+
+
+def build_notifications_past_expiration(
+    plan: Iterable[tuple[User, AllocationRequest]]
+) -> tuple[list[NotificationEmail], list[tuple[User, AllocationRequest, Exception]]]:
+    """Render notifications alerting users their allocation requests have expired.
+
+    Args:
+        plan: Users paired with the allocation request to notify them about.
+
+    Returns:
+        The rendered notifications and a list of failed users and requests paired with the raised error.
+    """
+
+    return _build_notification_batch(PAST_EXPIRATION_TEMPLATE, get_past_expiration_arguments, plan)
@@ -0,0 +1,69 @@
+"""Signal handlers for reacting to changes in application data.
+
+Signal handlers are connected to database model events (e.g., saves and
+deletes) and are used to trigger side effects without coupling the
+responsible logic to the models themselves.
+"""
+
+from datetime import date
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.users.models import ResearchGroup
+from .models import Allocation, AllocationRequest, Cluster, PendingLimitUpdate
+
+__all__ = ['mark_limits_pending', 'on_allocation_change', 'on_allocation_request_change']
+
+
+def mark_limits_pending(group_id: int, cluster_ids: list[int], active: date | None = None) -> None:
+    """Queue Slurm limits for recalculation once the current transaction commits.
+
+    Limits are queued for immediate recalculation. If an activation date
+    in the future is provided, an additional recalculation is queued for
+    when the allocation becomes active.
+
+    Args:
+        group_id: Primary key of the research group owning the Slurm account.
+        cluster_ids: Primary keys of the clusters to recalculate limits on.
+        active: The activation date of the modified allocations.
+    """
+
+    due_dates = {date.today()}
+    if active and active > date.today():
+        due_dates.add(active)
+
+    def enqueue() -> None:
+        # Related records may have been deleted by the committed transaction
+        if not ResearchGroup.objects.filter(pk=group_id).exists():
+            return
+
+        PendingLimitUpdate.objects.bulk_create(
+            [
+                PendingLimitUpdate(group_id=group_id, cluster_id=cluster_id, due=due)
+                for cluster_id in Cluster.objects.filter(pk__in=cluster_ids).values_list('pk', flat=True)
+                for due in due_dates
+            ],
+            ignore_conflicts=True
+        )
+
+    transaction.on_commit(enqueue)
+
+
+@receiver([post_save, post_delete], sender=Allocation)
+def on_allocation_change(sender: type[Allocation], instance: Allocation, **kwargs) -> None:
+    """Queue limit recalculations when an allocation is created, modified, or deleted."""
+
+    request = AllocationRequest.objects.filter(pk=instance.request_id).values('group_id', 'active').first()
+    if request:
+        mark_limits_pending(request['group_id'], [instance.cluster_id], request['active'])
+
+
+@receiver([post_save, post_delete], sender=AllocationRequest)
+def on_allocation_request_change(sender: type[AllocationRequest], instance: AllocationRequest, **kwargs) -> None:
+    """Queue limit recalculations on all affected clusters when an allocation request is modified or deleted."""
+
+    cluster_ids = list(Allocation.objects.filter(request_id=instance.pk).values_list('cluster_id', flat=True))
+    if cluster_ids:
+        mark_limits_pending(instance.group_id, cluster_ids, instance.active)
@@ -1,65 +1,399 @@
-"""Background tasks for updating/enforcing slurm usage limits."""
+"""Background tasks for updating/enforcing slurm usage limits.
+
+Limit updates are distributed across Celery workers. The `update_limits` task
+fans out into one subtask per enabled cluster, and each cluster task fans out
+into chunks of Slurm accounts. Once all chunks on a cluster are processed, the
+resulting limits are written to Slurm in a single batched step, after which
+expired allocations are closed out. Tasks are
+passed primary keys and plain data structures so they can be serialized to
+the message broker.
+
+The `update_limits_incremental` task only processes accounts with pending
+changes to their allocation data, or with allocations that have expired but
+not yet been closed. The `update_limits` task acts as a full reconciliation
+and is run less frequently.
+"""
 
 import logging
+import time
+from datetime import date
 
-from celery import shared_task
+from celery import chord, shared_task
+from django.db import transaction
 
 from apps.allocations.models import *
 from apps.users.models import *
 from plugins import slurm
 
-__all__ = ['update_limits', 'update_limit_for_account', 'update_limits_for_cluster']
+__all__ = [
+    'calculate_account_limit',
+    'clear_pending_limit_updates',
+    'get_cluster_accounts',
+    'plan_limits_for_cluster',
+    'summarize_limits_update',
+    'update_limits',
+    'update_limits_incremental',
+    'update_limit_for_account',
+    'update_limits_for_accounts',
+    'update_limits_for_cluster',
+    'write_limits_for_cluster',
+]
 
 log = logging.getLogger(__name__)
 
+# Maximum number of Slurm accounts processed by a single subtask
+ACCOUNTS_PER_TASK = 50
+
 
 @shared_task()
-def update_limits() -> None:
-    """Adjust TRES billing limits for all Slurm accounts on all enabled clusters."""
+def update_limits(dry_run: bool = False) -> list[dict] | None:
+    """Adjust TRES billing limits for all Slurm accounts on all enabled clusters.
+
+    Clusters are processed in parallel by individual subtasks and summarized on completion.
+    When running in dry run mode, the planned changes for each cluster are
+    calculated and returned without modifying Slurm or the application database.
 
-    for cluster in Cluster.objects.filter(enabled=True).all():
-        update_limits_for_cluster(cluster)
+    Args:
+        dry_run: Return the planned changes instead of applying them.
+
+    Returns:
+        A list of plans generated by `plan_limits_for_cluster` when running in dry run mode.
+    """
+
+    clusters = Cluster.objects.filter(enabled=True)
+    if dry_run:
+        return [plan_limits_for_cluster(cluster) for cluster in clusters]
+
+    cluster_ids = clusters.values_list('pk', flat=True)
+    chord(update_limits_for_cluster.s(pk) for pk in cluster_ids)(summarize_limits_update.s())
 
 
 @shared_task()
-def update_limits_for_cluster(cluster: Cluster) -> None:
+def update_limits_incremental() -> None:
+    """Adjust TRES billing limits for Slurm accounts affected by changes since the last run.
+
+    Processes accounts with pending limit updates that have come due and
+    accounts with expired allocations that have not yet been closed out.
+    """
+
+    today = date.today()
+    pending = list(PendingLimitUpdate.objects.filter(due__lte=today).values_list(
+        'pk', 'cluster_id', 'group_id', 'cluster__enabled'
+    ))
+
+    pending_ids = [record[0] for record in pending]
+    pending_pairs = {(cluster_id, group_id) for _, cluster_id, group_id, enabled in pending if enabled}
+
+    expiring_pairs = Allocation.objects.filter(
+        cluster__enabled=True, request__status='AP', final=None, request__expire__lte=today
+    ).values_list('cluster_id', 'request__group_id').distinct()
+
+    accounts_by_cluster = dict()
+    for cluster_id, group_id in pending_pairs.union(expiring_pairs):
+        accounts_by_cluster.setdefault(cluster_id, []).append(group_id)
+
+    # Pending records are only consumed once every cluster is updated so failed runs are retried
+    chord(
+        update_limits_for_cluster.s(cluster_id, sorted(account_ids))
+        for cluster_id, account_ids in accounts_by_cluster.items()
+    )(clear_pending_limit_updates.s(pending_ids) | summarize_limits_update.s())
+
+
+def get_cluster_accounts(cluster: Cluster) -> dict[str, int]:
+    """Return the Keystone research groups corresponding to Slurm accounts on a cluster.
+
+    The Slurm accounts for `root` and any that are missing from Keystone are automatically ignored.
+
+    Args:
+        cluster: Cluster object corresponding to the Slurm cluster.
+
+    Returns:
+        A dictionary mapping Slurm account names to ResearchGroup primary keys.
+    """
+
+    account_names = slurm.get_slurm_account_names(cluster.name) - {'root'}
+
+    accounts = dict(ResearchGroup.objects.filter(name__in=account_names).values_list('name', 'pk'))
+    for account_name in sorted(account_names - accounts.keys()):
+        log.warning(f"No existing ResearchGroup for account {account_name} on {cluster.name}, skipping for now")
+
+    return accounts
+
+
+def plan_limits_for_cluster(cluster: Cluster) -> dict:
+    """Calculate updated TRES billing limits for all Slurm accounts on a cluster without applying them.
+
+    Neither Slurm nor the application database are modified. The returned plan
+    includes the current and updated limit for each account, whether the limit
+    would be written to Slurm, the final usage values that would be assigned to
+    expiring allocations, and the time spent in each phase of the calculation.
+
+    Args:
+        cluster: Cluster object corresponding to the Slurm cluster.
+
+    Returns:
+        A dictionary describing the planned changes.
+    """
+
+    timing = dict()
+
+    start = time.perf_counter()
+    snapshot = slurm.get_cluster_snapshot(cluster.name)
+    account_names = slurm.get_slurm_account_names(cluster.name)
+    timing['slurm'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    accounts = list(ResearchGroup.objects.filter(name__in=account_names - {'root'}).order_by('name'))
+    totals = Allocation.objects.service_unit_totals(cluster, accounts)
+    expiring = Allocation.objects.expiring_allocations_by_account(cluster, accounts)
+    timing['database'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    plan = []
+    for account in accounts:
+        current_limit = snapshot.get_limit(account.name)
+        updated_limit = calculate_account_limit(account, cluster, snapshot, totals[account.pk], expiring[account.pk])
+        plan.append({
+            'account': account.name,
+            'current_limit': current_limit,
+            'updated_limit': updated_limit,
+            'change': updated_limit - current_limit,
+            'changed': slurm.limit_requires_update(snapshot.limit_minutes, account.name, updated_limit),
+            'closing': {allocation.pk: allocation.final for allocation in expiring[account.pk]},
+        })
+
+    timing['calculation'] = time.perf_counter() - start
+
+    return {
+        'cluster': cluster.name,
+        'accounts': plan,
+        'missing_accounts': sorted(account_names - {'root'} - {account.name for account in accounts}),
+        'changed': sum(1 for row in plan if row['changed']),
+        'unchanged': sum(1 for row in plan if not row['changed']),
+        'timing': {phase: round(seconds, 6) for phase, seconds in timing.items()},
+    }
+
+
+@shared_task(bind=True)
+def update_limits_for_cluster(self, cluster_id: int, account_ids: list[int] | None = None) -> dict:
     """Adjust TRES billing limits for all Slurm accounts on a given Slurm cluster.
 
     The Slurm accounts for `root` and any that are missing from Keystone are automatically ignored.
+    Remaining accounts are split into chunks and processed in parallel before being written to Slurm.
+    This task is replaced by the resulting workflow, inheriting the summary returned once limits are written.
+    If there are no accounts to process, the summary is returned directly.
 
     Args:
-        cluster: The name of the Slurm cluster.
+        cluster_id: The primary key of the Slurm cluster.
+        account_ids: Optionally limit updates to the given ResearchGroup primary keys.
+
+    Returns:
+        A dictionary summarizing the changes made on the cluster.
     """
 
-    for account_name in slurm.get_slurm_account_names(cluster.name):
-        if account_name in ['root']:
-            continue
+    cluster = Cluster.objects.get(pk=cluster_id)
+
+    # Fetch limits/usage for all accounts up front instead of querying Slurm once per account
+    snapshot = slurm.get_cluster_snapshot(cluster.name)
+    accounts = get_cluster_accounts(cluster)
+    if account_ids is not None:
+        accounts = {name: pk for name, pk in accounts.items() if pk in account_ids}
 
-        try:
-            account = ResearchGroup.objects.get(name=account_name)
+    account_names = sorted(accounts)
+    header = []
+    for i in range(0, len(account_names), ACCOUNTS_PER_TASK):
+        chunk = account_names[i:i + ACCOUNTS_PER_TASK]
+        header.append(update_limits_for_accounts.s(
+            cluster_id,
+            [accounts[name] for name in chunk],
+            {name: snapshot.get_limit(name) for name in chunk},
+            {name: snapshot.get_usage(name) for name in chunk},
+        ))
 
-        except ResearchGroup.DoesNotExist:
-            log.warning(f"No existing ResearchGroup for account {account_name} on {cluster.name}, skipping for now")
-            continue
+    if not header:
+        return write_limits_for_cluster([], cluster_id, snapshot.limit_minutes)
 
-        update_limit_for_account(account, cluster)
+    # Only write limits that changed, batching accounts with the same limit into a single call
+    return self.replace(chord(header, write_limits_for_cluster.s(cluster_id, snapshot.limit_minutes)))
 
 
 @shared_task()
-def update_limit_for_account(account: ResearchGroup, cluster: Cluster) -> None:
+def update_limits_for_accounts(
+    cluster_id: int,
+    account_ids: list[int],
+    current_limits: dict[str, int],
+    current_usage: dict[str, int]
+) -> dict:
+    """Calculate updated limits and final usage of expired allocations for a chunk of Slurm accounts on a cluster.
+
+    Neither the calculated limits nor the final allocation usage values are saved. Both
+    are returned so they can be applied once every chunk on the cluster is processed.
+
+    Args:
+        cluster_id: The primary key of the Slurm cluster.
+        account_ids: Primary keys of the ResearchGroup objects to process.
+        current_limits: The current Slurm limit in hours for each account.
+        current_usage: The current Slurm usage in hours for each account.
+
+    Returns:
+        A dictionary with the updated limit in hours for each account name (`limits`)
+        and the primary key and final usage of each expired allocation (`closing`).
+    """
+
+    cluster = Cluster.objects.get(pk=cluster_id)
+    snapshot = slurm.ClusterSnapshot(cluster_name=cluster.name, limits=current_limits, usage=current_usage)
+
+    # Load service unit totals and expiring allocations for every account in the chunk up front
+    accounts = ResearchGroup.objects.filter(pk__in=account_ids)
+    totals = Allocation.objects.service_unit_totals(cluster, accounts)
+    expiring = Allocation.objects.expiring_allocations_by_account(cluster, accounts)
+
+    limits = dict()
+    for account in accounts:
+        limits[account.name] = calculate_account_limit(account, cluster, snapshot, totals[account.pk], expiring[account.pk])
+
+    closing = [[allocation.pk, allocation.final] for allocations in expiring.values() for allocation in allocations]
+    return {'limits': limits, 'closing': closing}
+
+
+@shared_task()
+def write_limits_for_cluster(results: list[dict], cluster_id: int, current_limits: dict[str, int]) -> dict:
+    """Write updated account limits to Slurm for a given cluster and close out expired allocations.
+
+    Expired allocations are only closed out once the new limits are written. If writing
+    to Slurm fails, the allocations are left open and recalculated on the next run.
+
+    Args:
+        results: Updated limits and closing allocations returned by each chunk of accounts.
+        cluster_id: The primary key of the Slurm cluster.
+        current_limits: The current Slurm limit in minutes for each account with a billing limit.
+
+    Returns:
+        A dictionary summarizing the changes made on the cluster.
+    """
+
+    cluster = Cluster.objects.get(pk=cluster_id)
+
+    limits = dict()
+    closing = []
+    for result in results:
+        limits.update(result['limits'])
+        closing.extend(Allocation(pk=pk, final=final) for pk, final in result['closing'])
+
+    summary = slurm.set_cluster_limits(cluster.name, limits, current_limits)
+
+    # Close out expired allocations across all accounts using a single bulk update
+    with transaction.atomic():
+        Allocation.objects.bulk_update(closing, ['final'])
+    log.info(f"Updated limits on {cluster.name} for {summary.updated} accounts using {summary.commands} "
+             f"sacctmgr calls ({summary.skipped} accounts unchanged)")
+
+    return {
+        'cluster': cluster.name,
+        'commands': summary.commands,
+        'updated': summary.updated,
+        'skipped': summary.skipped
+    }
+
+
+@shared_task()
+def clear_pending_limit_updates(results: list[dict], pending_ids: list[int]) -> list[dict]:
+    """Delete pending limit updates consumed by a successful incremental update.
+
+    Args:
+        results: Summaries returned for each cluster.
+        pending_ids: Primary keys of the PendingLimitUpdate records that were processed.
+
+    Returns:
+        The cluster summaries, unchanged.
+    """
+
+    PendingLimitUpdate.objects.filter(pk__in=pending_ids).delete()
+    return results
+
+
+@shared_task()
+def summarize_limits_update(results: list[dict]) -> dict:
+    """Log a summary of limit changes across all clusters.
+
+    Args:
+        results: Summaries returned for each cluster.
+
+    Returns:
+        A dictionary summarizing the changes made across all clusters.
+    """
+
+    totals = {
+        'clusters': len(results),
+        'commands': sum(result['commands'] for result in results),
+        'updated': sum(result['updated'] for result in results),
+        'skipped': sum(result['skipped'] for result in results),
+    }
+
+    log.info(f"Updated limits on {totals['clusters']} clusters for {totals['updated']} accounts using "
+             f"{totals['commands']} sacctmgr calls ({totals['skipped']} accounts unchanged)")
+
+    return totals
+
+
+@shared_task()
+def update_limit_for_account(account_id: int, cluster_id: int) -> None:
     """Update the allocation limits for an individual Slurm account and close out any expired allocations.
 
+    Args:
+        account_id: The primary key of the ResearchGroup object for the account.
+        cluster_id: The primary key of the Slurm cluster.
+    """
+
+    account = ResearchGroup.objects.get(pk=account_id)
+    cluster = Cluster.objects.get(pk=cluster_id)
+    snapshot = slurm.ClusterSnapshot(
+        cluster_name=cluster.name,
+        limits={account.name: slurm.get_cluster_limit(account.name, cluster.name)},
+        usage={account.name: slurm.get_cluster_usage(account.name, cluster.name)}
+    )
+
+    totals = Allocation.objects.service_unit_totals(cluster, [account])[account.pk]
+    expiring = list(Allocation.objects.expiring_allocations(account, cluster))
+    updated_limit = calculate_account_limit(account, cluster, snapshot, totals, expiring)
+    slurm.set_cluster_limit(account.name, cluster.name, updated_limit)
+
+    with transaction.atomic():
+        Allocation.objects.bulk_update(expiring, ['final'])
+
+
+def calculate_account_limit(
+    account: ResearchGroup,
+    cluster: Cluster,
+    snapshot: slurm.ClusterSnapshot,
+    totals: dict[str, int],
+    expiring: list[Allocation]
+) -> int:
+    """Close out any expired allocations for a Slurm account and calculate the account's updated usage limit.
+
+    Final usage values are assigned to the given expiring allocations in memory.
+    Neither the allocations nor the returned limit are saved.
+
     Args:
         account: ResearchGroup object for the account.
         cluster: Cluster object corresponding to the Slurm cluster.
+        snapshot: Snapshot of the cluster's current Slurm limits and usage.
+        totals: Service unit totals for the account as returned by `AllocationManager.service_unit_totals`.
+        expiring: The account's expiring allocations ordered by expiration date.
+
+    Returns:
+        The updated TRES billing limit for the account in hours.
     """
 
     # Calculate service units for expired and active allocations
-    closing_sus = Allocation.objects.expiring_service_units(account, cluster)
-    active_sus = Allocation.objects.active_service_units(account, cluster)
+    closing_sus = totals['expiring']
+    active_sus = totals['active']
+
+    # Fetch the current limit and total usage from Slurm
+    current_limit = snapshot.get_limit(account.name)
+    total_usage = snapshot.get_usage(account.name)
 
     # Determine the historical contribution to the current limit
-    current_limit = slurm.get_cluster_limit(account.name, cluster.name)
     historical_usage = current_limit - active_sus - closing_sus
 
     if historical_usage < 0:
@@ -69,7 +403,6 @@ def update_limit_for_account(account: ResearchGroup, cluster: Cluster) -> None:
         historical_usage = 0
 
     # Close expired allocations and determine the current usage
-    total_usage = slurm.get_cluster_usage(account.name, cluster.name)
     current_usage = total_usage - historical_usage
     if current_usage < 0:
         log.warning(f"Negative Current usage found for {account.name} on {cluster.name}:\n"
@@ -77,23 +410,23 @@ def update_limit_for_account(account: ResearchGroup, cluster: Cluster) -> None:
                     f"Setting to historical usage: {historical_usage}...")
         current_usage = historical_usage
 
+    closed_sus = 0
     closing_summary = (f"Summary of closing allocations:\n"
                        f"> Current Usage before closing: {current_usage}\n")
-    for allocation in Allocation.objects.expiring_allocations(account, cluster):
+    for allocation in expiring:
         allocation.final = min(current_usage, allocation.awarded)
         closing_summary += f"> Allocation {allocation.id}: {current_usage} - {allocation.final} -> {current_usage - allocation.final}\n"
         current_usage -= allocation.final
-        allocation.save()
+        closed_sus += allocation.final
     closing_summary += f"> Current Usage after closing: {current_usage}"
 
     # This shouldn't happen but if it does somehow, create a warning so an admin will notice
     if current_usage > active_sus:
         log.warning(f"The current usage is somehow higher than the limit for {account.name}!")
 
-    # Set the new account usage limit using the updated historical usage after closing any expired allocations
-    updated_historical_usage = Allocation.objects.historical_usage(account, cluster)
+    # Calculate the new account usage limit using the updated historical usage after closing any expired allocations
+    updated_historical_usage = totals['historical'] + closed_sus
     updated_limit = updated_historical_usage + active_sus
-    slurm.set_cluster_limit(account.name, cluster.name, updated_limit)
 
     # Log summary of changes during limits update for this Slurm account on this cluster
     log.debug(f"Summary of limits update for {account.name} on {cluster.name}:\n"
@@ -102,3 +435,5 @@ def update_limit_for_account(account: ResearchGroup, cluster: Cluster) -> None:
               f"> {closing_summary}\n"
               f"> historical usage change: {historical_usage} -> {updated_historical_usage}\n"
               f"> limit change: {current_limit} -> {updated_limit}")
+
+    return updated_limit
@@ -1,18 +1,31 @@
-"""Background tasks for issuing user notifications."""
+"""Background tasks for issuing user notifications.
+
+Notification tasks determine which users to notify using planner functions.
+Planners load allocation requests, research group members, notification
+preferences, and previously issued notifications using a fixed number of
+bulk queries and then evaluate notification rules in memory. The
+`should_notify_*` functions apply the same rules to an individual user and
+request. Planned notifications are added to the notification delivery queue
+instead of being sent directly.
+"""
 
 import logging
 from datetime import date, timedelta
+from itertools import chain
 
 from celery import shared_task
+from django.db.models import QuerySet
 
 from apps.allocations.models import AllocationRequest
-from apps.allocations.shortcuts import send_notification_past_expiration, send_notification_upcoming_expiration
-from apps.notifications.models import Notification, Preference
-from apps.users.models import User
+from apps.allocations.shortcuts import build_notifications_past_expiration, build_notifications_upcoming_expiration
+from apps.notifications.models import Notification, Preference, QueuedNotification
+from apps.users.models import GroupMembership, User
 
 __all__ = [
     'notify_past_expirations',
     'notify_upcoming_expirations',
+    'plan_past_expiration_notifications',
+    'plan_upcoming_expiration_notifications',
     'should_notify_past_expiration',
     'should_notify_upcoming_expiration'
 ]
@@ -20,6 +33,68 @@ __all__ = [
 log = logging.getLogger(__name__)
 
 
+def get_sent_notification_sources() -> list[tuple[type, dict]]:
+    """Return the models and filters used to identify previously issued notifications.
+
+    Notifications waiting in the delivery queue are treated as already sent
+    so they are not queued a second time before delivery completes.
+
+    Returns:
+        A list of model classes paired with additional query filters.
+    """
+
+    return [
+        (Notification, {}),
+        (QueuedNotification, {'status': QueuedNotification.StatusChoices.QUEUED}),
+    ]
+
+
+def is_notification_sent(**filters) -> bool:
+    """Return whether a matching notification was already sent or queued for delivery.
+
+    Args:
+        **filters: Query filters identifying the notification.
+
+    Returns:
+        A boolean reflecting whether a matching notification exists.
+    """
+
+    return any(
+        model.objects.filter(**filters, **source_filters).exists()
+        for model, source_filters in get_sent_notification_sources()
+    )
+
+
+def get_request_recipients(requests: QuerySet) -> tuple[dict[int, list[User]], dict[int, Preference]]:
+    """Return the active members of the research groups owning the given allocation requests.
+
+    Notification preferences are returned for every member. Missing
+    preferences are created in bulk using default values.
+
+    Args:
+        requests: The allocation requests to return recipients for.
+
+    Returns:
+        A dictionary mapping research group IDs to active group members (including PIs and admins)
+        and a dictionary mapping user IDs to notification preferences.
+    """
+
+    memberships = GroupMembership.objects.filter(group_id__in=requests.values('group_id'), user__is_active=True)
+
+    recipients = dict()
+    for membership in memberships.select_related('user').order_by('group_id', 'user_id'):
+        recipients.setdefault(membership.group_id, []).append(membership.user)
+
+    preferences = {pref.user_id: pref for pref in Preference.objects.filter(user_id__in=memberships.values('user_id'))}
+    user_ids = {user.id for users in recipients.values() for user in users}
+
+    missing = [Preference(user_id=user_id) for user_id in sorted(user_ids - preferences.keys())]
+    Preference.objects.bulk_create(missing, ignore_conflicts=True)
+    preferences.update((preference.user_id, preference) for preference in missing)
+
+    return recipients, preferences
+
+
 def should_notify_upcoming_expiration(user: User, request: AllocationRequest) -> bool:
     """Determine if a notification should be sent concerning the upcoming expiration of an allocation.
 
@@ -56,41 +131,86 @@ def should_notify_upcoming_expiration(user: User, request: AllocationRequest) ->
         return False
 
     # Check if a notification has already been sent
-    if Notification.objects.filter(
+    if is_notification_sent(
         user=user,
         notification_type=Notification.NotificationType.request_expiring,
-        metadata__request_id=request.id,
-        metadata__days_to_expire__lte=next_threshold
-    ).exists():
+        request=request,
+        expiration_threshold__lte=next_threshold
+    ):
         log.debug(msg_prefix + 'Notification already sent for threshold.')
         return False
 
     return True
 
 
+def plan_upcoming_expiration_notifications() -> list[tuple[User, AllocationRequest, int]]:
+    """Determine which users to notify concerning the upcoming expiration of their allocations.
+
+    Applies the same rules as `should_notify_upcoming_expiration` to all
+    active members of research groups with approved, unexpired allocation
+    requests. Missing notification preferences are created with default values.
+
+    Returns:
+        A list of users paired with the allocation request to notify them about and the expiration threshold reached.
+    """
+
+    today = date.today()
+    requests = AllocationRequest.objects.filter(
+        status=AllocationRequest.StatusChoices.APPROVED,
+        expire__gt=today
+    ).select_related('group').order_by('id')
+
+    recipients, preferences = get_request_recipients(requests)
+
+    # Map each user and request to the smallest threshold a notification was already sent or queued for
+    sent = dict()
+    for user_id, request_id, threshold in chain.from_iterable(
+        model.objects.filter(
+            notification_type=Notification.NotificationType.request_expiring,
+            request_id__in=requests.values('id'),
+            **filters
+        ).values_list('user_id', 'request_id', 'expiration_threshold')
+        for model, filters in get_sent_notification_sources()
+    ):
+        if threshold is not None:
+            sent[user_id, request_id] = min(threshold, sent.get((user_id, request_id), threshold))
+
+    plan = []
+    for request in requests:
+        days_until_expire = request.get_days_until_expire()
+        for user in recipients.get(request.group_id, []):
+            msg_prefix = f'Skipping notification on upcoming expiration for user "{user.username}" on request {request.id}: '
+            next_threshold = preferences[user.id].get_next_expiration_threshold(days_until_expire)
+            if next_threshold is None:
+                log.debug(msg_prefix + 'No notification threshold has been hit yet.')
+
+            elif user.date_joined.date() >= today - timedelta(days=next_threshold):
+                log.debug(msg_prefix + 'User account created after notification threshold.')
+
+            elif sent.get((user.id, request.id), next_threshold + 1) <= next_threshold:
+                log.debug(msg_prefix + 'Notification already sent for threshold.')
+
+            else:
+                plan.append((user, request, next_threshold))
+
+    return plan
+
+
 @shared_task()
 def notify_upcoming_expirations() -> None:
-    """Send a notification to all users with soon-to-expire allocations."""
+    """Queue a notification for all users with soon-to-expire allocations."""
 
-    active_requests = AllocationRequest.objects.filter(
-        status=AllocationRequest.StatusChoices.APPROVED,
-        expire__gt=date.today()
-    ).all()
-
-    failed = False
-    for request in active_requests:
-        for user in request.group.get_all_members().filter(is_active=True):
-            try:
-                if should_notify_upcoming_expiration(user, request):
-                    send_notification_upcoming_expiration(user, request)
-
-            except Exception as error:
-                failed = True
-                log.exception(
-                    f'Error notifying user "{user.username}" on upcoming expiration of request {request.id}: {error}'
-                )
-
-    if failed:
+    notifications, failures = build_notifications_upcoming_expiration(plan_upcoming_expiration_notifications())
+    for user, request, error in failures:
+        log.error(
+            f'Error notifying user "{user.username}" on upcoming expiration of request {request.id}: {error}',
+            exc_info=error
+        )
+
+    log.info(f'Queueing {len(notifications)} notifications on upcoming allocation expirations.')
+    QueuedNotification.objects.queue(notifications)
+
+    if failures:
         raise RuntimeError('Task failed with one or more errors. See logs for details.')
 
 
@@ -109,11 +229,11 @@ def should_notify_past_expiration(user: User, request: AllocationRequest) -> boo
     """
 
     # Check if a notification has already been sent
-    if Notification.objects.filter(
+    if is_notification_sent(
         user=user,
         notification_type=Notification.NotificationType.request_expired,
-        metadata__request_id=request.id,
-    ).exists():
+        request=request,
+    ):
         log.debug(f'Skipping expiration notification for request {request.id} to user {user.username}: Notification already sent.')
         return False
 
@@ -121,29 +241,60 @@ def should_notify_past_expiration(user: User, request: AllocationRequest) -> boo
     return Preference.get_user_preference(user).notify_on_expiration
 
 
-@shared_task()
-def notify_past_expirations() -> None:
-    """Send a notification to all users with expired allocations"""
+def plan_past_expiration_notifications() -> list[tuple[User, AllocationRequest]]:
+    """Determine which users to notify concerning the recent expiration of their allocations.
+
+    Applies the same rules as `should_notify_past_expiration` to all active
+    members of research groups with approved allocation requests that expired
+    within the last three days. Missing notification preferences are created
+    with default values.
 
-    active_requests = AllocationRequest.objects.filter(
+    Returns:
+        A list of users paired with the allocation request to notify them about.
+    """
+
+    requests = AllocationRequest.objects.filter(
         status=AllocationRequest.StatusChoices.APPROVED,
         expire__lte=date.today(),
         expire__gt=date.today() - timedelta(days=3),
-    ).all()
+    ).select_related('group').order_by('id')
+
+    recipients, preferences = get_request_recipients(requests)
 
-    failed = False
-    for request in active_requests:
-        for user in request.group.get_all_members().filter(is_active=True):
+    sent = set(chain.from_iterable(
+        model.objects.filter(
+            notification_type=Notification.NotificationType.request_expired,
+            request_id__in=requests.values('id'),
+            **filters
+        ).values_list('user_id', 'request_id')
+        for model, filters in get_sent_notification_sources()
+    ))
+
+    plan = []
+    for request in requests:
+        for user in recipients.get(request.group_id, []):
+            if (user.id, request.id) in sent:
+                log.debug(f'Skipping expiration notification for request {request.id} to user {user.username}: Notification already sent.')
+
+            elif preferences[user.id].notify_on_expiration:
+                plan.append((user, request))
+
+    return plan
+
+
+@shared_task()
+def notify_past_expirations() -> None:
+    """Queue a notification for all users with expired allocations"""
 
-            try:
-                if should_notify_past_expiration(request, user):
-                    send_notification_past_expiration(user, request)
+    notifications, failures = build_notifications_past_expiration(plan_past_expiration_notifications())
+    for user, request, error in failures:
+        log.error(
+            f'Error notifying user "{user.username}" on the expiration of request {request.id}: {error}',
+            exc_info=error
+        )
 
-            except Exception as error:
-                failed = True
-                log.exception(
-                    f'Error notifying user "{user.username}" on the expiration of request {request.id}: {error}'
-                )
+    log.info(f'Queueing {len(notifications)} notifications on past allocation expirations.')
+    QueuedNotification.objects.queue(notifications)
 
-    if failed:
+    if failures:
         raise RuntimeError('Task failed with one or more errors. See logs for details.')
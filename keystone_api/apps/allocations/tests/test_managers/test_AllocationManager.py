@@ -98,6 +98,13 @@ class GetAllocationData(TestCase):
         expected_allocations = [self.allocation3]
         self.assertQuerySetEqual(expected_allocations, expiring_allocations, ordered=False)
 
+    def test_expiring_allocations_by_account(self) -> None:
+        """Test the `expiring_allocations_by_account` method groups expiring allocations by account."""
+
+        empty_group = ResearchGroup.objects.create(name="Research Group 2", pi=self.user)
+        expiring = Allocation.objects.expiring_allocations_by_account(self.cluster, [self.group, empty_group])
+        self.assertEqual({self.group.pk: [self.allocation3], empty_group.pk: []}, expiring)
+
     def test_active_service_units(self) -> None:
         """Test the `active_service_units` method returns the total awarded service units for active allocations."""
 
@@ -115,3 +122,28 @@ class GetAllocationData(TestCase):
 
         historical_usage = Allocation.objects.historical_usage(self.group, self.cluster)
         self.assertEqual(60, historical_usage)
+
+    def test_service_unit_totals(self) -> None:
+        """Test the `service_unit_totals` method matches the individual service unit calculations."""
+
+        totals = Allocation.objects.service_unit_totals(self.cluster)
+        expected = {
+            'active': Allocation.objects.active_service_units(self.group, self.cluster),
+            'expiring': Allocation.objects.expiring_service_units(self.group, self.cluster),
+            'historical': Allocation.objects.historical_usage(self.group, self.cluster),
+        }
+
+        self.assertEqual({self.group.pk: expected}, totals)
+
+    def test_service_unit_totals_single_query(self) -> None:
+        """Test the `service_unit_totals` method calculates all totals in a single query."""
+
+        with self.assertNumQueries(1):
+            Allocation.objects.service_unit_totals(self.cluster, [self.group])
+
+    def test_service_unit_totals_missing_accounts(self) -> None:
+        """Test the `service_unit_totals` method returns zeros for requested accounts without allocations."""
+
+        empty_group = ResearchGroup.objects.create(name="Research Group 2", pi=self.user)
+        totals = Allocation.objects.service_unit_totals(self.cluster, [empty_group])
+        self.assertEqual({empty_group.pk: {'active': 0, 'expiring': 0, 'historical': 0}}, totals)
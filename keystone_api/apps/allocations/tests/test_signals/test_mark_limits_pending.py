@@ -0,0 +1,71 @@
+"""Unit tests for signal handlers that queue limit recalculations."""
+
+from datetime import date, timedelta
+
+from django.test import TestCase
+
+from apps.allocations.models import *
+from apps.users.models import *
+
+
+class QueueOnAllocationChange(TestCase):
+    """Test pending limit updates are queued when allocation data changes."""
+
+    def setUp(self) -> None:
+        """Create test data."""
+
+        self.user = User.objects.create(username="user", password='foobar123!')
+        self.group = ResearchGroup.objects.create(name="group1", pi=self.user)
+        self.cluster = Cluster.objects.create(name="cluster1")
+        self.request = AllocationRequest.objects.create(group=self.group, status='AP', active=date.today())
+
+    def test_allocation_created(self) -> None:
+        """Test an update is queued when an allocation is created."""
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Allocation.objects.create(requested=100, cluster=self.cluster, request=self.request)
+
+        pending = PendingLimitUpdate.objects.get()
+        self.assertEqual(self.group, pending.group)
+        self.assertEqual(self.cluster, pending.cluster)
+        self.assertEqual(date.today(), pending.due)
+
+    def test_allocation_deleted(self) -> None:
+        """Test an update is queued when an allocation is deleted."""
+
+        allocation = Allocation.objects.create(requested=100, cluster=self.cluster, request=self.request)
+        with self.captureOnCommitCallbacks(execute=True):
+            allocation.delete()
+
+        self.assertTrue(PendingLimitUpdate.objects.filter(group=self.group, cluster=self.cluster).exists())
+
+    def test_request_modified(self) -> None:
+        """Test updates are queued for the request's clusters, including on the future activation date."""
+
+        Allocation.objects.create(requested=100, cluster=self.cluster, request=self.request)
+        activation_date = date.today() + timedelta(days=7)
+
+        self.request.active = activation_date
+        with self.captureOnCommitCallbacks(execute=True):
+            self.request.save()
+
+        due_dates = PendingLimitUpdate.objects.filter(group=self.group, cluster=self.cluster).values_list('due', flat=True)
+        self.assertCountEqual([date.today(), activation_date], due_dates)
+
+    def test_duplicates_ignored(self) -> None:
+        """Test repeated changes do not queue duplicate updates."""
+
+        with self.captureOnCommitCallbacks(execute=True):
+            allocation = Allocation.objects.create(requested=100, cluster=self.cluster, request=self.request)
+            allocation.save()
+
+        self.assertEqual(1, PendingLimitUpdate.objects.count())
+
+    def test_group_deleted(self) -> None:
+        """Test no updates are queued when the research group itself is deleted."""
+
+        Allocation.objects.create(requested=100, cluster=self.cluster, request=self.request)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.group.delete()
+
+        self.assertFalse(PendingLimitUpdate.objects.exists())
@@ -0,0 +1,33 @@
+"""Unit tests for the `clear_pending_limit_updates` task."""
+
+from datetime import date
+
+from django.test import TestCase
+
+from apps.allocations.models import Cluster, PendingLimitUpdate
+from apps.allocations.tasks import clear_pending_limit_updates
+from apps.users.models import ResearchGroup, User
+
+
+class ClearPendingUpdates(TestCase):
+    """Test the removal of consumed pending limit updates."""
+
+    def setUp(self) -> None:
+        """Create test data."""
+
+        user = User.objects.create(username='user', password='foobar123!')
+        cluster = Cluster.objects.create(name='cluster1')
+        self.consumed = PendingLimitUpdate.objects.create(
+            group=ResearchGroup.objects.create(name='group1', pi=user), cluster=cluster, due=date.today()
+        )
+        self.queued = PendingLimitUpdate.objects.create(
+            group=ResearchGroup.objects.create(name='group2', pi=user), cluster=cluster, due=date.today()
+        )
+
+    def test_only_consumed_records_deleted(self) -> None:
+        """Test only the given records are deleted and cluster summaries are passed through."""
+
+        results = [{'cluster': 'cluster1', 'commands': 1, 'updated': 1, 'skipped': 0}]
+
+        self.assertEqual(results, clear_pending_limit_updates(results, [self.consumed.pk]))
+        self.assertQuerySetEqual(PendingLimitUpdate.objects.all(), [self.queued])
@@ -0,0 +1,85 @@
+"""Unit tests for the `plan_limits_for_cluster` function."""
+
+from unittest.mock import Mock, patch
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.allocations.models import *
+from apps.allocations.tasks import plan_limits_for_cluster
+from apps.users.models import *
+from plugins.slurm import ClusterSnapshot
+
+
+@patch('plugins.slurm.subprocess_call')
+@patch('plugins.slurm.get_slurm_account_names', Mock(return_value={'root', 'group1', 'unknown'}))
+@patch('plugins.slurm.get_cluster_snapshot', Mock(return_value=ClusterSnapshot('cluster1', {'group1': 140}, {'group1': 50})))
+class PlanLimits(TestCase):
+    """Test the planning of limit changes without applying them."""
+
+    def setUp(self) -> None:
+        """Create test data."""
+
+        today = timezone.now().date()
+        self.user = User.objects.create(username="user", password='foobar123!')
+        self.group = ResearchGroup.objects.create(name="group1", pi=self.user)
+        self.cluster = Cluster.objects.create(name="cluster1")
+
+        active_request = AllocationRequest.objects.create(
+            group=self.group, status='AP', active=today, expire=today + timezone.timedelta(days=30)
+        )
+        Allocation.objects.create(requested=100, awarded=80, cluster=self.cluster, request=active_request)
+
+        expiring_request = AllocationRequest.objects.create(
+            group=self.group, status='AP', active=today - timezone.timedelta(days=60), expire=today
+        )
+        self.expiring = Allocation.objects.create(requested=100, awarded=60, cluster=self.cluster, request=expiring_request)
+
+    def test_plan_contents(self, mock_call: Mock) -> None:
+        """Test the plan reports current and updated limits for each account."""
+
+        plan = plan_limits_for_cluster(self.cluster)
+
+        self.assertEqual('cluster1', plan['cluster'])
+        self.assertEqual(['unknown'], plan['missing_accounts'])
+        self.assertEqual(1, plan['changed'])
+        self.assertEqual(0, plan['unchanged'])
+        self.assertEqual([{
+            'account': 'group1',
+            'current_limit': 140,
+            'updated_limit': 130,
+            'change': -10,
+            'changed': True,
+            'closing': {self.expiring.pk: 50}
+        }], plan['accounts'])
+        self.assertCountEqual(['slurm', 'database', 'calculation'], plan['timing'])
+
+    def test_no_changes_applied(self, mock_call: Mock) -> None:
+        """Test neither Slurm nor the database are modified."""
+
+        plan_limits_for_cluster(self.cluster)
+
+        mock_call.assert_not_called()
+        self.expiring.refresh_from_db()
+        self.assertIsNone(self.expiring.final)
+
+    def test_changes_compared_in_minutes(self, mock_call: Mock) -> None:
+        """Test accounts are only reported as changed if their limit would be written to Slurm."""
+
+        self.expiring.delete()
+
+        # The account limit matches the updated limit once converted from minutes
+        snapshot = ClusterSnapshot('cluster1', {'group1': 80}, {'group1': 50}, {'group1': 4800})
+        with patch('plugins.slurm.get_cluster_snapshot', Mock(return_value=snapshot)):
+            plan = plan_limits_for_cluster(self.cluster)
+
+        self.assertEqual((0, 1), (plan['changed'], plan['unchanged']))
+
+        # Accounts without a billing limit are always written, even when the updated limit is zero
+        Allocation.objects.all().delete()
+        snapshot = ClusterSnapshot('cluster1', {}, {'group1': 50}, {})
+        with patch('plugins.slurm.get_cluster_snapshot', Mock(return_value=snapshot)):
+            plan = plan_limits_for_cluster(self.cluster)
+
+        self.assertEqual(0, plan['accounts'][0]['change'])
+        self.assertEqual((1, 0), (plan['changed'], plan['unchanged']))
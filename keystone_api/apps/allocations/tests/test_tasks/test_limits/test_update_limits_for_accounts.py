@@ -0,0 +1,75 @@
+"""Unit tests for the `update_limits_for_accounts` task."""
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.allocations.models import *
+from apps.allocations.tasks import update_limits_for_accounts
+from apps.users.models import *
+
+
+class CalculateLimits(TestCase):
+    """Test the calculation of updated limits and the closing of expired allocations."""
+
+    def setUp(self) -> None:
+        """Create test data."""
+
+        today = timezone.now().date()
+        self.user = User.objects.create(username="user", password='foobar123!')
+        self.group = ResearchGroup.objects.create(name="group1", pi=self.user)
+        self.cluster = Cluster.objects.create(name="cluster1")
+
+        # An active allocation
+        active_request = AllocationRequest.objects.create(
+            group=self.group, status='AP', active=today, expire=today + timezone.timedelta(days=30)
+        )
+        Allocation.objects.create(requested=100, awarded=80, cluster=self.cluster, request=active_request)
+
+        # An expired allocation without a final usage value
+        expiring_request = AllocationRequest.objects.create(
+            group=self.group, status='AP', active=today - timezone.timedelta(days=60), expire=today - timezone.timedelta(days=30)
+        )
+        self.expiring = Allocation.objects.create(requested=100, awarded=70, cluster=self.cluster, request=expiring_request)
+
+        # An expired allocation that has already been closed
+        expired_request = AllocationRequest.objects.create(
+            group=self.group, status='AP', active=today - timezone.timedelta(days=90), expire=today - timezone.timedelta(days=60)
+        )
+        Allocation.objects.create(requested=100, awarded=60, final=60, cluster=self.cluster, request=expired_request)
+
+    def test_limits_calculated(self) -> None:
+        """Test the updated limit and final usage of expired allocations are returned without being saved."""
+
+        result = update_limits_for_accounts(
+            self.cluster.pk,
+            [self.group.pk],
+            current_limits={'group1': 210},
+            current_usage={'group1': 110}
+        )
+
+        # Historical usage of 60 leaves 50 units of current usage to charge against the expiring allocation
+        self.assertEqual({'group1': 60 + 50 + 80}, result['limits'])
+        self.assertEqual([[self.expiring.pk, 50]], result['closing'])
+
+        self.expiring.refresh_from_db()
+        self.assertIsNone(self.expiring.final)
+
+    def test_constant_query_count(self) -> None:
+        """Test the number of database queries does not scale with the number of accounts."""
+
+        today = timezone.now().date()
+        account_ids = [self.group.pk]
+        for i in range(2, 6):
+            group = ResearchGroup.objects.create(name=f"group{i}", pi=self.user)
+            request = AllocationRequest.objects.create(group=group, status='AP', expire=today)
+            Allocation.objects.create(requested=100, awarded=70, cluster=self.cluster, request=request)
+            account_ids.append(group.pk)
+
+        limits = {f"group{i}": 70 for i in range(2, 6)} | {'group1': 210}
+        usage = {f"group{i}": 10 for i in range(2, 6)} | {'group1': 110}
+
+        # Cluster, accounts, service unit totals, and expiring allocations
+        with self.assertNumQueries(4):
+            result = update_limits_for_accounts(self.cluster.pk, account_ids, limits, usage)
+
+        self.assertEqual(5, len(result['closing']))
@@ -0,0 +1,80 @@
+"""Unit tests for the `update_limits_for_cluster` task."""
+
+from unittest.mock import Mock, patch
+
+from django.test import TestCase
+
+from apps.allocations.models import Cluster
+from apps.allocations.tasks import update_limits_for_cluster
+from apps.users.models import ResearchGroup, User
+from plugins.slurm import ClusterSnapshot, LimitUpdateSummary
+
+
+@patch('apps.allocations.tasks.limits.ACCOUNTS_PER_TASK', 2)
+@patch('plugins.slurm.get_cluster_snapshot')
+@patch('plugins.slurm.get_slurm_account_names')
+@patch('apps.allocations.tasks.limits.chord')
+class WorkflowConstruction(TestCase):
+    """Test the construction of per-account subtasks for a cluster."""
+
+    def setUp(self) -> None:
+        """Create test data."""
+
+        self.cluster = Cluster.objects.create(name='cluster1')
+        self.user = User.objects.create_user(username='user', password='foobar123!')
+        for name in ('account1', 'account2', 'account3'):
+            ResearchGroup.objects.create(name=name, pi=self.user)
+
+    def run_task(self, mock_chord: Mock) -> tuple[list, Mock]:
+        """Run the task and return the constructed chord header and body."""
+
+        with patch.object(update_limits_for_cluster, 'replace') as mock_replace:
+            update_limits_for_cluster(self.cluster.pk)
+
+        mock_replace.assert_called_once_with(mock_chord.return_value)
+        header, body = mock_chord.call_args.args
+        return header, body
+
+    def test_accounts_split_into_chunks(self, mock_chord: Mock, mock_names: Mock, mock_snapshot: Mock) -> None:
+        """Test accounts are distributed across subtasks according to the chunk size."""
+
+        mock_names.return_value = {'root', 'account1', 'account2', 'account3'}
+        mock_snapshot.return_value = ClusterSnapshot('cluster1', {'account1': 10}, {'account1': 5}, {'account1': 600})
+
+        header, body = self.run_task(mock_chord)
+
+        self.assertEqual(2, len(header))
+        chunk_sizes = [len(signature.args[1]) for signature in header]
+        self.assertEqual([2, 1], chunk_sizes)
+
+        # Subtasks are passed primary keys and plain data structures
+        self.assertEqual(self.cluster.pk, header[0].args[0])
+        self.assertEqual({'account1': 10, 'account2': 0}, header[0].args[2])
+        self.assertEqual({'account1': 5, 'account2': 0}, header[0].args[3])
+        self.assertEqual((self.cluster.pk, {'account1': 600}), body.args)
+
+    def test_missing_accounts_skipped(self, mock_chord: Mock, mock_names: Mock, mock_snapshot: Mock) -> None:
+        """Test Slurm accounts without a matching research group are skipped."""
+
+        mock_names.return_value = {'account1', 'unknown'}
+        mock_snapshot.return_value = ClusterSnapshot('cluster1')
+
+        with self.assertLogs('apps.allocations.tasks', level='WARNING') as log:
+            header, _ = self.run_task(mock_chord)
+
+        self.assertRegex(log.output[-1], '.*No existing ResearchGroup for account unknown.*')
+        self.assertEqual(1, len(header))
+        self.assertEqual(1, len(header[0].args[1]))
+
+    @patch('plugins.slurm.set_cluster_limits')
+    def test_no_accounts(self, mock_set_limits: Mock, mock_chord: Mock, mock_names: Mock, mock_snapshot: Mock) -> None:
+        """Test the summary is returned directly when there are no accounts to process."""
+
+        mock_names.return_value = {'root'}
+        mock_snapshot.return_value = ClusterSnapshot('cluster1')
+        mock_set_limits.return_value = LimitUpdateSummary()
+
+        summary = update_limits_for_cluster(self.cluster.pk)
+
+        mock_chord.assert_not_called()
+        self.assertEqual({'cluster': 'cluster1', 'commands': 0, 'updated': 0, 'skipped': 0}, summary)
@@ -0,0 +1,60 @@
+"""Unit tests for the `update_limits_incremental` task."""
+
+from datetime import date, timedelta
+from unittest.mock import Mock, patch
+
+from django.test import TestCase
+
+from apps.allocations.models import *
+from apps.allocations.tasks import update_limits_incremental
+from apps.users.models import *
+
+
+@patch('apps.allocations.tasks.limits.chord')
+class SelectAccounts(TestCase):
+    """Test the selection of accounts for incremental limit updates."""
+
+    def setUp(self) -> None:
+        """Create test data."""
+
+        self.user = User.objects.create(username="user", password='foobar123!')
+        self.group1 = ResearchGroup.objects.create(name="group1", pi=self.user)
+        self.group2 = ResearchGroup.objects.create(name="group2", pi=self.user)
+        self.group3 = ResearchGroup.objects.create(name="group3", pi=self.user)
+        self.cluster = Cluster.objects.create(name="cluster1")
+        self.disabled_cluster = Cluster.objects.create(name="cluster2", enabled=False)
+
+    def get_scheduled_accounts(self, mock_chord: Mock) -> dict[int, list[int]]:
+        """Run the task and return the account IDs scheduled for each cluster."""
+
+        update_limits_incremental()
+        header = list(mock_chord.call_args.args[0])
+        return {signature.args[0]: signature.args[1] for signature in header}
+
+    def test_due_updates_processed(self, mock_chord: Mock) -> None:
+        """Test pending updates that have come due are processed and consumed once the workflow completes."""
+
+        due = PendingLimitUpdate.objects.create(group=self.group1, cluster=self.cluster, due=date.today())
+        PendingLimitUpdate.objects.create(group=self.group2, cluster=self.cluster, due=date.today() + timedelta(days=1))
+        disabled = PendingLimitUpdate.objects.create(group=self.group3, cluster=self.disabled_cluster, due=date.today())
+
+        scheduled = self.get_scheduled_accounts(mock_chord)
+        self.assertEqual({self.cluster.pk: [self.group1.pk]}, scheduled)
+
+        # Records are kept until the chord callback runs
+        self.assertEqual(3, PendingLimitUpdate.objects.count())
+        callback = mock_chord.return_value.call_args.args[0]
+        self.assertCountEqual([due.pk, disabled.pk], callback.tasks[0].args[0])
+
+    def test_expired_allocations_processed(self, mock_chord: Mock) -> None:
+        """Test accounts with expired allocations that are not yet closed out are processed."""
+
+        expired = AllocationRequest.objects.create(group=self.group2, status='AP', expire=date.today())
+        Allocation.objects.create(requested=100, awarded=100, cluster=self.cluster, request=expired)
+
+        closed = AllocationRequest.objects.create(group=self.group3, status='AP', expire=date.today())
+        Allocation.objects.create(requested=100, awarded=100, final=50, cluster=self.cluster, request=closed)
+        PendingLimitUpdate.objects.all().delete()
+
+        scheduled = self.get_scheduled_accounts(mock_chord)
+        self.assertEqual({self.cluster.pk: [self.group2.pk]}, scheduled)
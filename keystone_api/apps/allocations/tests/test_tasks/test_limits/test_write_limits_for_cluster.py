@@ -0,0 +1,57 @@
+"""Unit tests for the `write_limits_for_cluster` task."""
+
+from datetime import date
+from unittest.mock import Mock, patch
+
+from django.test import TestCase
+
+from apps.allocations.models import Allocation, AllocationRequest, Cluster
+from apps.allocations.tasks import write_limits_for_cluster
+from apps.users.models import ResearchGroup, User
+from plugins.slurm import LimitUpdateSummary
+
+
+@patch('plugins.slurm.set_cluster_limits')
+class WriteMergedLimits(TestCase):
+    """Test limits from each chunk of accounts are written together."""
+
+    def setUp(self) -> None:
+        """Create test data."""
+
+        self.cluster = Cluster.objects.create(name='cluster1')
+        user = User.objects.create(username='user', password='foobar123!')
+        group = ResearchGroup.objects.create(name='account1', pi=user)
+        request = AllocationRequest.objects.create(group=group, status='AP', expire=date.today())
+        self.expiring = Allocation.objects.create(requested=100, awarded=70, cluster=self.cluster, request=request)
+
+        self.results = [
+            {'limits': {'account1': 10}, 'closing': [[self.expiring.pk, 50]]},
+            {'limits': {'account2': 20, 'account3': 20}, 'closing': []},
+        ]
+
+    def test_chunk_results_merged(self, mock_set_limits: Mock) -> None:
+        """Test results from all chunks are merged into a single batched write."""
+
+        mock_set_limits.return_value = LimitUpdateSummary(commands=1, updated=2, skipped=1)
+
+        current_limits = {'account1': 600}
+        summary = write_limits_for_cluster(self.results, self.cluster.pk, current_limits)
+
+        mock_set_limits.assert_called_once_with(
+            'cluster1', {'account1': 10, 'account2': 20, 'account3': 20}, current_limits
+        )
+        self.assertEqual({'cluster': 'cluster1', 'commands': 1, 'updated': 2, 'skipped': 1}, summary)
+
+        self.expiring.refresh_from_db()
+        self.assertEqual(50, self.expiring.final)
+
+    def test_allocations_open_after_failed_write(self, mock_set_limits: Mock) -> None:
+        """Test expired allocations are not closed out if writing to Slurm fails."""
+
+        mock_set_limits.side_effect = RuntimeError('Test error')
+
+        with self.assertRaises(RuntimeError):
+            write_limits_for_cluster(self.results, self.cluster.pk, {})
+
+        self.expiring.refresh_from_db()
+        self.assertIsNone(self.expiring.final)
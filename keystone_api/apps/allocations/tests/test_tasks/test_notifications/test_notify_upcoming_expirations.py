@@ -10,20 +10,22 @@ from apps.allocations.tasks import notify_upcoming_expirations
 class FailureReporting(TestCase):
     """Test the reporting of task failure."""
 
-    @patch('apps.allocations.tasks.should_notify_past_expiration')
-    @patch('apps.allocations.models.AllocationRequest.objects.filter')
-    def test_raises_error_on_failure(self, mock_filter: Mock, mock_should_notify: Mock) -> None:
-        """Test a RuntimeError is raised when one or more notifications fail.
+    @patch('apps.allocations.tasks.notifications.QueuedNotification')
+    @patch('apps.allocations.tasks.notifications.build_notifications_upcoming_expiration')
+    @patch('apps.allocations.tasks.notifications.plan_upcoming_expiration_notifications')
+    def test_raises_error_on_render_failure(self, mock_plan: Mock, mock_build: Mock, mock_queued: Mock) -> None:
+        """Test a RuntimeError is raised when one or more notifications fail to render.
 
         Raising an error on failure is required to ensure Celery tasks
         report the correct status on exit.
         """
 
-        mock_user = MagicMock()
-        mock_request = MagicMock()
-        mock_request.group.get_all_members.return_value.filter.return_value = [mock_user]
-        mock_filter.return_value.all.return_value = [mock_request]
+        notification = MagicMock()
+        mock_build.return_value = ([notification], [(MagicMock(), MagicMock(), Exception("Test error"))])
 
-        mock_should_notify.side_effect = Exception("Test error")
         with self.assertRaisesRegex(RuntimeError, 'Task failed with one or more errors.*'):
-            notify_upcoming_expirations()
+            with self.assertLogs('apps.allocations.tasks', level='ERROR'):
+                notify_upcoming_expirations()
+
+        # Failed notifications should not prevent remaining notifications from being queued
+        mock_queued.objects.queue.assert_called_once_with([notification])
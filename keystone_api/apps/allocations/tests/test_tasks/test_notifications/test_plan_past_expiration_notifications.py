@@ -0,0 +1,76 @@
+"""Unit tests for the `plan_past_expiration_notifications` function."""
+
+from datetime import date, timedelta
+
+from django.test import TestCase
+
+from apps.allocations.models import AllocationRequest
+from apps.allocations.tasks import plan_past_expiration_notifications
+from apps.notifications.models import Notification, Preference, QueuedNotification
+from apps.users.models import ResearchGroup, User
+
+
+class PlanNotifications(TestCase):
+    """Test the selection of users and requests to notify."""
+
+    def setUp(self) -> None:
+        """Create a research group with an allocation request that expired today."""
+
+        self.pi = User.objects.create_user(username='pi', password='foobar123!')
+        self.member = User.objects.create_user(username='member', password='foobar123!')
+        self.group = ResearchGroup.objects.create(name='group', pi=self.pi)
+        self.group.members.add(self.member)
+
+        self.request = AllocationRequest.objects.create(
+            group=self.group,
+            status=AllocationRequest.StatusChoices.APPROVED,
+            expire=date.today()
+        )
+
+    def test_all_members_planned(self) -> None:
+        """Test all group members are notified."""
+
+        plan = plan_past_expiration_notifications()
+        self.assertCountEqual([(self.pi, self.request), (self.member, self.request)], plan)
+
+    def test_old_requests_excluded(self) -> None:
+        """Test users are not notified about requests that expired more than three days ago."""
+
+        self.request.expire = date.today() - timedelta(days=3)
+        self.request.save()
+
+        self.assertEqual([], plan_past_expiration_notifications())
+
+    def test_disabled_in_preferences(self) -> None:
+        """Test users are not notified if expiry notifications are disabled in their preferences."""
+
+        Preference.objects.create(user=self.member, notify_on_expiration=False)
+        self.assertEqual([(self.pi, self.request)], plan_past_expiration_notifications())
+
+    def test_duplicate_notifications_excluded(self) -> None:
+        """Test users are not notified twice for the same request."""
+
+        Notification.objects.create(
+            user=self.member,
+            notification_type=Notification.NotificationType.request_expired,
+            request=self.request
+        )
+
+        self.assertEqual([(self.pi, self.request)], plan_past_expiration_notifications())
+
+    def test_queued_notifications_excluded(self) -> None:
+        """Test users are not notified twice while a notification is waiting in the delivery queue."""
+
+        QueuedNotification.objects.create(
+            user=self.member,
+            notification_type=Notification.NotificationType.request_expired,
+            request=self.request
+        )
+
+        self.assertEqual([(self.pi, self.request)], plan_past_expiration_notifications())
+
+    def test_missing_preferences_created(self) -> None:
+        """Test default preferences are created for users without preferences."""
+
+        plan_past_expiration_notifications()
+        self.assertEqual(2, Preference.objects.filter(user__in=[self.pi, self.member]).count())
@@ -0,0 +1,161 @@
+"""Unit tests for the `plan_upcoming_expiration_notifications` function."""
+
+from datetime import date, datetime, timedelta
+
+from django.test import TestCase
+
+from apps.allocations.models import AllocationRequest
+from apps.allocations.tasks import plan_upcoming_expiration_notifications
+from apps.notifications.models import Notification, Preference, QueuedNotification
+from apps.users.models import ResearchGroup, User
+
+
+class PlanNotifications(TestCase):
+    """Test the selection of users and requests to notify."""
+
+    def setUp(self) -> None:
+        """Create a research group with an allocation request expiring in 15 days."""
+
+        self.pi = User.objects.create_user(username='pi', password='foobar123!', date_joined=datetime(2020, 1, 1))
+        self.member = User.objects.create_user(username='member', password='foobar123!', date_joined=datetime(2020, 1, 1))
+        self.group = ResearchGroup.objects.create(name='group', pi=self.pi)
+        self.group.members.add(self.member)
+
+        self.request = AllocationRequest.objects.create(
+            group=self.group,
+            status=AllocationRequest.StatusChoices.APPROVED,
+            expire=date.today() + timedelta(days=15)
+        )
+
+        Preference.objects.create(user=self.pi, request_expiry_thresholds=[15])
+        Preference.objects.create(user=self.member, request_expiry_thresholds=[15])
+
+    def test_all_members_planned(self) -> None:
+        """Test all group members are notified once a threshold is reached."""
+
+        plan = plan_upcoming_expiration_notifications()
+        self.assertCountEqual([(self.pi, self.request, 15), (self.member, self.request, 15)], plan)
+
+    def test_inactive_users_excluded(self) -> None:
+        """Test inactive users are not notified."""
+
+        self.member.is_active = False
+        self.member.save()
+
+        self.assertEqual([(self.pi, self.request, 15)], plan_upcoming_expiration_notifications())
+
+    def test_unapproved_requests_excluded(self) -> None:
+        """Test users are not notified about requests that are not approved."""
+
+        self.request.status = AllocationRequest.StatusChoices.PENDING
+        self.request.save()
+
+        self.assertEqual([], plan_upcoming_expiration_notifications())
+
+    def test_threshold_not_reached(self) -> None:
+        """Test users are not notified before reaching a notification threshold."""
+
+        Preference.objects.filter(user=self.member).update(request_expiry_thresholds=[5])
+        self.assertEqual([(self.pi, self.request, 15)], plan_upcoming_expiration_notifications())
+
+    def test_recently_joined_users_excluded(self) -> None:
+        """Test users are not notified if their account was created after the notification threshold."""
+
+        self.member.date_joined = datetime.now()
+        self.member.save()
+
+        self.assertEqual([(self.pi, self.request, 15)], plan_upcoming_expiration_notifications())
+
+    def test_duplicate_notifications_excluded(self) -> None:
+        """Test users are not notified twice for the same threshold."""
+
+        Notification.objects.create(
+            user=self.member,
+            notification_type=Notification.NotificationType.request_expiring,
+            request=self.request,
+            expiration_threshold=15
+        )
+
+        self.assertEqual([(self.pi, self.request, 15)], plan_upcoming_expiration_notifications())
+
+    def test_queued_notifications_excluded(self) -> None:
+        """Test users are not notified twice while a notification is waiting in the delivery queue."""
+
+        QueuedNotification.objects.create(
+            user=self.member,
+            notification_type=Notification.NotificationType.request_expiring,
+            request=self.request,
+            expiration_threshold=15
+        )
+
+        self.assertEqual([(self.pi, self.request, 15)], plan_upcoming_expiration_notifications())
+
+    def test_failed_notifications_retried(self) -> None:
+        """Test users are notified again when a queued notification permanently failed to deliver."""
+
+        QueuedNotification.objects.create(
+            user=self.member,
+            notification_type=Notification.NotificationType.request_expiring,
+            request=self.request,
+            expiration_threshold=15,
+            status=QueuedNotification.StatusChoices.FAILED
+        )
+
+        plan = plan_upcoming_expiration_notifications()
+        self.assertCountEqual([(self.pi, self.request, 15), (self.member, self.request, 15)], plan)
+
+    def test_notifications_for_larger_thresholds_ignored(self) -> None:
+        """Test notifications sent for an earlier, larger threshold do not block the current threshold."""
+
+        Preference.objects.filter(user=self.member).update(request_expiry_thresholds=[30, 15])
+        Notification.objects.create(
+            user=self.member,
+            notification_type=Notification.NotificationType.request_expiring,
+            request=self.request,
+            expiration_threshold=30
+        )
+
+        plan = plan_upcoming_expiration_notifications()
+        self.assertCountEqual([(self.pi, self.request, 15), (self.member, self.request, 15)], plan)
+
+    def test_missing_preferences_created(self) -> None:
+        """Test default preferences are created for users without preferences."""
+
+        Preference.objects.filter(user=self.member).delete()
+        plan_upcoming_expiration_notifications()
+        self.assertTrue(Preference.objects.filter(user=self.member).exists())
+
+
+class QueryCount(TestCase):
+    """Test the number of executed database queries."""
+
+    def create_group(self, index: int, members: int) -> None:
+        """Create a research group with an expiring allocation request.
+
+        Args:
+            index: A unique index used to name the group and its users.
+            members: The number of group members to create.
+        """
+
+        users = [
+            User.objects.create(username=f'user{index}-{i}', date_joined=datetime(2020, 1, 1))
+            for i in range(members + 1)
+        ]
+
+        group = ResearchGroup.objects.create(name=f'group{index}', pi=users[0])
+        group.members.add(*users[1:])
+        AllocationRequest.objects.create(
+            group=group,
+            status=AllocationRequest.StatusChoices.APPROVED,
+            expire=date.today() + timedelta(days=10)
+        )
+
+    def test_constant_queries(self) -> None:
+        """Test the number of queries does not depend on the number of requests or users."""
+
+        for i in range(5):
+            self.create_group(i, members=5)
+
+        # Requests, members, preferences, preference creation, sent notifications, and queued notifications
+        with self.assertNumQueries(6):
+            self.assertEqual(30, len(plan_upcoming_expiration_notifications()))
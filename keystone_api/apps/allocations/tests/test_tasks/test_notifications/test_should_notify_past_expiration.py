@@ -7,7 +7,7 @@ from django.test import TestCase
 
 from apps.allocations.models import AllocationRequest
 from apps.allocations.tasks import should_notify_past_expiration
-from apps.notifications.models import Preference
+from apps.notifications.models import Notification, Preference, QueuedNotification
 from apps.users.models import ResearchGroup, User
 
 
@@ -30,6 +30,29 @@ class CheckIfShouldSend(TestCase):
             self.assertFalse(should_notify_past_expiration(self.user, self.request))
             self.assertRegex(log.output[-1], '.*Notification already sent.')
 
+    def test_false_if_notification_queued(self) -> None:
+        """Test the return value is `False` if a notification is waiting in the delivery queue."""
+
+        QueuedNotification.objects.create(
+            user=self.user,
+            notification_type=Notification.NotificationType.request_expired,
+            request=self.request
+        )
+
+        self.assertFalse(should_notify_past_expiration(self.user, self.request))
+
+    def test_true_if_queued_notification_failed(self) -> None:
+        """Test the return value is `True` if a previously queued notification failed to deliver."""
+
+        QueuedNotification.objects.create(
+            user=self.user,
+            notification_type=Notification.NotificationType.request_expired,
+            request=self.request,
+            status=QueuedNotification.StatusChoices.FAILED
+        )
+
+        self.assertTrue(should_notify_past_expiration(self.user, self.request))
+
     def test_false_if_disabled_in_preferences(self) -> None:
         """Test the return value is `False` if expiry notifications are disabled in preferences."""
 
@@ -7,7 +7,7 @@ from django.test import TestCase
 
 from apps.allocations.models import AllocationRequest
 from apps.allocations.tasks import should_notify_upcoming_expiration
-from apps.notifications.models import Preference
+from apps.notifications.models import Notification, Preference, QueuedNotification
 from apps.users.models import ResearchGroup, User
 
 
@@ -70,6 +70,19 @@ class CheckIfShouldSend(TestCase):
             self.assertFalse(should_notify_upcoming_expiration(self.user, self.request))
             self.assertRegex(log.output[-1], '.*Notification already sent for threshold.')
 
+    def test_false_if_notification_queued(self) -> None:
+        """Test the return value is `False` if a notification is waiting in the delivery queue."""
+
+        Preference.objects.create(user=self.user, request_expiry_thresholds=[15])
+        QueuedNotification.objects.create(
+            user=self.user,
+            notification_type=Notification.NotificationType.request_expiring,
+            request=self.request,
+            expiration_threshold=15
+        )
+
+        self.assertFalse(should_notify_upcoming_expiration(self.user, self.request))
+
     def test_true_if_new_notification(self) -> None:
         """Test the return value is `True` if a notification threshold has been hit."""
 
@@ -4,13 +4,14 @@ View objects handle the processing of incoming HTTP requests and return the
 appropriately rendered HTML template or other HTTP response.
 """
 
+from django.db.models import Prefetch
 from rest_framework import permissions, status, viewsets
 from rest_framework.response import Response
 
 from .models import *
 from .permissions import *
 from .serializers import *
-from ..users.models import ResearchGroup
+from ..users.models import ResearchGroup, User
 
 __all__ = [
     'AllocationViewSet',
@@ -23,7 +24,8 @@ __all__ = [
 class AllocationViewSet(viewsets.ModelViewSet):
     """Manage allocations for user research groups."""
 
-    queryset = Allocation.objects.all()
+    # Research group permissions are resolved through the parent request
+    queryset = Allocation.objects.select_related('request__group')
     serializer_class = AllocationSerializer
     permission_classes = [permissions.IsAuthenticated, StaffWriteGroupRead]
 
@@ -34,13 +36,15 @@ class AllocationViewSet(viewsets.ModelViewSet):
             return self.queryset
 
         research_groups = ResearchGroup.objects.groups_for_user(self.request.user)
-        return Allocation.objects.filter(request__group__in=research_groups)
+        return self.queryset.filter(request__group__in=research_groups)
 
 
 class AllocationRequestViewSet(viewsets.ModelViewSet):
     """Manage allocation requests submitted by user research groups."""
 
-    queryset = AllocationRequest.objects.all()
+    queryset = AllocationRequest.objects.select_related('group').prefetch_related(
+        Prefetch('assignees', queryset=User.objects.only('id'))
+    )
     serializer_class = AllocationRequestSerializer
     permission_classes = [permissions.IsAuthenticated, GroupAdminCreateGroupRead]
 
@@ -51,13 +55,14 @@ class AllocationRequestViewSet(viewsets.ModelViewSet):
             return self.queryset
 
         research_groups = ResearchGroup.objects.groups_for_user(self.request.user)
-        return AllocationRequest.objects.filter(group__in=research_groups)
+        return self.queryset.filter(group__in=research_groups)
 
 
 class AllocationRequestReviewViewSet(viewsets.ModelViewSet):
     """Manage reviews of allocation request submitted by administrators."""
 
-    queryset = AllocationRequestReview.objects.all()
+    # Research group permissions are resolved through the parent request
+    queryset = AllocationRequestReview.objects.select_related('request__group')
     serializer_class = AllocationRequestReviewSerializer
     permission_classes = [permissions.IsAuthenticated, StaffWriteGroupRead]
 
@@ -68,7 +73,7 @@ class AllocationRequestReviewViewSet(viewsets.ModelViewSet):
             return self.queryset
 
         research_groups = ResearchGroup.objects.groups_for_user(self.request.user)
-        return AllocationRequestReview.objects.filter(request__group__in=research_groups)
+        return self.queryset.filter(request__group__in=research_groups)
 
     def create(self, request, *args, **kwargs) -> Response:
         """Create a new `AllocationRequestReview` object."""
@@ -0,0 +1,237 @@
+"""In-memory buffers for writing log records to the database in batches.
+
+Buffers collect unsaved model instances in a bounded queue and save them
+from a background thread using bulk inserts. Records are saved synchronously
+until the buffer is started, which allows buffering to be enabled only
+in long-running server processes.
+
+Errors encountered by the buffers are reported using the module logger, which
+is configured in application settings to write to stderr instead of the database.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections, connection, models
+
+__all__ = ['BufferedWriter', 'app_log_buffer', 'request_log_buffer', 'start_log_buffers', 'stop_log_buffers']
+
+log = logging.getLogger(__name__)
+
+# Placeholder used to wake the background thread when the buffer is stopped
+_STOP = object()
+
+
+class BufferedWriter:
+    """Save model instances to the database in batches from a background thread."""
+
+    def __init__(self, batch_size: int = 100, flush_interval: float = 5, max_size: int = 10_000) -> None:
+        """Initialize the buffer.
+
+        Args:
+            batch_size: Maximum number of records to save in a single query.
+            flush_interval: Maximum number of seconds to hold a record before saving it.
+            max_size: Maximum number of records to hold in memory before new records are dropped.
+        """
+
+        self.dropped = 0
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.configure(batch_size, flush_interval, max_size)
+
+    def configure(self, batch_size: int, flush_interval: float, max_size: int) -> None:
+        """Update the buffer settings.
+
+        Args:
+            batch_size: Maximum number of records to save in a single query.
+            flush_interval: Maximum number of seconds to hold a record before saving it.
+            max_size: Maximum number of records to hold in memory before new records are dropped.
+
+        Raises:
+            RuntimeError: If the buffer is running.
+        """
+
+        if self.running:
+            raise RuntimeError('Cannot configure a running buffer')
+
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=max_size)
+
+    @property
+    def running(self) -> bool:
+        """Whether the background thread is running."""
+
+        return self._thread is not None and self._thread.is_alive()
+
+    def put(self, record: models.Model) -> None:
+        """Add a record to the buffer.
+
+        Records are saved immediately if the buffer is not running. Records
+        added to a full buffer are dropped and counted in the `dropped` attribute.
+
+        Args:
+            record: The unsaved model instance to write.
+        """
+
+        if not self.running:
+            record.save()
+            return
+
+        try:
+            self._queue.put_nowait(record)
+
+        except queue.Full:
+            self.dropped += 1
+
+    def start(self) -> None:
+        """Start saving buffered records from a background thread."""
+
+        if self.running:
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='log-buffer', daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the background thread and save any remaining records.
+
+        Args:
+            timeout: Maximum number of seconds to wait for the background thread to exit.
+        """
+
+        if self._thread is None:
+            return
+
+        self._stop_event.set()
+
+        # A full queue already wakes the background thread, in which case the placeholder is not needed
+        try:
+            self._queue.put_nowait(_STOP)
+
+        except queue.Full:
+            pass
+
+        self._thread.join(timeout)
+        self._thread = None
+        atexit.unregister(self.stop)
+        self.flush()
+
+        if self.dropped:
+            log.warning(f'Discarded {self.dropped} records that exceeded the buffer size limit')
+
+    def flush(self) -> int:
+        """Save all currently buffered records from the calling thread.
+
+        Returns:
+            The number of saved records.
+        """
+
+        saved = 0
+        while batch := self._get_batch(timeout=0):
+            saved += self._write(batch)
+
+        return saved
+
+    def _run(self) -> None:
+        """Save batches of records until the buffer is stopped."""
+
+        try:
+            while not self._stop_event.is_set():
+                if batch := self._get_batch(timeout=self.flush_interval):
+                    close_old_connections()
+                    self._write(batch)
+
+        finally:
+            connection.close()
+
+    def _get_batch(self, timeout: float) -> list[models.Model]:
+        """Remove up to `batch_size` records from the queue.
+
+        Args:
+            timeout: Maximum number of seconds to wait for the batch to fill.
+
+        Returns:
+            A list of buffered records.
+        """
+
+        batch = []
+        deadline = time.monotonic() + timeout
+        while len(batch) < self.batch_size:
+            try:
+                remaining = deadline - time.monotonic()
+                record = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+
+            except queue.Empty:
+                break
+
+            if record is _STOP:
+                break
+
+            batch.append(record)
+
+        return batch
+
+    @staticmethod
+    def _write(batch: list[models.Model]) -> int:
+        """Save a batch of records using one bulk insert per model.
+
+        Args:
+            batch: The records to save.
+
+        Returns:
+            The number of saved records.
+        """
+
+        by_model: dict[type[models.Model], list[models.Model]] = {}
+        for record in batch:
+            by_model.setdefault(type(record), []).append(record)
+
+        saved = 0
+        for model, records in by_model.items():
+            try:
+                model.objects.bulk_create(records)
+                saved += len(records)
+
+            except Exception as error:
+                log.error(f'Could not save {len(records)} {model.__name__} records: {error}')
+
+        return saved
+
+
+app_log_buffer = BufferedWriter()
+request_log_buffer = BufferedWriter()
+
+
+def start_log_buffers() -> None:
+    """Configure and start the log buffers using values from application settings.
+
+    Buffering is disabled when the `CONFIG_LOG_BATCH_SIZE` setting is zero.
+    """
+
+    if settings.CONFIG_LOG_BATCH_SIZE <= 0:
+        return
+
+    for buffer in (app_log_buffer, request_log_buffer):
+        if buffer.running:
+            continue
+
+        buffer.configure(
+            settings.CONFIG_LOG_BATCH_SIZE,
+            settings.CONFIG_LOG_FLUSH_INTERVAL,
+            settings.CONFIG_LOG_BUFFER_LIMIT
+        )
+        buffer.start()
+
+
+def stop_log_buffers() -> None:
+    """Stop the log buffers and save any remaining records."""
+
+    for buffer in (app_log_buffer, request_log_buffer):
+        buffer.stop()
@@ -8,7 +8,7 @@ destination and formatting of log messages within the logging framework.
 import logging
 from logging import Handler
 
-__all__ = ['DBHandler']
+__all__ = ['BufferedDBHandler', 'DBHandler']
 
 
 class DBHandler(Handler):
@@ -21,16 +21,48 @@ class DBHandler(Handler):
             record: The log record to save.
         """
 
+        if record.levelno >= self.level:
+            self.create_log(record).save()
+
+    def create_log(self, record: logging.LogRecord) -> 'AppLog':
+        """Create an unsaved database record from a log record.
+
+        Args:
+            record: The log record to convert.
+
+        Returns:
+            An unsaved `AppLog` instance.
+        """
+
         # Models cannot be imported until Django has loaded the app registry
         from .models import AppLog
 
+        return AppLog(
+            name=record.name,
+            level=record.levelname,
+            pathname=record.pathname,
+            lineno=record.lineno,
+            message=self.format(record),
+            func=record.funcName,
+            sinfo=record.stack_info
+        )
+
+
+class BufferedDBHandler(DBHandler):
+    """Logging handler for storing log records in the application database in batches.
+
+    Records are added to an in-memory buffer and saved from a background
+    thread. Records are saved immediately if the buffer is not running.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Add a log record to the buffer of records waiting to be saved.
+
+        Args:
+            record: The log record to save.
+        """
+
+        from .buffers import app_log_buffer
+
         if record.levelno >= self.level:
-            AppLog(
-                name=record.name,
-                level=record.levelname,
-                pathname=record.pathname,
-                lineno=record.lineno,
-                message=self.format(record),
-                func=record.funcName,
-                sinfo=record.stack_info
-            ).save()
+            app_log_buffer.put(self.create_log(record))
@@ -0,0 +1,67 @@
+"""Convert application and request log tables into time-partitioned tables.
+
+Existing log records are moved into a default partition and partitions are
+created for upcoming log records. Once partitioned, expired logs are removed
+by dropping whole partitions. Partitioning is only supported on PostgreSQL.
+
+## Arguments
+
+| Argument    | Description                                                      |
+|-------------|------------------------------------------------------------------|
+| --interval  | The partition interval (`day` or `week`)                         |
+"""
+
+from argparse import ArgumentParser
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.logging import partitions
+from apps.logging.models import AppLog, RequestLog
+from apps.logging.tasks import PARTITIONS_AHEAD
+
+
+class Command(BaseCommand):
+    """Convert application and request log tables into time-partitioned tables."""
+
+    help = __doc__
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        """Add command-line arguments to the parser.
+
+        Args:
+          parser: The argument parser instance.
+        """
+
+        parser.add_argument(
+            '--interval',
+            choices=list(partitions.INTERVALS),
+            default=settings.CONFIG_LOG_PARTITION_INTERVAL or None,
+            help='The partition interval.'
+        )
+
+    def handle(self, *args, **options) -> None:
+        """Handle the command execution.
+
+        Args:
+          *args: Additional positional arguments.
+          **options: Additional keyword arguments.
+        """
+
+        if not partitions.supports_partitioning():
+            raise CommandError('Log partitioning is only supported on PostgreSQL databases.')
+
+        if not options['interval']:
+            raise CommandError('A partition interval is required. Set `CONFIG_LOG_PARTITION_INTERVAL` or use `--interval`.')
+
+        for model in (AppLog, RequestLog):
+            table = model._meta.db_table
+            if partitions.is_partitioned(model):
+                self.stdout.write(f'{table} is already partitioned')
+
+            else:
+                self.stdout.write(f'Partitioning {table}...')
+                partitions.partition_table(model)
+
+            created = partitions.create_partitions(model, options['interval'], PARTITIONS_AHEAD)
+            self.stdout.write(self.style.SUCCESS(f'Created {len(created)} partitions for {table}'))
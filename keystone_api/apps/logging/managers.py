@@ -0,0 +1,84 @@
+"""Custom database managers for encapsulating repeatable table queries.
+
+Manager classes encapsulate common database operations at the table level (as
+opposed to the level of individual records). At least one Manager exists for
+every database model. Managers are commonly exposed as an attribute of the
+associated model class called `objects`.
+"""
+
+from datetime import datetime
+from itertools import groupby
+
+from django.db import connections, models
+from django.db.models import Aggregate, Count, FloatField
+
+__all__ = ['PercentileCont', 'RequestLogManager']
+
+PERCENTILES = {'p50': 0.5, 'p95': 0.95, 'p99': 0.99}
+
+
+class PercentileCont(Aggregate):
+    """Continuous percentile aggregate supported by PostgreSQL."""
+
+    function = 'PERCENTILE_CONT'
+    template = '%(function)s(%(percentile)s) WITHIN GROUP (ORDER BY %(expressions)s)'
+    output_field = FloatField()
+
+    def __init__(self, expression: str, percentile: float, **extra) -> None:
+        super().__init__(expression, percentile=percentile, **extra)
+
+
+def interpolate_percentile(values: list[float], percentile: float) -> float:
+    """Calculate a percentile of sorted values using linear interpolation.
+
+    Matches the behavior of the `PERCENTILE_CONT` function in PostgreSQL.
+
+    Args:
+        values: A non-empty list of values in ascending order.
+        percentile: The percentile to calculate as a fraction between 0 and 1.
+
+    Returns:
+        The interpolated percentile value.
+    """
+
+    position = percentile * (len(values) - 1)
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+class RequestLogManager(models.Manager):
+    """Object manager for the `RequestLog` database model."""
+
+    def latency_percentiles(self, since: datetime) -> list[dict]:
+        """Calculate request latency percentiles for each URL route.
+
+        Percentiles are calculated in the database on PostgreSQL and in
+        Python for other database backends.
+
+        Args:
+            since: Only include requests made after this time.
+
+        Returns:
+            A list of dictionaries with the route, request count, and p50/p95/p99 durations in seconds.
+        """
+
+        logs = self.get_queryset().filter(time__gte=since, duration__isnull=False).exclude(route=None)
+        if connections[self.db].vendor == 'postgresql':
+            return list(
+                logs.values('route')
+                .annotate(count=Count('pk'), **{k: PercentileCont('duration', p) for k, p in PERCENTILES.items()})
+                .order_by('route')
+            )
+
+        results = []
+        rows = logs.order_by('route', 'duration').values_list('route', 'duration').iterator()
+        for route, group in groupby(rows, key=lambda row: row[0]):
+            durations = [duration for _, duration in group]
+            results.append(
+                {'route': route, 'count': len(durations)}
+                | {k: interpolate_percentile(durations, p) for k, p in PERCENTILES.items()}
+            )
+
+        return results
+
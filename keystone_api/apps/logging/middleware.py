@@ -5,19 +5,70 @@ cycle of incoming requests before they reach the application views or become
 an outgoing client response.
 """
 
-from django.http import HttpRequest
+import random
+import re
+import time
+from typing import Any, Callable
 
+from django.conf import settings
+from django.db import connection
+from django.http import HttpRequest, HttpResponse
+
+from .buffers import request_log_buffer
 from .models import RequestLog
 
-__all__ = ['LogRequestMiddleware']
+__all__ = ['LogRequestMiddleware', 'QueryStatistics']
+
+
+class QueryStatistics:
+    """Database execution wrapper for tracking the number and duration of SQL queries."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.time = 0.0
+
+    def __call__(self, execute: Callable, sql: str, params: tuple, many: bool, context: dict) -> Any:
+        """Execute a database query and record its execution time.
+
+        Args:
+            execute: The callable executing the query.
+            sql: The SQL query.
+            params: The query parameters.
+            many: Whether the query is an `executemany` call.
+            context: Additional context about the query execution.
+
+        Returns:
+            The result of the query execution.
+        """
+
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+
+        finally:
+            self.count += 1
+            self.time += time.perf_counter() - start
 
 
 class LogRequestMiddleware:
     """Log metadata from incoming HTTP requests to the database."""
 
+    # Content types with bodies that can be meaningfully stored as text
+    text_content_types = (
+        'text/',
+        'application/json',
+        'application/xml',
+        'application/x-www-form-urlencoded',
+        'application/javascript',
+    )
+
     # __init__ signature required by Django for dependency injection
     def __init__(self, get_response: callable) -> None:
         self.get_response = get_response
+        self.body_limit = settings.CONFIG_REQUEST_BODY_LIMIT
+        self.include = [re.compile(pattern) for pattern in settings.CONFIG_REQUEST_LOG_INCLUDE]
+        self.exclude = [re.compile(pattern) for pattern in settings.CONFIG_REQUEST_LOG_EXCLUDE]
+        self.sample_rates = settings.CONFIG_REQUEST_SAMPLE_RATES
 
     def __call__(self, request: HttpRequest) -> HttpRequest:
         """Execute the middleware on an incoming HTTP request.
@@ -29,22 +80,142 @@ class LogRequestMiddleware:
             The processed request object.
         """
 
-        response = self.get_response(request)
+        queries = QueryStatistics()
+        start = time.perf_counter()
+        with connection.execute_wrapper(queries):
+            response = self.get_response(request)
+
+        duration = time.perf_counter() - start
+        if not self.should_log(request.path, response.status_code):
+            return response
+
         request_log = RequestLog(
             method=request.method,
             endpoint=request.get_full_path(),
             response_code=response.status_code,
-            body_request=request.read().decode(),
-            body_response=response.content.decode(),
-            remote_address=self.get_client_ip(request)
+            body_request=self.get_request_body(request),
+            body_response=self.get_response_body(response),
+            remote_address=self.get_client_ip(request),
+            route=request.resolver_match.route if request.resolver_match else None,
+            duration=duration,
+            query_count=queries.count,
+            query_time=queries.time,
+            response_size=self.get_response_size(response)
         )
 
         if not request.user.is_anonymous:
             request_log.user = request.user
 
-        request_log.save()
+        request_log_buffer.put(request_log)
         return response
 
+    def should_log(self, path: str, status_code: int) -> bool:
+        """Return whether a request should be logged.
+
+        Requests are logged if their path matches an include pattern (when
+        include patterns are configured) and does not match any exclude pattern.
+        Matching requests are then sampled at the rate configured for their
+        response status class (e.g., `2xx`).
+
+        Args:
+            path: The requested URL path.
+            status_code: The response status code.
+
+        Returns:
+            A boolean indicating whether to log the request.
+        """
+
+        if self.include and not any(pattern.search(path) for pattern in self.include):
+            return False
+
+        if any(pattern.search(path) for pattern in self.exclude):
+            return False
+
+        rate = self.sample_rates.get(f'{status_code // 100}xx', 1)
+        return rate >= 1 or random.random() < rate
+
+    def get_request_body(self, request: HttpRequest) -> str:
+        """Return the loggable body of an incoming request.
+
+        Args:
+            request: The incoming HTTP request.
+
+        Returns:
+            The decoded and truncated request body.
+        """
+
+        if not self.is_text(request.content_type):
+            return ''
+
+        return self.decode(request.read(self.body_limit or -1))
+
+    def get_response_body(self, response: HttpResponse) -> str:
+        """Return the loggable body of an outgoing response.
+
+        Streaming and binary responses are not logged.
+
+        Args:
+            response: The outgoing HTTP response.
+
+        Returns:
+            The decoded and truncated response body.
+        """
+
+        if response.streaming or not self.is_text(response.get('Content-Type', '')):
+            return ''
+
+        return self.decode(response.content)
+
+    @staticmethod
+    def get_response_size(response: HttpResponse) -> int | None:
+        """Return the size of an outgoing response body.
+
+        Args:
+            response: The outgoing HTTP response.
+
+        Returns:
+            The response size in bytes, or `None` if the size of a streaming response is unknown.
+        """
+
+        if not response.streaming:
+            return len(response.content)
+
+        if content_length := response.get('Content-Length'):
+            return int(content_length)
+
+        return None
+
+    def is_text(self, content_type: str | None) -> bool:
+        """Return whether a content type represents text data.
+
+        Args:
+            content_type: The value of a `Content-Type` header.
+
+        Returns:
+            A boolean indicating whether the content type is text based.
+        """
+
+        if not content_type:
+            return True
+
+        content_type = content_type.split(';')[0].strip().lower()
+        return content_type.startswith(self.text_content_types) or content_type.endswith(('+json', '+xml'))
+
+    def decode(self, body: bytes) -> str:
+        """Decode a message body, truncating it to the configured size limit.
+
+        Args:
+            body: The raw message body.
+
+        Returns:
+            The decoded message body.
+        """
+
+        if self.body_limit:
+            body = body[:self.body_limit]
+
+        return body.decode(errors='replace')
+
     @staticmethod
     def get_client_ip(request: HttpRequest) -> str:
         """Return the client IP for the incoming request.
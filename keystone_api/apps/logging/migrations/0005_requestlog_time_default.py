@@ -0,0 +1,19 @@
+# Generated by Django 5.1.2 on 2026-10-18 03:46
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('logging', '0004_alter_requestlog_endpoint'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='requestlog',
+            name='time',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.2 on 2026-10-18 03:52
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('logging', '0005_requestlog_time_default'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='applog',
+            name='time',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
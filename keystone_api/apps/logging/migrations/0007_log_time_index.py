@@ -0,0 +1,24 @@
+# Generated by Django 5.1.2 on 2026-10-18 03:56
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('logging', '0006_applog_time_default'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='applog',
+            name='time',
+            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now),
+        ),
+        migrations.AlterField(
+            model_name='requestlog',
+            name='time',
+            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now),
+        ),
+    ]
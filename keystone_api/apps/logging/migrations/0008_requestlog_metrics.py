@@ -0,0 +1,38 @@
+# Generated by Django 5.1.2 on 2026-10-18 03:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('logging', '0007_log_time_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='requestlog',
+            name='duration',
+            field=models.FloatField(null=True),
+        ),
+        migrations.AddField(
+            model_name='requestlog',
+            name='query_count',
+            field=models.PositiveIntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name='requestlog',
+            name='query_time',
+            field=models.FloatField(null=True),
+        ),
+        migrations.AddField(
+            model_name='requestlog',
+            name='response_size',
+            field=models.PositiveIntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name='requestlog',
+            name='route',
+            field=models.CharField(max_length=2048, null=True),
+        ),
+    ]
@@ -8,7 +8,9 @@ the associated table/fields/records are presented by parent interfaces.
 
 import django_celery_results.models
 from django.db import models
+from django.utils import timezone
 
+from apps.logging.managers import RequestLogManager
 from apps.users.models import User
 
 __all__ = ['AppLog', 'RequestLog', 'TaskResult']
@@ -24,7 +26,7 @@ class AppLog(models.Model):
     message = models.TextField()
     func = models.CharField(max_length=80, blank=True, null=True)
     sinfo = models.TextField(blank=True, null=True)
-    time = models.DateTimeField(auto_now_add=True)
+    time = models.DateTimeField(default=timezone.now, db_index=True)  # Set on creation since records may be saved in batches
 
 
 class RequestLog(models.Model):
@@ -36,10 +38,18 @@ class RequestLog(models.Model):
     body_request = models.TextField()
     body_response = models.TextField()
     remote_address = models.CharField(max_length=40, null=True)
-    time = models.DateTimeField(auto_now_add=True)
+    time = models.DateTimeField(default=timezone.now, db_index=True)  # Set on creation since records may be saved in batches
+
+    route = models.CharField(max_length=2048, null=True)  # URL pattern matched by the request
+    duration = models.FloatField(null=True)  # Seconds
+    query_count = models.PositiveIntegerField(null=True)
+    query_time = models.FloatField(null=True)  # Seconds
+    response_size = models.PositiveIntegerField(null=True)  # Bytes
 
     user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True)
 
+    objects = RequestLogManager()
+
 
 class TaskResult(django_celery_results.models.TaskResult):
     """Proxy model for the Celery task result backend."""
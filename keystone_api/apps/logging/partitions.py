@@ -0,0 +1,222 @@
+"""Utilities for managing time-partitioned log tables.
+
+Log tables can optionally be converted into PostgreSQL tables partitioned by
+range on the record creation time. Expired records are then removed by
+dropping whole partitions instead of deleting individual rows. Partitioning
+requires PostgreSQL 13 or newer and is not supported on other database
+backends.
+"""
+
+import re
+from datetime import date, datetime, time, timedelta, timezone
+
+from django.db import connection, models, transaction
+
+__all__ = [
+    'INTERVALS',
+    'create_partitions',
+    'drop_partitions',
+    'get_partitions',
+    'is_partitioned',
+    'partition_bounds',
+    'partition_table',
+    'supports_partitioning',
+]
+
+INTERVALS = {'day': timedelta(days=1), 'week': timedelta(weeks=1)}
+
+# Matches partition bounds as reported by `pg_get_expr`
+_BOUNDS_REGEX = re.compile(r"FROM \('([^']+)'\) TO \('([^']+)'\)")
+
+
+def supports_partitioning() -> bool:
+    """Return whether the database backend supports table partitioning."""
+
+    return connection.vendor == 'postgresql'
+
+
+def partition_bounds(day: date, interval: str) -> tuple[date, date]:
+    """Return the date range of the partition containing a given day.
+
+    Weekly partitions start on Mondays.
+
+    Args:
+        day: The date to locate a partition for.
+        interval: The partition interval (`day` or `week`).
+
+    Returns:
+        The inclusive start and exclusive end date of the partition.
+    """
+
+    if interval == 'week':
+        day -= timedelta(days=day.weekday())
+
+    return day, day + INTERVALS[interval]
+
+
+def is_partitioned(model: type[models.Model]) -> bool:
+    """Return whether the database table of a model is partitioned.
+
+    Args:
+        model: The model to check.
+
+    Returns:
+        A boolean indicating whether the table is partitioned.
+    """
+
+    if not supports_partitioning():
+        return False
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+            "WHERE c.relname = %s AND pg_table_is_visible(c.oid)",
+            [model._meta.db_table]
+        )
+        return cursor.fetchone() is not None
+
+
+def get_partitions(model: type[models.Model]) -> dict[str, tuple[datetime, datetime] | None]:
+    """Return the partitions of a model's database table.
+
+    Args:
+        model: The model to return partitions for.
+
+    Returns:
+        A dictionary mapping partition names to their time range, or `None` for the default partition.
+    """
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid) "
+            "FROM pg_inherits JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = %s AND pg_table_is_visible(parent.oid)",
+            [model._meta.db_table]
+        )
+
+        partitions = dict()
+        for name, bounds in cursor.fetchall():
+            match = _BOUNDS_REGEX.search(bounds)
+            partitions[name] = tuple(datetime.fromisoformat(v) for v in match.groups()) if match else None
+
+        return partitions
+
+
+def partition_table(model: type[models.Model]) -> None:
+    """Convert the database table of a model into a table partitioned by record time.
+
+    Existing records are copied into a default partition. Indexes and foreign
+    key constraints are recreated on the partitioned table and the primary key
+    is extended to include the partition key.
+
+    Args:
+        model: The model to partition. The model must define a `time` field.
+    """
+
+    table = connection.ops.quote_name(model._meta.db_table)
+    legacy = connection.ops.quote_name(f'{model._meta.db_table}_legacy')
+    default = connection.ops.quote_name(f'{model._meta.db_table}_default')
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"ALTER TABLE {table} RENAME TO {legacy}")
+
+        # Collect secondary indexes and foreign keys before the legacy table is dropped
+        cursor.execute(
+            "SELECT indexdef FROM pg_indexes WHERE tablename = %s "
+            "AND indexname NOT IN (SELECT conname FROM pg_constraint WHERE conrelid = %s::regclass)",
+            [f'{model._meta.db_table}_legacy', f'{model._meta.db_table}_legacy']
+        )
+        indexes = [row[0] for row in cursor.fetchall()]
+        cursor.execute(
+            "SELECT pg_get_constraintdef(oid) FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'f'",
+            [f'{model._meta.db_table}_legacy']
+        )
+        foreign_keys = [row[0] for row in cursor.fetchall()]
+
+        cursor.execute(
+            f"CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS INCLUDING IDENTITY INCLUDING CONSTRAINTS) "
+            f"PARTITION BY RANGE (time)"
+        )
+        cursor.execute(f"CREATE TABLE {default} PARTITION OF {table} DEFAULT")
+        cursor.execute(f"INSERT INTO {table} SELECT * FROM {legacy}")
+        cursor.execute(
+            f"SELECT setval(pg_get_serial_sequence(%s, 'id'), COALESCE(MAX(id), 0) + 1, false) FROM {table}",
+            [model._meta.db_table]
+        )
+
+        # Constraint and index names are only released once the legacy table is dropped
+        cursor.execute(f"DROP TABLE {legacy}")
+        cursor.execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id, time)")
+
+        for index in indexes:
+            cursor.execute(index.replace(f'{model._meta.db_table}_legacy', model._meta.db_table))
+
+        for constraint in foreign_keys:
+            cursor.execute(f"ALTER TABLE {table} ADD {constraint}")
+
+
+def create_partitions(model: type[models.Model], interval: str, count: int, today: date | None = None) -> list[str]:
+    """Create partitions covering a number of upcoming intervals.
+
+    Partitions are only created for intervals starting after the current
+    day, since records for the current interval may already be stored in
+    the default partition. Partitions that already exist are left unchanged.
+
+    Args:
+        model: The model with a partitioned database table.
+        interval: The partition interval (`day` or `week`).
+        count: The number of upcoming intervals to create partitions for.
+        today: The current date. Defaults to the current UTC date.
+
+    Returns:
+        The names of the newly created partitions.
+    """
+
+    table = model._meta.db_table
+    existing = get_partitions(model)
+    today = today or datetime.now(timezone.utc).date()
+    lower = partition_bounds(today, interval)[1]
+
+    created = []
+    with connection.cursor() as cursor:
+        for _ in range(count):
+            lower, upper = partition_bounds(lower, interval)
+            name = f'{table}_{lower:%Y%m%d}'
+            if name not in existing:
+                cursor.execute(
+                    f"CREATE TABLE {connection.ops.quote_name(name)} PARTITION OF {connection.ops.quote_name(table)} "
+                    f"FOR VALUES FROM (%s) TO (%s)",
+                    [datetime.combine(lower, time(), timezone.utc), datetime.combine(upper, time(), timezone.utc)]
+                )
+                created.append(name)
+
+            lower = upper
+
+    return created
+
+
+def drop_partitions(model: type[models.Model], before: datetime) -> list[str]:
+    """Detach and drop partitions that only contain records older than a given time.
+
+    Args:
+        model: The model with a partitioned database table.
+        before: Partitions ending at or before this time are dropped.
+
+    Returns:
+        The names of the dropped partitions.
+    """
+
+    table = connection.ops.quote_name(model._meta.db_table)
+
+    dropped = []
+    with connection.cursor() as cursor:
+        for name, bounds in sorted(get_partitions(model).items()):
+            if bounds is None or bounds[1] > before:
+                continue
+
+            cursor.execute(f"ALTER TABLE {table} DETACH PARTITION {connection.ops.quote_name(name)}")
+            cursor.execute(f"DROP TABLE {connection.ops.quote_name(name)}")
+            dropped.append(name)
+
+    return dropped
@@ -5,24 +5,114 @@ asynchronously from the rest of the application and log their results in the
 application database.
 """
 
-from datetime import timedelta
+import logging
+import time
+from datetime import datetime, timedelta
 
 from celery import shared_task
 from django.conf import settings
+from django.db import models, transaction
+from django.db.models import Max, Min
 from django.utils import timezone
 
+from . import partitions
+
+__all__ = ['clear_log_files', 'create_log_partitions', 'delete_expired_records']
+
+log = logging.getLogger(__name__)
+
+# Number of upcoming intervals to create log table partitions for
+PARTITIONS_AHEAD = 7
+
+
+def delete_expired_records(
+    model: type[models.Model],
+    cutoff: datetime,
+    time_field: str = 'time',
+    batch_size: int = 10_000,
+    pause: float = 0
+) -> int:
+    """Delete records created before a given time in batches of primary key ranges.
+
+    Records are deleted using raw SQL without loading them into memory or
+    triggering deletion signals. Each batch is deleted in a separate
+    transaction to avoid holding long-running locks. Partitions of partitioned
+    tables that only contain expired records are dropped as a whole.
+
+    Args:
+        model: The model to delete records from.
+        cutoff: Records created before this time are deleted.
+        time_field: The name of the model field storing the record creation time.
+        batch_size: Size of the primary key range deleted in a single query.
+        pause: Number of seconds to wait between batches.
+
+    Returns:
+        The number of deleted records, excluding records in dropped partitions.
+    """
+
+    if partitions.is_partitioned(model):
+        partitions.drop_partitions(model, cutoff)
+
+    expired = model.objects.filter(**{f'{time_field}__lt': cutoff})
+    bounds = expired.aggregate(first=Min('pk'), last=Max('pk'))
+    if bounds['first'] is None:
+        return 0
+
+    deleted = 0
+    for lower in range(bounds['first'], bounds['last'] + 1, batch_size):
+        with transaction.atomic():
+            deleted += expired.filter(pk__gte=lower, pk__lt=lower + batch_size)._raw_delete(model.objects.db)
+
+        if pause:
+            time.sleep(pause)
+
+    return deleted
+
 
 @shared_task()
-def clear_log_files() -> None:
-    """Delete request and application logs according to retention policies set in application settings."""
+def clear_log_files() -> dict[str, int]:
+    """Delete request logs, application logs, and task results according to retention policies set in application settings.
 
-    from .models import AppLog, RequestLog
-    
-    if settings.CONFIG_LOG_RETENTION > 0:
-        max_app_log_age = timezone.now() - timedelta(seconds=settings.CONFIG_LOG_RETENTION)
-        AppLog.objects.filter(time__lt=max_app_log_age).delete()
+    Returns:
+        The number of deleted records per model.
+    """
+
+    from .models import AppLog, RequestLog, TaskResult
+
+    policies = (
+        (AppLog, 'time', settings.CONFIG_LOG_RETENTION),
+        (RequestLog, 'time', settings.CONFIG_REQUEST_RETENTION),
+        (TaskResult, 'date_done', settings.CONFIG_TASK_RETENTION),
+    )
+
+    deleted = dict()
+    for model, time_field, retention in policies:
+        if retention > 0:
+            deleted[model.__name__] = delete_expired_records(
+                model,
+                timezone.now() - timedelta(seconds=retention),
+                time_field=time_field,
+                batch_size=settings.CONFIG_PURGE_BATCH_SIZE,
+                pause=settings.CONFIG_PURGE_PAUSE
+            )
+
+    log.info('Deleted expired records: %s', ', '.join(f'{name}={count}' for name, count in deleted.items()))
+    return deleted
+
+
+@shared_task()
+def create_log_partitions() -> None:
+    """Create partitions for upcoming log records in partitioned log tables.
+
+    This task does nothing if log partitioning is disabled or the log tables have not been partitioned.
+    """
 
     from .models import AppLog, RequestLog
-    if settings.CONFIG_REQUEST_RETENTION > 0:
-        max_request_log_age = timezone.now() - timedelta(seconds=settings.CONFIG_REQUEST_RETENTION)
-        RequestLog.objects.filter(time__lt=max_request_log_age).delete()
+
+    interval = settings.CONFIG_LOG_PARTITION_INTERVAL
+    if not interval:
+        return
+
+    for model in (AppLog, RequestLog):
+        if partitions.is_partitioned(model):
+            partitions.create_partitions(model, interval, PARTITIONS_AHEAD)
@@ -0,0 +1,127 @@
+"""Unit tests for the `BufferedWriter` class."""
+
+import time
+from unittest.mock import PropertyMock, patch
+
+from django.test import TestCase, TransactionTestCase
+
+from apps.logging.buffers import BufferedWriter
+from apps.logging.models import RequestLog
+
+
+def create_log(endpoint: str = '/hello/') -> RequestLog:
+    """Return an unsaved request log record."""
+
+    return RequestLog(method='GET', endpoint=endpoint, response_code=200, body_request='', body_response='')
+
+
+class SynchronousWrites(TestCase):
+    """Test records are saved immediately when the buffer is not running."""
+
+    def test_record_saved_immediately(self) -> None:
+        """Test records are saved as soon as they are added."""
+
+        writer = BufferedWriter()
+        writer.put(create_log())
+        self.assertEqual(1, RequestLog.objects.count())
+
+
+class BufferedWrites(TransactionTestCase):
+    """Test the saving of records from the background thread."""
+
+    def setUp(self) -> None:
+        """Create a writer with a small batch size."""
+
+        self.writer = BufferedWriter(batch_size=3, flush_interval=0.05, max_size=10)
+
+    def tearDown(self) -> None:
+        """Stop the background thread."""
+
+        self.writer.stop()
+
+    def test_records_saved_in_batches(self) -> None:
+        """Test buffered records are saved using bulk inserts."""
+
+        with (
+            patch.object(BufferedWriter, 'running', new_callable=PropertyMock, return_value=True),
+            patch.object(RequestLog.objects, 'bulk_create', wraps=RequestLog.objects.bulk_create) as bulk_create
+        ):
+            for i in range(7):
+                self.writer.put(create_log(f'/{i}/'))
+
+            self.writer.flush()
+
+        self.assertEqual(7, RequestLog.objects.count())
+        self.assertEqual([3, 3, 1], [len(call.args[0]) for call in bulk_create.call_args_list])
+
+    def test_records_saved_after_interval(self) -> None:
+        """Test the background thread saves records once the flush interval passes."""
+
+        self.writer.start()
+        self.writer.put(create_log())
+
+        deadline = time.monotonic() + 5
+        while not RequestLog.objects.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual(1, RequestLog.objects.count())
+
+    def test_records_saved_on_stop(self) -> None:
+        """Test remaining records are saved when the buffer is stopped."""
+
+        self.writer.flush_interval = 60
+        self.writer.start()
+        self.writer.put(create_log())
+        self.writer.stop()
+
+        self.assertEqual(1, RequestLog.objects.count())
+
+    def test_overflow_dropped(self) -> None:
+        """Test records are dropped and counted when the buffer is full."""
+
+        with patch.object(BufferedWriter, 'running', new_callable=PropertyMock, return_value=True):
+            for _ in range(12):
+                self.writer.put(create_log())
+
+        self.assertEqual(2, self.writer.dropped)
+        self.assertEqual(10, self.writer.flush())
+
+    def test_stop_with_full_buffer(self) -> None:
+        """Test stopping a buffer does not block when the buffer is full."""
+
+        self.writer.start()
+        with patch.object(self.writer, '_write', side_effect=lambda batch: time.sleep(0.1) or len(batch)):
+            for _ in range(20):
+                self.writer.put(create_log())
+
+            with self.assertLogs('apps.logging.buffers', level='WARNING') as log:
+                self.writer.stop(timeout=5)
+
+        self.assertFalse(self.writer.running)
+        self.assertRegex(log.output[-1], 'Discarded [0-9]+ records')
+
+
+class Configuration(TestCase):
+    """Test the configuration of buffer settings."""
+
+    def test_settings_updated(self) -> None:
+        """Test buffer settings are updated when the buffer is not running."""
+
+        writer = BufferedWriter()
+        writer.configure(batch_size=5, flush_interval=1, max_size=2)
+
+        self.assertEqual(5, writer.batch_size)
+        self.assertEqual(1, writer.flush_interval)
+        with patch.object(BufferedWriter, 'running', new_callable=PropertyMock, return_value=True):
+            for _ in range(3):
+                writer.put(create_log())
+
+        self.assertEqual(1, writer.dropped)
+
+    def test_running_buffer_rejected(self) -> None:
+        """Test an error is raised when configuring a running buffer."""
+
+        writer = BufferedWriter()
+        with patch.object(BufferedWriter, 'running', new_callable=PropertyMock, return_value=True):
+            with self.assertRaises(RuntimeError):
+                writer.configure(batch_size=5, flush_interval=1, max_size=2)
@@ -0,0 +1,44 @@
+"""Unit tests for the `BufferedDBHandler` class."""
+
+import logging
+from unittest.mock import PropertyMock, patch
+
+from django.test import TestCase
+
+from apps.logging.buffers import app_log_buffer, BufferedWriter
+from apps.logging.handlers import BufferedDBHandler
+from apps.logging.models import AppLog
+
+
+class EmitToBuffer(TestCase):
+    """Test emitted log data is buffered before being saved to the database."""
+
+    def setUp(self) -> None:
+        """Create a log record and handler."""
+
+        self.handler = BufferedDBHandler(logging.INFO)
+        self.log_record = logging.LogRecord('test', logging.INFO, 'pathname', 1, 'message', (), None, 'func')
+
+    def test_saved_when_buffer_stopped(self) -> None:
+        """Test log data is saved immediately when the buffer is not running."""
+
+        self.handler.emit(self.log_record)
+        self.assertEqual(1, AppLog.objects.count())
+
+    @patch.object(BufferedWriter, 'running', new_callable=PropertyMock, return_value=True)
+    def test_buffered_when_buffer_running(self, _) -> None:
+        """Test log data is held in memory until the buffer is flushed."""
+
+        self.handler.emit(self.log_record)
+        self.assertFalse(AppLog.objects.exists())
+
+        self.assertEqual(1, app_log_buffer.flush())
+        self.assertEqual('message', AppLog.objects.get().message)
+
+    @patch.object(BufferedWriter, 'running', new_callable=PropertyMock, return_value=True)
+    def test_record_below_logging_threshold(self, _) -> None:
+        """Test log data is not buffered when the log message level is below the logging threshold."""
+
+        self.handler.setLevel(logging.ERROR)
+        self.handler.emit(self.log_record)
+        self.assertEqual(0, app_log_buffer.flush())
@@ -0,0 +1,46 @@
+"""Unit tests for the `RequestLogManager` class."""
+
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.logging.models import RequestLog
+
+
+class LatencyPercentiles(TestCase):
+    """Test the calculation of request latency percentiles."""
+
+    def create_log(self, route: str | None, duration: float | None, age: timedelta = timedelta()) -> None:
+        """Create a request log record with the given route and duration."""
+
+        RequestLog.objects.create(
+            endpoint='/', response_code=200, body_request='', body_response='',
+            route=route, duration=duration, time=timezone.now() - age
+        )
+
+    def test_percentiles_per_route(self) -> None:
+        """Test percentiles are calculated separately for each route."""
+
+        for duration in range(1, 12):
+            self.create_log('users/', duration / 10)
+
+        self.create_log('health/', 2)
+
+        results = RequestLog.objects.latency_percentiles(timezone.now() - timedelta(hours=1))
+
+        self.assertEqual(['health/', 'users/'], [result['route'] for result in results])
+        self.assertEqual({'route': 'health/', 'count': 1, 'p50': 2, 'p95': 2, 'p99': 2}, results[0])
+        self.assertEqual(11, results[1]['count'])
+        self.assertAlmostEqual(0.6, results[1]['p50'])
+        self.assertAlmostEqual(1.05, results[1]['p95'])
+        self.assertAlmostEqual(1.09, results[1]['p99'])
+
+    def test_excluded_records(self) -> None:
+        """Test records outside the time window or without metrics are excluded."""
+
+        self.create_log('users/', 1, age=timedelta(hours=2))
+        self.create_log('users/', None)
+        self.create_log(None, 1)
+
+        self.assertEqual([], RequestLog.objects.latency_percentiles(timezone.now() - timedelta(hours=1)))
@@ -2,8 +2,10 @@
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
-from django.http import HttpRequest, HttpResponse
-from django.test import TestCase
+from unittest.mock import patch
+
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+from django.test import override_settings, TestCase
 from django.test.client import RequestFactory
 
 from apps.logging.middleware import LogRequestMiddleware
@@ -67,3 +69,124 @@ class GetClientIP(TestCase):
         request = HttpRequest()
         client_ip = LogRequestMiddleware.get_client_ip(request)
         self.assertIsNone(client_ip)
+
+
+@override_settings(CONFIG_REQUEST_BODY_LIMIT=5)
+class BodyCapture(TestCase):
+    """Test the capture of request and response bodies."""
+
+    def log_request(self, response: HttpResponse, **kwargs) -> RequestLog:
+        """Pass a request through the middleware and return the resulting log record."""
+
+        request = RequestFactory().post('/hello/', **kwargs)
+        request.user = AnonymousUser()
+        LogRequestMiddleware(lambda x: response)(request)
+        return RequestLog.objects.get()
+
+    def test_bodies_truncated(self) -> None:
+        """Test text bodies are truncated to the configured limit."""
+
+        log = self.log_request(HttpResponse('0123456789'), data='abcdefghij', content_type='text/plain')
+        self.assertEqual('abcde', log.body_request)
+        self.assertEqual('01234', log.body_response)
+
+    @override_settings(CONFIG_REQUEST_BODY_LIMIT=0)
+    def test_no_limit(self) -> None:
+        """Test complete bodies are stored when the limit is zero."""
+
+        log = self.log_request(HttpResponse('0123456789'), data='abcdefghij', content_type='text/plain')
+        self.assertEqual('abcdefghij', log.body_request)
+        self.assertEqual('0123456789', log.body_response)
+
+    def test_binary_bodies_skipped(self) -> None:
+        """Test binary bodies are not stored."""
+
+        response = HttpResponse(b'\x00\x01', content_type='application/octet-stream')
+        log = self.log_request(response, data=b'\x00\x01', content_type='image/png')
+        self.assertEqual('', log.body_request)
+        self.assertEqual('', log.body_response)
+
+    def test_streaming_response_skipped(self) -> None:
+        """Test streaming responses are logged without consuming their content."""
+
+        response = StreamingHttpResponse(iter([b'data']), content_type='text/plain')
+        log = self.log_request(response)
+        self.assertEqual('', log.body_response)
+        self.assertEqual(b'data', b''.join(response.streaming_content))
+
+
+class EndpointFiltering(TestCase):
+    """Test the filtering of logged requests by URL path."""
+
+    def log_request(self, path: str) -> None:
+        """Pass a request for the given path through the middleware."""
+
+        request = RequestFactory().get(path)
+        request.user = AnonymousUser()
+        LogRequestMiddleware(lambda x: HttpResponse())(request)
+
+    @override_settings(CONFIG_REQUEST_LOG_EXCLUDE=['^/health/'])
+    def test_excluded_path(self) -> None:
+        """Test requests matching an exclude pattern are not logged."""
+
+        self.log_request('/health/')
+        self.log_request('/hello/')
+        self.assertEqual(['/hello/'], list(RequestLog.objects.values_list('endpoint', flat=True)))
+
+    @override_settings(CONFIG_REQUEST_LOG_INCLUDE=['^/allocations/'], CONFIG_REQUEST_LOG_EXCLUDE=[])
+    def test_included_path(self) -> None:
+        """Test only requests matching an include pattern are logged when include patterns are set."""
+
+        self.log_request('/allocations/requests/')
+        self.log_request('/hello/')
+        self.assertEqual(['/allocations/requests/'], list(RequestLog.objects.values_list('endpoint', flat=True)))
+
+
+class Sampling(TestCase):
+    """Test the sampling of logged requests by response status."""
+
+    def log_request(self, status: int) -> None:
+        """Pass a request returning the given status code through the middleware."""
+
+        request = RequestFactory().get('/hello/')
+        request.user = AnonymousUser()
+        LogRequestMiddleware(lambda x: HttpResponse(status=status))(request)
+
+    @override_settings(CONFIG_REQUEST_SAMPLE_RATES={'2xx': 0.5})
+    @patch('apps.logging.middleware.random.random', side_effect=[0.9, 0.1])
+    def test_sampled_status_class(self, _) -> None:
+        """Test requests are logged according to the sampling rate of their status class."""
+
+        self.log_request(200)
+        self.log_request(200)
+        self.assertEqual(1, RequestLog.objects.count())
+
+    @override_settings(CONFIG_REQUEST_SAMPLE_RATES={'2xx': 0})
+    def test_unlisted_status_class(self) -> None:
+        """Test requests are always logged if their status class has no sampling rate."""
+
+        self.log_request(200)
+        self.log_request(404)
+        self.assertEqual([404], list(RequestLog.objects.values_list('response_code', flat=True)))
+
+
+class RequestMetrics(TestCase):
+    """Test the recording of request performance metrics."""
+
+    def test_metrics_recorded(self) -> None:
+        """Test the request duration, database queries, and response size are logged."""
+
+        def get_response(request: HttpRequest) -> HttpResponse:
+            get_user_model().objects.count()
+            get_user_model().objects.count()
+            return HttpResponse('0123456789')
+
+        request = RequestFactory().get('/hello/')
+        request.user = AnonymousUser()
+        LogRequestMiddleware(get_response)(request)
+
+        log = RequestLog.objects.get()
+        self.assertEqual(2, log.query_count)
+        self.assertEqual(10, log.response_size)
+        self.assertGreaterEqual(log.duration, log.query_time)
+        self.assertGreater(log.query_time, 0)
@@ -0,0 +1,22 @@
+"""Unit tests for the `partition_bounds` function."""
+
+from datetime import date
+
+from django.test import TestCase
+
+from apps.logging.partitions import partition_bounds
+
+
+class PartitionBounds(TestCase):
+    """Test the calculation of partition date ranges."""
+
+    def test_daily_partition(self) -> None:
+        """Test daily partitions span a single day."""
+
+        self.assertEqual((date(2024, 5, 8), date(2024, 5, 9)), partition_bounds(date(2024, 5, 8), 'day'))
+
+    def test_weekly_partition(self) -> None:
+        """Test weekly partitions start on the preceding Monday."""
+
+        self.assertEqual((date(2024, 5, 6), date(2024, 5, 13)), partition_bounds(date(2024, 5, 8), 'week'))
+        self.assertEqual((date(2024, 5, 6), date(2024, 5, 13)), partition_bounds(date(2024, 5, 6), 'week'))
@@ -0,0 +1,37 @@
+"""Unit tests for the `partition_table` function."""
+
+from datetime import date, datetime, timezone
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+
+from apps.logging.models import RequestLog
+from apps.logging.partitions import *
+
+
+@skipUnless(connection.vendor == 'postgresql', 'Partitioning requires PostgreSQL')
+class PartitionTable(TestCase):
+    """Test the conversion of log tables into partitioned tables."""
+
+    def setUp(self) -> None:
+        """Partition the request log table."""
+
+        self.record = RequestLog.objects.create(endpoint='/api', response_code=200, body_request='', body_response='')
+        partition_table(RequestLog)
+
+    def test_records_preserved(self) -> None:
+        """Test existing records are copied into the partitioned table."""
+
+        self.assertTrue(is_partitioned(RequestLog))
+        self.assertEqual([self.record.pk], list(RequestLog.objects.values_list('pk', flat=True)))
+
+    def test_create_and_drop_partitions(self) -> None:
+        """Test partitions are created for upcoming intervals and dropped once expired."""
+
+        created = create_partitions(RequestLog, 'day', 2, today=date(2024, 5, 8))
+        self.assertEqual(['logging_requestlog_20240509', 'logging_requestlog_20240510'], created)
+
+        dropped = drop_partitions(RequestLog, datetime(2024, 5, 10, tzinfo=timezone.utc))
+        self.assertEqual(['logging_requestlog_20240509'], dropped)
+        self.assertNotIn('logging_requestlog_20240509', get_partitions(RequestLog))
@@ -0,0 +1,41 @@
+"""Unit tests for the `delete_expired_records` function."""
+
+from datetime import timedelta
+from unittest.mock import Mock, patch
+
+from django.test import TestCase
+from django.utils.timezone import now
+
+from apps.logging.models import AppLog
+from apps.logging.tasks import delete_expired_records
+
+
+class BatchedDeletion(TestCase):
+    """Test the deletion of expired records in batches."""
+
+    def setUp(self) -> None:
+        """Create three expired records and one current record."""
+
+        self.current_time = now()
+        for age in (10, 9, 8, 0):
+            AppLog.objects.create(
+                name='test', level='INFO', pathname='/test', lineno=1, message='', time=self.current_time - timedelta(days=age)
+            )
+
+    @patch('apps.logging.tasks.time.sleep')
+    def test_expired_records_deleted(self, mock_sleep: Mock) -> None:
+        """Test all expired records are deleted across multiple batches."""
+
+        deleted = delete_expired_records(AppLog, self.current_time - timedelta(days=1), batch_size=2, pause=0.5)
+
+        self.assertEqual(3, deleted)
+        self.assertEqual(1, AppLog.objects.count())
+        self.assertEqual(2, mock_sleep.call_count)
+
+    def test_no_expired_records(self) -> None:
+        """Test nothing is deleted when no records are expired."""
+
+        deleted = delete_expired_records(AppLog, self.current_time - timedelta(days=30))
+
+        self.assertEqual(0, deleted)
+        self.assertEqual(4, AppLog.objects.count())
@@ -6,7 +6,7 @@ from unittest.mock import Mock, patch
 from django.test import override_settings, TestCase
 from django.utils.timezone import now
 
-from apps.logging.models import AppLog, RequestLog
+from apps.logging.models import AppLog, RequestLog, TaskResult
 from apps.logging.tasks import clear_log_files
 
 
@@ -37,8 +37,11 @@ class LogFileDeletion(TestCase):
             time=timestamp
         )
 
+        TaskResult.objects.create(task_id=str(timestamp), date_done=timestamp)
+
     @override_settings(CONFIG_LOG_RETENTION=4)
     @override_settings(CONFIG_REQUEST_RETENTION=4)
+    @override_settings(CONFIG_TASK_RETENTION=4)
     @patch('django.utils.timezone.now')
     def test_log_files_deleted(self, mock_now: Mock) -> None:
         """Test expired log files are deleted."""
@@ -60,16 +63,20 @@ class LogFileDeletion(TestCase):
         # Ensure records exist
         self.assertEqual(2, AppLog.objects.count())
         self.assertEqual(2, RequestLog.objects.count())
+        self.assertEqual(2, TaskResult.objects.count())
 
         # Run rotation
-        clear_log_files()
+        deleted = clear_log_files()
 
         # Assert only the newer records remain
+        self.assertEqual({'AppLog': 1, 'RequestLog': 1, 'TaskResult': 1}, deleted)
         self.assertEqual(1, AppLog.objects.count())
         self.assertEqual(1, RequestLog.objects.count())
+        self.assertEqual(1, TaskResult.objects.count())
 
     @override_settings(CONFIG_LOG_RETENTION=0)
     @override_settings(CONFIG_REQUEST_RETENTION=0)
+    @override_settings(CONFIG_TASK_RETENTION=0)
     def test_deletion_disabled(self) -> None:
         """Test log files are not deleted when log clearing is disabled."""
 
@@ -78,3 +85,4 @@ class LogFileDeletion(TestCase):
         clear_log_files()
         self.assertEqual(1, AppLog.objects.count())
         self.assertEqual(1, RequestLog.objects.count())
+        self.assertEqual(1, TaskResult.objects.count())
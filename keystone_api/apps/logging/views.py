@@ -4,13 +4,24 @@ View objects handle the processing of incoming HTTP requests and return the
 appropriately rendered HTML template or other HTTP response.
 """
 
-from rest_framework import permissions, viewsets
+from datetime import timedelta
+
+from django.utils import timezone
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema, inline_serializer, OpenApiParameter
+from rest_framework import permissions, serializers, viewsets
+from rest_framework.decorators import action
+from rest_framework.request import Request
+from rest_framework.response import Response
 
 from .models import *
 from .serializers import *
 
 __all__ = ['AppLogViewSet', 'RequestLogViewSet', 'TaskResultViewSet']
 
+# Largest time window (in hours) accepted by the request latency endpoint
+MAX_LATENCY_WINDOW_HOURS = 24 * 366
+
 
 class AppLogViewSet(viewsets.ReadOnlyModelViewSet):
     """Returns application log data."""
@@ -27,6 +38,28 @@ class RequestLogViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = RequestLogSerializer
     permission_classes = [permissions.IsAuthenticated, permissions.IsAdminUser]
 
+    @extend_schema(
+        parameters=[OpenApiParameter('hours', OpenApiTypes.INT, description='Size of the time window in hours.')],
+        responses={'200': inline_serializer('request_latency', many=True, fields={
+            'route': serializers.CharField(),
+            'count': serializers.IntegerField(),
+            'p50': serializers.FloatField(),
+            'p95': serializers.FloatField(),
+            'p99': serializers.FloatField(),
+        })}
+    )
+    @action(detail=False, methods=['get'], filter_backends=[], pagination_class=None)
+    def latency(self, request: Request) -> Response:
+        """Return p50/p95/p99 request latencies per URL route over a time window.
+
+        The time window is set in hours using the `hours` query parameter (default 24, maximum one year).
+        """
+
+        hours_field = serializers.IntegerField(min_value=1, max_value=MAX_LATENCY_WINDOW_HOURS)
+        hours = hours_field.run_validation(request.query_params.get('hours', 24))
+        since = timezone.now() - timedelta(hours=hours)
+        return Response(RequestLog.objects.latency_percentiles(since))
+
 
 class TaskResultViewSet(viewsets.ReadOnlyModelViewSet):
     """Returns results from scheduled background tasks."""
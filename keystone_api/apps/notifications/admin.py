@@ -12,11 +12,13 @@ from .models import *
 settings.JAZZMIN_SETTINGS['icons'].update({
     'notifications.Notification': 'fa fa-envelope',
     'notifications.Preference': 'fas fa-mail-bulk',
+    'notifications.QueuedNotification': 'fas fa-paper-plane',
 })
 
 settings.JAZZMIN_SETTINGS['order_with_respect_to'].extend([
     'notifications.Preference',
     'notifications.Notification',
+    'notifications.QueuedNotification',
 ])
 
 
@@ -45,3 +47,22 @@ class PreferenceAdmin(admin.ModelAdmin):
 
     list_display = ('user',)
     search_fields = ('user__username',)
+
+
+@admin.register(QueuedNotification)
+class QueuedNotificationAdmin(admin.ModelAdmin):
+    """Admin interface for notifications waiting in the delivery queue."""
+
+    list_display = ('user', 'notification_type', 'subject', 'status', 'attempts', 'queued', 'sent')
+    list_filter = ('status', 'notification_type', 'queued')
+    search_fields = ('user__username', 'subject', 'error')
+
+    def has_change_permission(self, request, obj=None) -> False:
+        """Disable permissions for modifying records."""
+
+        return False
+
+    def has_add_permission(self, request, obj=None) -> False:
+        """Disable permissions for creating new records."""
+
+        return False
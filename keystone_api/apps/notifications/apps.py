@@ -0,0 +1,23 @@
+"""Application level configuration and setup.
+
+Application configuration objects are used to override Django's default
+application setup.
+"""
+
+from django.apps import AppConfig
+
+__all__ = ['NotificationsAppConfig']
+
+
+class NotificationsAppConfig(AppConfig):
+    """General application configuration and metadata."""
+
+    name = 'apps.notifications'
+
+    def ready(self):
+        """Register application specific Prometheus metrics."""
+
+        from prometheus_client import REGISTRY
+
+        from .metrics import NotificationQueueCollector
+        REGISTRY.register(NotificationQueueCollector())
@@ -0,0 +1,120 @@
+"""Custom database managers for encapsulating repeatable table queries.
+
+Manager classes encapsulate common database operations at the table level (as
+opposed to the level of individual records). At least one Manager exists for
+every database model. Managers are commonly exposed as an attribute of the
+associated model class called `objects`.
+"""
+
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from django.db import transaction
+from django.db.models import Count, Manager, Min
+from django.utils import timezone
+
+from apps.logging.managers import interpolate_percentile
+
+if TYPE_CHECKING:  # pragma: nocover
+    from apps.notifications.models import QueuedNotification
+    from apps.notifications.shortcuts import NotificationEmail
+
+__all__ = ['QueuedNotificationManager']
+
+
+class QueuedNotificationManager(Manager):
+    """Object manager for the `QueuedNotification` database model."""
+
+    def queue(self, notifications: Iterable['NotificationEmail']) -> list['QueuedNotification']:
+        """Queue email notifications for delivery by a background worker.
+
+        Notifications matching the deduplication key of a notification that
+        is already queued or sent are silently skipped.
+
+        Args:
+            notifications: The notifications to queue.
+
+        Returns:
+            The queue records submitted to the database.
+        """
+
+        return self.bulk_create(
+            (
+                self.model(
+                    user=notification.user,
+                    subject=notification.subject,
+                    message=notification.plain_text,
+                    html_message=notification.html_text,
+                    notification_type=notification.notification_type,
+                    metadata=notification.notification_metadata,
+                    **notification.get_dedup_fields()
+                ) for notification in notifications
+            ),
+            ignore_conflicts=True
+        )
+
+    def claim(self, batch_size: int, lease: float) -> list['QueuedNotification']:
+        """Claim a batch of queued notifications that are due for delivery.
+
+        Claimed notifications are leased by moving their next delivery attempt
+        into the future. Rows are only locked by the short transaction that
+        sets the lease, so delivery happens without holding database locks.
+        Rows locked by other transactions are skipped, and leased rows are not
+        claimed again until the lease expires, so concurrent workers claim
+        separate batches. Notifications abandoned by a worker before their
+        delivery outcome is recorded become due again once the lease expires.
+        Row locking is not supported by SQLite.
+
+        Args:
+            batch_size: The maximum number of notifications to claim.
+            lease: Number of seconds before claimed notifications can be claimed again.
+
+        Returns:
+            The claimed notifications, ordered by their original delivery attempt.
+        """
+
+        now = timezone.now()
+        with transaction.atomic():
+            claimed = list(
+                self.get_queryset()
+                .select_for_update(skip_locked=True, of=('self',))
+                .select_related('user')
+                .filter(status=self.model.StatusChoices.QUEUED, next_attempt__lte=now)
+                .order_by('next_attempt')[:batch_size]
+            )
+
+            leased_until = now + timedelta(seconds=lease)
+            self.get_queryset().filter(pk__in=[queued.pk for queued in claimed]).update(next_attempt=leased_until)
+
+        for queued in claimed:
+            queued.next_attempt = leased_until
+
+        return claimed
+
+    def delivery_metrics(self, since: datetime, percentiles: Iterable[float] = (0.5, 0.95, 0.99)) -> dict:
+        """Summarize the current queue state and recent delivery performance.
+
+        Args:
+            since: Only include notifications sent after this time when calculating throughput and latency.
+            percentiles: The queue latency percentiles to calculate as fractions between 0 and 1.
+
+        Returns:
+            A dictionary with the number of records per status, the age in seconds of the oldest
+            queued notification, and the number and queue latency percentiles (in seconds) of
+            recently sent notifications.
+        """
+
+        counts = dict(self.get_queryset().values_list('status').annotate(count=Count('pk')).order_by())
+        oldest = self.get_queryset().filter(status=self.model.StatusChoices.QUEUED).aggregate(oldest=Min('queued'))['oldest']
+        latencies = sorted(
+            (sent - queued).total_seconds()
+            for queued, sent in self.get_queryset().filter(sent__gte=since).values_list('queued', 'sent')
+        )
+
+        return {
+            'counts': {status: counts.get(status, 0) for status in self.model.StatusChoices.values},
+            'oldest_queued_age': (timezone.now() - oldest).total_seconds() if oldest else 0,
+            'sent': len(latencies),
+            'latency': {p: interpolate_percentile(latencies, p) for p in percentiles} if latencies else {},
+        }
@@ -0,0 +1,84 @@
+"""Prometheus metrics describing the notification delivery queue.
+
+Notifications are delivered by Celery workers whose process level metrics
+are not visible to the API server. Delivery metrics are instead calculated
+from the delivery queue in the application database whenever the metrics
+endpoint is scraped.
+"""
+
+import logging
+from datetime import timedelta
+
+from django.db import DatabaseError
+from django.utils import timezone
+from prometheus_client.core import GaugeMetricFamily
+
+from .models import QueuedNotification
+
+__all__ = ['NotificationQueueCollector']
+
+log = logging.getLogger(__name__)
+
+
+class NotificationQueueCollector:
+    """Prometheus collector reporting the notification queue depth, delivery latency, and throughput."""
+
+    # Time window used when calculating delivery latency and throughput
+    window = timedelta(hours=1)
+
+    def describe(self) -> list[GaugeMetricFamily]:
+        """Return the collected metrics without querying the database."""
+
+        return list(self.build_metrics())
+
+    def collect(self) -> list[GaugeMetricFamily]:
+        """Return the current metric values calculated from the delivery queue."""
+
+        try:
+            delivery_metrics = QueuedNotification.objects.delivery_metrics(since=timezone.now() - self.window)
+
+        except DatabaseError as error:
+            log.warning(f'Could not collect notification queue metrics: {error}')
+            return []
+
+        return list(self.build_metrics(delivery_metrics))
+
+    def build_metrics(self, delivery_metrics: dict | None = None) -> tuple[GaugeMetricFamily, ...]:
+        """Build metric families from queue metrics returned by the `QueuedNotification` manager.
+
+        Args:
+            delivery_metrics: The queue metrics, or `None` to build metric families without samples.
+
+        Returns:
+            A tuple of metric families.
+        """
+
+        depth = GaugeMetricFamily(
+            'keystone_notification_queue_depth',
+            'Number of notifications in the delivery queue by status.',
+            labels=['status']
+        )
+        oldest = GaugeMetricFamily(
+            'keystone_notification_queue_oldest_seconds',
+            'Age of the oldest notification waiting for delivery.'
+        )
+        throughput = GaugeMetricFamily(
+            'keystone_notification_throughput_per_minute',
+            'Average number of notifications delivered per minute over the last hour.'
+        )
+        latency = GaugeMetricFamily(
+            'keystone_notification_latency_seconds',
+            'Time between queueing and delivering notifications over the last hour.',
+            labels=['quantile']
+        )
+
+        if delivery_metrics is not None:
+            for status, count in delivery_metrics['counts'].items():
+                depth.add_metric([QueuedNotification.StatusChoices(status).label.lower()], count)
+
+            oldest.add_metric([], delivery_metrics['oldest_queued_age'])
+            throughput.add_metric([], delivery_metrics['sent'] / (self.window.total_seconds() / 60))
+            for percentile, value in delivery_metrics['latency'].items():
+                latency.add_metric([str(percentile)], value)
+
+        return depth, oldest, throughput, latency
@@ -0,0 +1,38 @@
+# Generated by Django 5.1.2 on 2026-10-18 04:28
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0005_remove_preference_allocation_usage_thresholds_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QueuedNotification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('subject', models.TextField()),
+                ('message', models.TextField()),
+                ('html_message', models.TextField()),
+                ('metadata', models.JSONField(null=True)),
+                ('notification_type', models.CharField(choices=[('GM', 'General Message'), ('RE', 'Request Past Expiration'), ('RD', 'Upcoming Request Expiration')], max_length=2)),
+                ('status', models.CharField(choices=[('QU', 'Queued'), ('SN', 'Sent'), ('FL', 'Failed')], default='QU', max_length=2)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('error', models.TextField(blank=True, null=True)),
+                ('queued', models.DateTimeField(auto_now_add=True)),
+                ('next_attempt', models.DateTimeField(default=django.utils.timezone.now)),
+                ('sent', models.DateTimeField(blank=True, null=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'next_attempt'], name='notificatio_status_d11ef9_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,79 @@
+# Generated by Django 5.1.2 on 2026-10-18 04:33
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def populate_dedup_keys(apps, schema_editor) -> None:
+    """Copy deduplication keys from the metadata of existing expiration notifications.
+
+    Only the earliest record for each key is updated. Keys of later
+    duplicates are left empty so the new uniqueness constraints can be added
+    without deleting notification history. Records issued before expiration
+    thresholds were stored in the metadata fall back to the days until
+    expiration, which never exceeds the threshold that triggered them.
+    """
+
+    AllocationRequest = apps.get_model('allocations', 'AllocationRequest')
+    request_ids = set(AllocationRequest.objects.values_list('pk', flat=True))
+
+    for model_name in ('Notification', 'QueuedNotification'):
+        model = apps.get_model('notifications', model_name)
+        records = model.objects.filter(notification_type__in=['RE', 'RD'], metadata__isnull=False).order_by('pk')
+
+        seen, updated = set(), []
+        for record in records.iterator(chunk_size=2000):
+            request_id = record.metadata.get('request_id') if isinstance(record.metadata, dict) else None
+            if request_id not in request_ids:
+                continue
+
+            threshold = None
+            if record.notification_type == 'RE':
+                threshold = record.metadata.get('expiration_threshold', record.metadata.get('days_to_expire'))
+                threshold = threshold if isinstance(threshold, int) else None
+
+            key = (record.user_id, record.notification_type, request_id, threshold)
+            if getattr(record, 'status', 'SN') != 'FL':
+                if key in seen:
+                    continue
+
+                seen.add(key)
+
+            record.request_id, record.expiration_threshold = request_id, threshold
+            updated.append(record)
+
+        model.objects.bulk_update(updated, ['request', 'expiration_threshold'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('allocations', '0008_pendinglimitupdate'),
+        ('notifications', '0006_queuednotification'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='expiration_threshold',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='notification',
+            name='request',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='allocations.allocationrequest'),
+        ),
+        migrations.AddField(
+            model_name='queuednotification',
+            name='expiration_threshold',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='queuednotification',
+            name='request',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='allocations.allocationrequest'),
+        ),
+        migrations.RunPython(populate_dedup_keys, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.1.2 on 2026-10-18 04:33
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0007_notification_dedup_keys'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='notification',
+            constraint=models.UniqueConstraint(condition=models.Q(('notification_type', 'RE')), fields=('user', 'request', 'expiration_threshold'), name='unique_upcoming_expiration_notification'),
+        ),
+        migrations.AddConstraint(
+            model_name='notification',
+            constraint=models.UniqueConstraint(condition=models.Q(('notification_type', 'RD')), fields=('user', 'request'), name='unique_past_expiration_notification'),
+        ),
+        migrations.AddConstraint(
+            model_name='queuednotification',
+            constraint=models.UniqueConstraint(condition=models.Q(('notification_type', 'RE'), ('status__in', ['QU', 'SN'])), fields=('user', 'request', 'expiration_threshold'), name='unique_queued_upcoming_expiration_notification'),
+        ),
+        migrations.AddConstraint(
+            model_name='queuednotification',
+            constraint=models.UniqueConstraint(condition=models.Q(('notification_type', 'RD'), ('status__in', ['QU', 'SN'])), fields=('user', 'request'), name='unique_queued_past_expiration_notification'),
+        ),
+    ]
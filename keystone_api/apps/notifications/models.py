@@ -8,8 +8,11 @@ the associated table/fields/records are presented by parent interfaces.
 
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
-__all__ = ['Notification', 'Preference']
+from .managers import QueuedNotificationManager
+
+__all__ = ['Notification', 'Preference', 'QueuedNotification']
 
 
 def default_expiry_thresholds() -> list[int]:  # pragma: nocover
@@ -38,8 +41,28 @@ class Notification(models.Model):
     metadata = models.JSONField(null=True)
     notification_type = models.CharField(max_length=2, choices=NotificationType.choices)
 
+    # Deduplication keys promoted from the notification metadata
+    request = models.ForeignKey('allocations.AllocationRequest', null=True, blank=True, on_delete=models.SET_NULL, related_name='+')
+    expiration_threshold = models.IntegerField(null=True, blank=True)
+
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
 
+    class Meta:
+        """Database model settings."""
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'request', 'expiration_threshold'],
+                condition=models.Q(notification_type='RE'),
+                name='unique_upcoming_expiration_notification'
+            ),
+            models.UniqueConstraint(
+                fields=['user', 'request'],
+                condition=models.Q(notification_type='RD'),
+                name='unique_past_expiration_notification'
+            ),
+        ]
+
 
 class Preference(models.Model):
     """User notification preferences."""
@@ -97,3 +120,52 @@ class Preference(models.Model):
             filter(lambda x: x <= usage_percentage, self.request_expiry_thresholds),
             default=None
         )
+
+
+class QueuedNotification(models.Model):
+    """Email notification queued for delivery by a background worker."""
+
+    class StatusChoices(models.TextChoices):
+        """Enumerated choices for the `status` field."""
+
+        QUEUED = 'QU', 'Queued'
+        SENT = 'SN', 'Sent'
+        FAILED = 'FL', 'Failed'
+
+    subject = models.TextField()
+    message = models.TextField()
+    html_message = models.TextField()
+    metadata = models.JSONField(null=True)
+    notification_type = models.CharField(max_length=2, choices=Notification.NotificationType.choices)
+    request = models.ForeignKey('allocations.AllocationRequest', null=True, blank=True, on_delete=models.SET_NULL, related_name='+')
+    expiration_threshold = models.IntegerField(null=True, blank=True)
+
+    status = models.CharField(max_length=2, choices=StatusChoices.choices, default=StatusChoices.QUEUED)
+    attempts = models.PositiveIntegerField(default=0)
+    error = models.TextField(null=True, blank=True)
+    queued = models.DateTimeField(auto_now_add=True)
+    next_attempt = models.DateTimeField(default=timezone.now)
+    sent = models.DateTimeField(null=True, blank=True)
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+
+    objects = QueuedNotificationManager()
+
+    class Meta:
+        """Database model settings."""
+
+        indexes = [models.Index(fields=['status', 'next_attempt'])]
+
+        # Failed notifications are excluded so they can be queued again
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'request', 'expiration_threshold'],
+                condition=models.Q(notification_type='RE', status__in=['QU', 'SN']),
+                name='unique_queued_upcoming_expiration_notification'
+            ),
+            models.UniqueConstraint(
+                fields=['user', 'request'],
+                condition=models.Q(notification_type='RD', status__in=['QU', 'SN']),
+                name='unique_queued_past_expiration_notification'
+            ),
+        ]
@@ -0,0 +1,104 @@
+"""Compiled template cache for rendering notification emails.
+
+Notification templates are compiled once per process and reused for every
+recipient. Each HTML template may be paired with a plain text template of
+the same name and a `.txt` extension (e.g., `general.html` and
+`general.txt`) which is rendered without HTML escaping. Templates without
+a plain text counterpart fall back to stripping tags from the rendered HTML.
+"""
+
+from dataclasses import dataclass
+from pathlib import PurePosixPath
+
+import jinja2
+from django.template import engines
+from django.template.exceptions import TemplateDoesNotExist
+from django.utils.html import strip_tags
+
+__all__ = [
+    'NotificationTemplate',
+    'clear_notification_templates',
+    'get_notification_template',
+    'load_notification_templates',
+]
+
+_templates: dict[str, 'NotificationTemplate'] = dict()
+
+
+@dataclass(frozen=True)
+class NotificationTemplate:
+    """Compiled HTML and plain text templates for a single notification email."""
+
+    html: jinja2.Template
+    text: jinja2.Template | None = None
+
+    def render(self, context: dict) -> tuple[str, str]:
+        """Render the HTML and plain text content of the notification.
+
+        Args:
+            context: Variable definitions used to populate the template.
+
+        Returns:
+            The rendered HTML and plain text content.
+        """
+
+        html = self.html.render(context)
+        text = self.text.render(context) if self.text else strip_tags(html)
+        return html, text
+
+
+def get_notification_template(name: str) -> NotificationTemplate:
+    """Return the compiled notification template with the given name.
+
+    Templates are loaded from the `jinja2` template engine and cached for
+    the lifetime of the current process.
+
+    Args:
+        name: The name of the HTML template file.
+
+    Returns:
+        The compiled notification template.
+
+    Raises:
+        TemplateDoesNotExist: If the HTML template cannot be found.
+    """
+
+    if name in _templates:
+        return _templates[name]
+
+    environment = engines['jinja2'].env
+    try:
+        html = environment.get_template(name)
+
+    except jinja2.TemplateNotFound as error:
+        raise TemplateDoesNotExist(name) from error
+
+    text_name = str(PurePosixPath(name).with_suffix('.txt'))
+    try:
+        text = environment.overlay(autoescape=False).get_template(text_name) if text_name != name else None
+
+    except jinja2.TemplateNotFound:
+        text = None
+
+    template = _templates[name] = NotificationTemplate(html, text)
+    return template
+
+
+def load_notification_templates() -> list[str]:
+    """Compile and cache all HTML notification templates available to the `jinja2` template engine.
+
+    Returns:
+        The names of the loaded templates.
+    """
+
+    names = engines['jinja2'].env.list_templates(extensions=['html'])
+    for name in names:
+        get_notification_template(name)
+
+    return names
+
+
+def clear_notification_templates() -> None:
+    """Discard all cached notification templates."""
+
+    _templates.clear()
@@ -4,15 +4,164 @@ Shortcuts are designed to simplify common tasks such as rendering templates,
 redirecting URLs, issuing notifications, and handling HTTP responses.
 """
 
+import time
+from dataclasses import dataclass
+from itertools import islice
+from typing import Callable, Iterable
+
 from django.conf import settings
-from django.core.mail import send_mail
-from django.template.loader import render_to_string
-from django.utils.html import strip_tags
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import IntegrityError, transaction
 
 from apps.notifications.models import Notification
+from apps.notifications.rendering import get_notification_template
 from apps.users.models import User
 
 
+@dataclass
+class NotificationEmail:
+    """An email notification pending delivery to a single user."""
+
+    user: User
+    subject: str
+    plain_text: str
+    html_text: str
+    notification_type: Notification.NotificationType
+    notification_metadata: dict | None = None
+
+    def build_email(self) -> EmailMultiAlternatives:
+        """Return an email message with plain text and HTML alternatives."""
+
+        email = EmailMultiAlternatives(
+            subject=self.subject,
+            body=self.plain_text,
+            from_email=settings.EMAIL_FROM_ADDRESS,
+            to=[self.user.email]
+        )
+
+        email.attach_alternative(self.html_text, 'text/html')
+        return email
+
+    def get_dedup_fields(self) -> dict:
+        """Return the deduplication key values promoted from the notification metadata."""
+
+        metadata = self.notification_metadata or dict()
+        return {
+            'request_id': metadata.get('request_id'),
+            'expiration_threshold': metadata.get('expiration_threshold')
+        }
+
+    def build_record(self) -> Notification:
+        """Return an unsaved database record of the notification."""
+
+        return Notification(
+            user=self.user,
+            subject=self.subject,
+            message=self.plain_text,
+            notification_type=self.notification_type,
+            metadata=self.notification_metadata,
+            **self.get_dedup_fields()
+        )
+
+
+def reserve_notification_record(notification: NotificationEmail) -> Notification | None:
+    """Create the database record of a notification ahead of delivery.
+
+    Creating the record first reserves the notification's deduplication key,
+    preventing the same notification from being delivered twice.
+
+    Args:
+        notification: The notification to record.
+
+    Returns:
+        The created record, or `None` if a notification with the same deduplication key was already recorded.
+    """
+
+    try:
+        with transaction.atomic():
+            record = notification.build_record()
+            record.save()
+            return record
+
+    except IntegrityError:
+        return None
+
+
+def send_notification_batch(
+    notifications: Iterable[NotificationEmail],
+    batch_size: int | None = None,
+    rate_limit: float | None = None,
+    on_result: Callable[[NotificationEmail, Exception | None], None] | None = None
+) -> list[tuple[NotificationEmail, Exception]]:
+    """Deliver multiple email notifications, reusing a single mail server connection per batch.
+
+    A database record is created for each notification before it is sent.
+    Notifications matching the deduplication key of an existing record are
+    skipped without being sent. Records of notifications that fail to
+    deliver are removed and the failed notifications are returned to the
+    caller instead of raising an error.
+
+    Args:
+        notifications: The notifications to deliver.
+        batch_size: Number of emails sent per connection (defaults to application settings).
+        rate_limit: Maximum number of emails sent per second (defaults to application settings, 0 disables the limit).
+        on_result: Optional callback invoked with each notification and its delivery error (`None` if delivered
+            or already recorded) as soon as the delivery attempt completes.
+
+    Returns:
+        A list of undelivered notifications paired with the error raised during delivery.
+    """
+
+    batch_size = batch_size or settings.EMAIL_BATCH_SIZE
+    rate_limit = settings.EMAIL_RATE_LIMIT if rate_limit is None else rate_limit
+    interval = 1 / rate_limit if rate_limit > 0 else 0
+    next_send = time.monotonic()
+    notifications = iter(notifications)
+
+    failures = []
+    while batch := list(islice(notifications, batch_size)):
+        reserved = []
+        for notification in batch:
+            if record := reserve_notification_record(notification):
+                reserved.append((notification, record))
+
+            elif on_result:
+                on_result(notification, None)
+
+        attempted = 0
+        try:
+            with get_connection() as connection:
+                for notification, record in reserved:
+                    attempted += 1
+                    if (delay := next_send - time.monotonic()) > 0:
+                        time.sleep(delay)
+
+                    next_send = max(next_send, time.monotonic()) + interval
+                    try:
+                        if not connection.send_messages([notification.build_email()]):
+                            raise RuntimeError(f'Email to user "{notification.user.username}" was not sent.')
+
+                        error = None
+
+                    except Exception as send_error:
+                        record.delete()
+                        failures.append((notification, send_error))
+                        error = send_error
+
+                    if on_result:
+                        on_result(notification, error)
+
+        # Errors opening the connection prevent delivery of the remaining batch
+        except Exception as error:
+            for notification, record in reserved[attempted:]:
+                record.delete()
+                failures.append((notification, error))
+                if on_result:
+                    on_result(notification, error)
+
+    return failures
+
+
 def send_notification(
     user: User,
     subject: str,
@@ -30,22 +179,88 @@ def send_notification(
         html_text: The HTML version of the email content.
         notification_type: Optionally categorize the notification type.
         notification_metadata: Metadata to store alongside the notification.
+
+    Raises:
+        Exception: Any error raised while delivering the email.
     """
 
-    send_mail(
-        subject=subject,
-        message=plain_text,
-        from_email=settings.EMAIL_FROM_ADDRESS,
-        recipient_list=[user.email],
-        html_message=html_text)
+    notification = NotificationEmail(user, subject, plain_text, html_text, notification_type, notification_metadata)
+    if failures := send_notification_batch([notification]):
+        raise failures[0][1]
 
-    Notification.objects.create(
-        user=user,
-        subject=subject,
-        message=plain_text,
-        notification_type=notification_type,
-        metadata=notification_metadata
-    )
+
+def render_notification_template(
+    user: User,
+    subject: str,
+    template: str,
+    context: dict,
+    notification_type: Notification.NotificationType,
+    notification_metadata: dict | None = None
+) -> NotificationEmail:
+    """Render an email template into a notification for a specified user.
+
+    Args:
+        user: The user object to whom the email will be sent.
+        subject: The subject line of the email.
+        template: The name of the template file to render.
+        context: Variable definitions used to populate the template.
+        notification_type: Optionally categorize the notification type.
+        notification_metadata: Metadata to store alongside the notification.
+
+    Returns:
+        A notification ready for delivery.
+
+    Raises:
+        UndefinedError: When template variables are not defined in the notification metadata
+    """
+
+    html_content, text_content = get_notification_template(template).render(context)
+    return NotificationEmail(user, subject, text_content, html_content, notification_type, notification_metadata)
+
+
+def render_notification_batch(
+    template: str,
+    notifications: Iterable[dict]
+) -> tuple[list[NotificationEmail], list[tuple[dict, Exception]]]:
+    """Render an email template into notifications for multiple users.
+
+    The template is compiled once and reused for every notification.
+    Notifications that fail to render are returned to the caller instead of
+    raising an error.
+
+    Args:
+        template: The name of the template file to render.
+        notifications: Keyword arguments for `render_notification_template`
+            (excluding the template name) describing each notification.
+
+    Returns:
+        The rendered notifications and a list of failed notification arguments paired with the raised error.
+
+    Raises:
+        TemplateDoesNotExist: If the template cannot be found.
+    """
+
+    compiled = get_notification_template(template)
+
+    rendered, failures = [], []
+    for kwargs in notifications:
+        try:
+            html_content, text_content = compiled.render(kwargs['context'])
+
+        except Exception as error:
+            failures.append((kwargs, error))
+            continue
+
+        rendered.append(NotificationEmail(
+            user=kwargs['user'],
+            subject=kwargs['subject'],
+            plain_text=text_content,
+            html_text=html_content,
+            notification_type=kwargs['notification_type'],
+            notification_metadata=kwargs.get('notification_metadata')
+        ))
+
+    return rendered, failures
 
 
 def send_notification_template(
@@ -70,18 +285,13 @@ def send_notification_template(
         UndefinedError: When template variables are not defined in the notification metadata
     """
 
-    html_content = render_to_string(template, context, using='jinja2')
-    text_content = strip_tags(html_content)
-
-    send_notification(
-        user,
-        subject,
-        text_content,
-        html_content,
-        notification_type,
-        notification_metadata
+    notification = render_notification_template(
+        user, subject, template, context, notification_type, notification_metadata
     )
 
+    if failures := send_notification_batch([notification]):
+        raise failures[0][1]
+
 
 def send_general_notification(user: User, subject: str, message: str) -> None:
     """Send a general notification email to a specified user.
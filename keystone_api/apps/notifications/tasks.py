@@ -0,0 +1,136 @@
+"""Scheduled tasks executed in parallel by Celery.
+
+Tasks are scheduled and executed in the background by Celery. They operate
+asynchronously from the rest of the application and log their results in the
+application database.
+"""
+
+import logging
+from datetime import timedelta
+
+from celery import shared_task
+from django.conf import settings
+from django.utils import timezone
+
+from .models import QueuedNotification
+from .shortcuts import NotificationEmail, send_notification_batch
+
+__all__ = ['clear_queued_notifications', 'deliver_queued_notifications']
+
+log = logging.getLogger(__name__)
+
+
+def record_delivery_result(queued: QueuedNotification, error: Exception | None) -> None:
+    """Record the outcome of a single delivery attempt for a queued notification.
+
+    Failed deliveries are rescheduled using exponential backoff. Notifications
+    are marked as failed once the maximum number of attempts is exhausted.
+    The outcome is saved immediately so delivered emails are not sent again
+    if a later notification in the same batch raises an error.
+
+    Args:
+        queued: The queued notification that delivery was attempted for.
+        error: The error raised during delivery, or `None` if delivery succeeded.
+    """
+
+    now = timezone.now()
+    queued.attempts += 1
+    if error is None:
+        queued.status = QueuedNotification.StatusChoices.SENT
+        queued.sent = now
+        queued.error = None
+
+    elif queued.attempts >= settings.EMAIL_MAX_ATTEMPTS:
+        queued.status = QueuedNotification.StatusChoices.FAILED
+        queued.error = str(error)
+        log.error(f'Giving up on notification {queued.id} after {queued.attempts} attempts: {error}', exc_info=error)
+
+    else:
+        queued.next_attempt = now + timedelta(seconds=settings.EMAIL_RETRY_BACKOFF * 2 ** (queued.attempts - 1))
+        queued.error = str(error)
+        log.warning(f'Error delivering notification {queued.id} (attempt {queued.attempts}): {error}')
+
+    queued.save(update_fields=['status', 'attempts', 'error', 'next_attempt', 'sent'])
+
+
+def deliver_claimed_notifications(claimed: list[QueuedNotification], rate_limit: float | None = None) -> int:
+    """Deliver a batch of claimed notifications and record the outcome of each delivery attempt.
+
+    Emails are sent outside any database transaction and the outcome of each
+    delivery is saved as soon as the delivery attempt completes.
+
+    Args:
+        claimed: The queued notifications to deliver.
+        rate_limit: Maximum number of emails sent per second (defaults to application settings).
+
+    Returns:
+        The number of successfully delivered notifications.
+    """
+
+    queued_by_email = dict()
+    for queued in claimed:
+        email = NotificationEmail(
+            user=queued.user,
+            subject=queued.subject,
+            plain_text=queued.message,
+            html_text=queued.html_message,
+            notification_type=queued.notification_type,
+            notification_metadata=queued.metadata
+        )
+        queued_by_email[id(email)] = (email, queued)
+
+    failures = send_notification_batch(
+        [email for email, _ in queued_by_email.values()],
+        len(claimed),
+        rate_limit,
+        on_result=lambda email, error: record_delivery_result(queued_by_email[id(email)][1], error)
+    )
+
+    return len(claimed) - len(failures)
+
+
+@shared_task()
+def deliver_queued_notifications(batch_size: int | None = None, rate_limit: float | None = None) -> int:
+    """Deliver queued email notifications until no notifications are due for delivery.
+
+    Notifications are claimed in batches by leasing them in a short
+    transaction, allowing multiple instances of this task to run
+    concurrently. Emails are delivered without holding database locks.
+
+    Args:
+        batch_size: Number of notifications claimed at once (defaults to application settings).
+        rate_limit: Maximum number of emails sent per second (defaults to application settings).
+
+    Returns:
+        The number of successfully delivered notifications.
+    """
+
+    batch_size = batch_size or settings.EMAIL_BATCH_SIZE
+
+    delivered = 0
+    while claimed := QueuedNotification.objects.claim(batch_size, settings.EMAIL_CLAIM_LEASE):
+        delivered += deliver_claimed_notifications(claimed, rate_limit)
+
+    log.info(f'Delivered {delivered} queued notifications.')
+    return delivered
+
+
+@shared_task()
+def clear_queued_notifications() -> int:
+    """Delete sent and failed notifications from the delivery queue according to application settings.
+
+    Returns:
+        The number of deleted records.
+    """
+
+    if settings.EMAIL_QUEUE_RETENTION <= 0:
+        return 0
+
+    cutoff = timezone.now() - timedelta(seconds=settings.EMAIL_QUEUE_RETENTION)
+    deleted, _ = QueuedNotification.objects.filter(
+        status__in=[QueuedNotification.StatusChoices.SENT, QueuedNotification.StatusChoices.FAILED],
+        queued__lt=cutoff
+    ).delete()
+
+    log.info(f'Deleted {deleted} processed notifications from the delivery queue.')
+    return deleted
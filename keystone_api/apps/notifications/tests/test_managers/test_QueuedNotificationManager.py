@@ -0,0 +1,181 @@
+"""Unit tests for the `QueuedNotificationManager` class."""
+
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.allocations.models import AllocationRequest
+from apps.notifications.models import Notification, QueuedNotification
+from apps.notifications.shortcuts import NotificationEmail
+from apps.users.models import ResearchGroup, User
+
+
+class Queue(TestCase):
+    """Test the queueing of notifications."""
+
+    def test_records_created(self) -> None:
+        """Test a queued record is created for every notification."""
+
+        user = User.objects.create(username='user', email='user@example.com')
+        QueuedNotification.objects.queue([
+            NotificationEmail(
+                user=user,
+                subject=f'Subject {i}',
+                plain_text='Plain text message.',
+                html_text='<p>HTML message.</p>',
+                notification_type=Notification.NotificationType.general_message,
+                notification_metadata={'index': i}
+            ) for i in range(3)
+        ])
+
+        queued = QueuedNotification.objects.order_by('subject')
+        self.assertEqual(3, queued.count())
+        self.assertEqual({'index': 0}, queued[0].metadata)
+        self.assertEqual('<p>HTML message.</p>', queued[0].html_message)
+        self.assertTrue(all(record.status == QueuedNotification.StatusChoices.QUEUED for record in queued))
+
+    def test_duplicates_skipped(self) -> None:
+        """Test notifications matching the deduplication key of a queued or sent notification are skipped."""
+
+        user = User.objects.create(username='user', email='user@example.com')
+        request = AllocationRequest.objects.create(group=ResearchGroup.objects.create(name='group', pi=user))
+        notification = NotificationEmail(
+            user=user,
+            subject='Subject',
+            plain_text='Plain text message.',
+            html_text='<p>HTML message.</p>',
+            notification_type=Notification.NotificationType.request_expired,
+            notification_metadata={'request_id': request.id}
+        )
+
+        QueuedNotification.objects.queue([notification, notification])
+        self.assertEqual(request, QueuedNotification.objects.get().request)
+
+        QueuedNotification.objects.update(status=QueuedNotification.StatusChoices.SENT)
+        QueuedNotification.objects.queue([notification])
+        self.assertEqual(1, QueuedNotification.objects.count())
+
+        # Failed notifications do not block new delivery attempts
+        QueuedNotification.objects.update(status=QueuedNotification.StatusChoices.FAILED)
+        QueuedNotification.objects.queue([notification])
+        self.assertEqual(2, QueuedNotification.objects.count())
+
+    def test_duplicate_thresholds_skipped(self) -> None:
+        """Test upcoming expiration notifications are deduplicated by threshold instead of days until expiration."""
+
+        user = User.objects.create(username='user', email='user@example.com')
+        request = AllocationRequest.objects.create(group=ResearchGroup.objects.create(name='group', pi=user))
+        notifications = [
+            NotificationEmail(
+                user=user,
+                subject='Subject',
+                plain_text='Plain text message.',
+                html_text='<p>HTML message.</p>',
+                notification_type=Notification.NotificationType.request_expiring,
+                notification_metadata={'request_id': request.id, 'days_to_expire': days, 'expiration_threshold': 30}
+            ) for days in (30, 29)
+        ]
+
+        QueuedNotification.objects.queue(notifications)
+        self.assertEqual(30, QueuedNotification.objects.get().expiration_threshold)
+
+
+class Claim(TestCase):
+    """Test the claiming of notifications for delivery."""
+
+    def setUp(self) -> None:
+        """Create a user for queued notifications."""
+
+        self.user = User.objects.create(username='user', email='user@example.com')
+
+    def create_notification(self, **kwargs) -> QueuedNotification:
+        """Create a queued notification using the given field values."""
+
+        return QueuedNotification.objects.create(
+            user=self.user,
+            subject='Subject',
+            notification_type=Notification.NotificationType.general_message,
+            **kwargs
+        )
+
+    def test_due_notifications_claimed(self) -> None:
+        """Test only queued notifications that are due for delivery are claimed."""
+
+        due = self.create_notification()
+        self.create_notification(next_attempt=timezone.now() + timedelta(hours=1))
+        self.create_notification(status=QueuedNotification.StatusChoices.SENT)
+        self.create_notification(status=QueuedNotification.StatusChoices.FAILED)
+
+        self.assertEqual([due], QueuedNotification.objects.claim(10, lease=60))
+
+    def test_batch_size(self) -> None:
+        """Test the number of claimed notifications is limited by the batch size."""
+
+        earliest = self.create_notification(next_attempt=timezone.now() - timedelta(hours=1))
+        self.create_notification()
+
+        self.assertEqual([earliest], QueuedNotification.objects.claim(1, lease=60))
+
+    def test_claimed_notifications_leased(self) -> None:
+        """Test claimed notifications are not claimed again until the lease expires."""
+
+        queued = self.create_notification()
+        QueuedNotification.objects.claim(10, lease=60)
+
+        queued.refresh_from_db()
+        self.assertAlmostEqual(60, (queued.next_attempt - timezone.now()).total_seconds(), delta=5)
+        self.assertEqual([], QueuedNotification.objects.claim(10, lease=60))
+
+        QueuedNotification.objects.update(next_attempt=timezone.now())
+        self.assertEqual([queued], QueuedNotification.objects.claim(10, lease=60))
+
+
+class DeliveryMetrics(TestCase):
+    """Test the calculation of queue delivery metrics."""
+
+    def setUp(self) -> None:
+        """Create a user for queued notifications."""
+
+        self.user = User.objects.create(username='user', email='user@example.com')
+
+    def create_notification(self, status: str, latency: int | None = None) -> None:
+        """Create a queued notification with the given status and queue latency in seconds."""
+
+        record = QueuedNotification.objects.create(
+            user=self.user,
+            subject='Subject',
+            notification_type=Notification.NotificationType.general_message,
+            status=status
+        )
+
+        if latency is not None:
+            record.sent = record.queued + timedelta(seconds=latency)
+            record.save()
+
+    def test_empty_queue(self) -> None:
+        """Test metrics are zero when the queue is empty."""
+
+        metrics = QueuedNotification.objects.delivery_metrics(since=timezone.now() - timedelta(hours=1))
+        self.assertEqual({'QU': 0, 'SN': 0, 'FL': 0}, metrics['counts'])
+        self.assertEqual(0, metrics['oldest_queued_age'])
+        self.assertEqual(0, metrics['sent'])
+        self.assertEqual({}, metrics['latency'])
+
+    def test_metric_values(self) -> None:
+        """Test queue depth, throughput, and latency percentiles are calculated from queued records."""
+
+        self.create_notification(QueuedNotification.StatusChoices.QUEUED)
+        self.create_notification(QueuedNotification.StatusChoices.FAILED)
+        for latency in (10, 20, 30):
+            self.create_notification(QueuedNotification.StatusChoices.SENT, latency)
+
+        metrics = QueuedNotification.objects.delivery_metrics(
+            since=timezone.now() - timedelta(hours=1),
+            percentiles=(0.5, 1)
+        )
+
+        self.assertEqual({'QU': 1, 'SN': 3, 'FL': 1}, metrics['counts'])
+        self.assertGreaterEqual(metrics['oldest_queued_age'], 0)
+        self.assertEqual(3, metrics['sent'])
+        self.assertEqual({0.5: 20, 1: 30}, metrics['latency'])
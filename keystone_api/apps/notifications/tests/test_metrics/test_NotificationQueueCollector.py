@@ -0,0 +1,30 @@
+"""Unit tests for the `NotificationQueueCollector` class."""
+
+from django.test import TestCase
+
+from apps.notifications.metrics import NotificationQueueCollector
+from apps.notifications.models import Notification, QueuedNotification
+from apps.users.models import User
+
+
+class Collect(TestCase):
+    """Test the collection of notification queue metrics."""
+
+    def test_queue_depth(self) -> None:
+        """Test the queue depth is reported for every delivery status."""
+
+        user = User.objects.create(username='user', email='user@example.com')
+        QueuedNotification.objects.create(user=user, notification_type=Notification.NotificationType.general_message)
+
+        metrics = {metric.name: metric for metric in NotificationQueueCollector().collect()}
+        depth = {sample.labels['status']: sample.value for sample in metrics['keystone_notification_queue_depth'].samples}
+        self.assertEqual({'queued': 1, 'sent': 0, 'failed': 0}, depth)
+
+    def test_describe_has_no_samples(self) -> None:
+        """Test metric descriptions are returned without querying the database."""
+
+        with self.assertNumQueries(0):
+            metrics = NotificationQueueCollector().describe()
+
+        self.assertTrue(metrics)
+        self.assertTrue(all(not metric.samples for metric in metrics))
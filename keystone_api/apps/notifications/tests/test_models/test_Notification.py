@@ -0,0 +1,51 @@
+"""Unit tests for the `Notification` class."""
+
+from django.db import IntegrityError
+from django.test import TestCase
+
+from apps.allocations.models import AllocationRequest
+from apps.notifications.models import Notification
+from apps.users.models import ResearchGroup, User
+
+
+class DedupConstraints(TestCase):
+    """Test the uniqueness constraints on notification deduplication keys."""
+
+    def setUp(self) -> None:
+        """Create a user and an allocation request."""
+
+        self.user = User.objects.create(username='user')
+        group = ResearchGroup.objects.create(name='group', pi=self.user)
+        self.request = AllocationRequest.objects.create(group=group)
+
+    def create_notification(self, notification_type: str, expiration_threshold: int | None = None) -> Notification:
+        """Create a notification for the test user and allocation request."""
+
+        return Notification.objects.create(
+            user=self.user,
+            notification_type=notification_type,
+            request=self.request,
+            expiration_threshold=expiration_threshold
+        )
+
+    def test_duplicate_upcoming_expiration(self) -> None:
+        """Test an upcoming expiration notification cannot be recorded twice with the same key."""
+
+        self.create_notification(Notification.NotificationType.request_expiring, 15)
+        self.create_notification(Notification.NotificationType.request_expiring, 14)
+        with self.assertRaises(IntegrityError):
+            self.create_notification(Notification.NotificationType.request_expiring, 15)
+
+    def test_duplicate_past_expiration(self) -> None:
+        """Test a past expiration notification cannot be recorded twice for the same request."""
+
+        self.create_notification(Notification.NotificationType.request_expired)
+        with self.assertRaises(IntegrityError):
+            self.create_notification(Notification.NotificationType.request_expired)
+
+    def test_general_messages_unconstrained(self) -> None:
+        """Test general messages are not subject to deduplication."""
+
+        self.create_notification(Notification.NotificationType.general_message)
+        self.create_notification(Notification.NotificationType.general_message)
+        self.assertEqual(2, Notification.objects.count())
@@ -0,0 +1,52 @@
+"""Unit tests for the `get_notification_template` function."""
+
+from django.template.exceptions import TemplateDoesNotExist
+from django.test import TestCase
+
+from apps.notifications.rendering import clear_notification_templates, get_notification_template, load_notification_templates
+from apps.users.models import User
+
+
+class TemplateCache(TestCase):
+    """Test the compilation and caching of notification templates."""
+
+    def setUp(self) -> None:
+        """Clear the template cache."""
+
+        clear_notification_templates()
+
+    def test_templates_cached(self) -> None:
+        """Test the same compiled template is returned on repeated calls."""
+
+        self.assertIs(get_notification_template('general.html'), get_notification_template('general.html'))
+
+    def test_load_all_templates(self) -> None:
+        """Test templates from every application are loaded."""
+
+        names = load_notification_templates()
+        self.assertIn('general.html', names)
+        self.assertIn('upcoming_expiration_email.html', names)
+        self.assertIn('past_expiration_email.html', names)
+
+    def test_missing_template(self) -> None:
+        """Test an error is raised when a template is not found."""
+
+        with self.assertRaises(TemplateDoesNotExist):
+            get_notification_template('this_template_does_not_exist.html')
+
+
+class Rendering(TestCase):
+    """Test the rendering of HTML and plain text content."""
+
+    def setUp(self) -> None:
+        """Create a user to render templates for."""
+
+        self.user = User(username='foobar', first_name='Foo', last_name='Bar')
+
+    def test_text_template(self) -> None:
+        """Test plain text content is rendered from a text template without HTML escaping."""
+
+        html, text = get_notification_template('general.html').render({'user': self.user, 'message': 'Tom & Jerry'})
+
+        self.assertIn('<p>Tom &amp; Jerry</p>', html)
+        self.assertEqual('Dear Foo Bar,\n\nTom & Jerry\n\nSincerely,\nThe keystone HPC utility', text)
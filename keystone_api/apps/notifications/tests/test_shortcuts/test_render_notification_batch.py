@@ -0,0 +1,54 @@
+"""Unit tests for the `render_notification_batch` function."""
+
+import jinja2
+from django.test import TestCase
+
+from apps.notifications.models import Notification
+from apps.notifications.shortcuts import render_notification_batch
+from apps.users.models import User
+
+
+class BatchRendering(TestCase):
+    """Test rendering a template for multiple users."""
+
+    def setUp(self) -> None:
+        """Create users to render notifications for."""
+
+        self.users = [User(username=f'user{i}', email=f'user{i}@example.com') for i in range(3)]
+
+    def get_arguments(self, user: User, message: str) -> dict:
+        """Return rendering arguments for a general notification."""
+
+        return {
+            'user': user,
+            'subject': f'Subject for {user.username}',
+            'context': {'user': user, 'message': message},
+            'notification_type': Notification.NotificationType.general_message,
+            'notification_metadata': {'username': user.username},
+        }
+
+    def test_notifications_rendered(self) -> None:
+        """Test a notification is rendered for every user."""
+
+        notifications, failures = render_notification_batch(
+            'general.html', (self.get_arguments(user, f'Message {user.username}') for user in self.users)
+        )
+
+        self.assertEqual([], failures)
+        self.assertEqual(self.users, [notification.user for notification in notifications])
+        self.assertIn('Message user1', notifications[1].plain_text)
+        self.assertIn('<p>Message user1</p>', notifications[1].html_text)
+        self.assertEqual({'username': 'user1'}, notifications[1].notification_metadata)
+
+    def test_render_failure(self) -> None:
+        """Test notifications failing to render are returned without interrupting the batch."""
+
+        arguments = [self.get_arguments(user, 'Message') for user in self.users]
+        del arguments[1]['context']['message']
+
+        notifications, failures = render_notification_batch('general.html', arguments)
+
+        self.assertEqual([self.users[0], self.users[2]], [notification.user for notification in notifications])
+        self.assertEqual(1, len(failures))
+        self.assertIs(arguments[1], failures[0][0])
+        self.assertIsInstance(failures[0][1], jinja2.UndefinedError)
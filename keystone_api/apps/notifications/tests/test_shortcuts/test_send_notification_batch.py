@@ -0,0 +1,174 @@
+"""Unit tests for the `send_notification_batch` function."""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import Mock, patch
+
+from django.core import mail
+from django.core.mail import get_connection
+from django.core.mail.backends.locmem import EmailBackend
+from django.test import override_settings, TestCase
+
+from apps.allocations.models import AllocationRequest
+from apps.notifications.models import Notification
+from apps.notifications.shortcuts import NotificationEmail, send_notification_batch
+from apps.users.models import ResearchGroup, User
+
+
+def create_notifications(count: int) -> list[NotificationEmail]:
+    """Create pending notifications addressed to new users.
+
+    Args:
+        count: The number of notifications to create.
+
+    Returns:
+        A list of pending notifications.
+    """
+
+    return [
+        NotificationEmail(
+            user=User.objects.create(username=f'user{i}', email=f'user{i}@example.com'),
+            subject=f'Subject {i}',
+            plain_text='Plain text message.',
+            html_text='<p>HTML message.</p>',
+            notification_type=Notification.NotificationType.general_message,
+            notification_metadata={'index': i}
+        ) for i in range(count)
+    ]
+
+
+@override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend')
+class BatchDelivery(TestCase):
+    """Test the delivery of notifications in batches."""
+
+    def test_emails_sent(self) -> None:
+        """Test an email is sent with plain text and HTML content for every notification."""
+
+        failures = send_notification_batch(create_notifications(5), batch_size=2)
+
+        self.assertEqual([], failures)
+        self.assertEqual(5, len(mail.outbox))
+        self.assertEqual([('<p>HTML message.</p>', 'text/html')], mail.outbox[0].alternatives)
+
+    def test_database_is_updated(self) -> None:
+        """Test a record is stored in the database for every delivered notification."""
+
+        send_notification_batch(create_notifications(5), batch_size=2)
+        self.assertEqual(5, Notification.objects.count())
+        self.assertEqual({'index': 0}, Notification.objects.get(user__username='user0').metadata)
+
+    @patch('apps.notifications.shortcuts.get_connection', wraps=get_connection)
+    def test_connection_reused(self, mock_get_connection: Mock) -> None:
+        """Test a single connection is opened per batch."""
+
+        send_notification_batch(create_notifications(5), batch_size=2)
+        self.assertEqual(3, mock_get_connection.call_count)
+
+    @patch.object(EmailBackend, 'send_messages')
+    def test_delivery_failure(self, mock_send_messages: Mock) -> None:
+        """Test failed notifications are returned and not recorded in the database."""
+
+        error = ConnectionResetError('Test error')
+        mock_send_messages.side_effect = [1, error, 1]
+        notifications = create_notifications(3)
+
+        failures = send_notification_batch(notifications)
+
+        self.assertEqual([(notifications[1], error)], failures)
+        self.assertCountEqual(['user0', 'user2'], Notification.objects.values_list('user__username', flat=True))
+
+    @patch('apps.notifications.shortcuts.get_connection')
+    def test_connection_failure(self, mock_get_connection: Mock) -> None:
+        """Test all notifications in a batch fail when a connection cannot be opened."""
+
+        error = ConnectionRefusedError('Test error')
+        mock_get_connection.return_value.__enter__.side_effect = error
+        notifications = create_notifications(2)
+
+        failures = send_notification_batch(notifications)
+
+        self.assertEqual([(notifications[0], error), (notifications[1], error)], failures)
+        self.assertFalse(Notification.objects.exists())
+
+    @patch('apps.notifications.shortcuts.time.sleep')
+    @patch('apps.notifications.shortcuts.time.monotonic', return_value=0)
+    def test_rate_limit(self, mock_monotonic: Mock, mock_sleep: Mock) -> None:
+        """Test delivery is paced to respect the maximum number of emails per second."""
+
+        send_notification_batch(create_notifications(3), rate_limit=4)
+
+        # The first email is sent immediately and the remaining emails are spaced evenly
+        self.assertEqual([0.25, 0.5], [call.args[0] for call in mock_sleep.call_args_list])
+        self.assertEqual(3, len(mail.outbox))
+
+    @patch('apps.notifications.shortcuts.time.sleep')
+    def test_rate_limit_disabled(self, mock_sleep: Mock) -> None:
+        """Test delivery is not delayed when the rate limit is disabled."""
+
+        send_notification_batch(create_notifications(3), rate_limit=0)
+        mock_sleep.assert_not_called()
+
+
+@override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend')
+class Deduplication(TestCase):
+    """Test notifications are deduplicated before delivery."""
+
+    def setUp(self) -> None:
+        """Create a notification with a deduplication key."""
+
+        user = User.objects.create(username='user', email='user@example.com')
+        request = AllocationRequest.objects.create(group=ResearchGroup.objects.create(name='group', pi=user))
+        self.notification = NotificationEmail(
+            user=user,
+            subject='Subject',
+            plain_text='Plain text message.',
+            html_text='<p>HTML message.</p>',
+            notification_type=Notification.NotificationType.request_expired,
+            notification_metadata={'request_id': request.id}
+        )
+
+    def test_recorded_notifications_not_sent(self) -> None:
+        """Test notifications matching an existing record are skipped without sending an email."""
+
+        self.notification.build_record().save()
+        on_result = Mock()
+
+        self.assertEqual([], send_notification_batch([self.notification], on_result=on_result))
+        self.assertEqual(0, len(mail.outbox))
+        on_result.assert_called_once_with(self.notification, None)
+
+    def test_duplicates_sent_once(self) -> None:
+        """Test duplicate notifications within a batch are only sent once."""
+
+        send_notification_batch([self.notification, self.notification])
+        self.assertEqual(1, len(mail.outbox))
+        self.assertEqual(1, Notification.objects.count())
+
+    @patch.object(EmailBackend, 'send_messages')
+    def test_failed_notifications_released(self, mock_send_messages: Mock) -> None:
+        """Test notifications that fail to deliver can be sent again later."""
+
+        mock_send_messages.side_effect = ConnectionResetError('Test error')
+        send_notification_batch([self.notification])
+        self.assertFalse(Notification.objects.exists())
+
+        mock_send_messages.side_effect = None
+        mock_send_messages.return_value = 1
+        self.assertEqual([], send_notification_batch([self.notification]))
+        self.assertEqual(1, Notification.objects.count())
+
+
+class FileBackendDelivery(TestCase):
+    """Test batched delivery using the file based email backend."""
+
+    def test_one_file_per_batch(self) -> None:
+        """Test emails are written to one file per batch."""
+
+        with TemporaryDirectory() as email_dir, override_settings(
+            EMAIL_BACKEND='django.core.mail.backends.filebased.EmailBackend',
+            EMAIL_FILE_PATH=email_dir
+        ):
+            send_notification_batch(create_notifications(5), batch_size=2)
+            files = list(Path(email_dir).iterdir())
+            self.assertEqual(3, len(files))
+            self.assertEqual(5, sum(file.read_text().count('Subject: Subject') for file in files))
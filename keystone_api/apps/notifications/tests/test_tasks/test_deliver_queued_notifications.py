@@ -0,0 +1,117 @@
+"""Unit tests for the `deliver_queued_notifications` task."""
+
+from datetime import timedelta
+from unittest.mock import Mock, patch
+
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.test import override_settings, TestCase
+from django.utils import timezone
+
+from apps.notifications.models import Notification, QueuedNotification
+from apps.notifications.tasks import deliver_queued_notifications
+from apps.users.models import User
+
+
+class WorkerShutdown(BaseException):
+    """Error simulating a worker process being stopped during delivery."""
+
+
+@override_settings(
+    EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend',
+    EMAIL_MAX_ATTEMPTS=3,
+    EMAIL_RETRY_BACKOFF=60,
+    EMAIL_RATE_LIMIT=0
+)
+class QueuedDelivery(TestCase):
+    """Test the delivery of queued notifications."""
+
+    def setUp(self) -> None:
+        """Queue notifications for delivery to a new user."""
+
+        self.user = User.objects.create(username='user', email='user@example.com')
+        for i in range(3):
+            QueuedNotification.objects.create(
+                user=self.user,
+                subject=f'Subject {i}',
+                message='Plain text message.',
+                html_message='<p>HTML message.</p>',
+                notification_type=Notification.NotificationType.general_message,
+                metadata={'index': i}
+            )
+
+    def test_notifications_delivered(self) -> None:
+        """Test queued notifications are sent, recorded, and marked as sent."""
+
+        self.assertEqual(3, deliver_queued_notifications(batch_size=2))
+
+        self.assertEqual(3, len(mail.outbox))
+        self.assertEqual(3, Notification.objects.filter(user=self.user).count())
+        for queued in QueuedNotification.objects.all():
+            self.assertEqual(QueuedNotification.StatusChoices.SENT, queued.status)
+            self.assertEqual(1, queued.attempts)
+            self.assertIsNotNone(queued.sent)
+
+    def test_sent_notifications_not_redelivered(self) -> None:
+        """Test notifications are only delivered once."""
+
+        deliver_queued_notifications()
+        self.assertEqual(0, deliver_queued_notifications())
+        self.assertEqual(3, len(mail.outbox))
+
+    @patch.object(EmailBackend, 'send_messages')
+    def test_failed_delivery_retried_with_backoff(self, mock_send_messages: Mock) -> None:
+        """Test failed deliveries are rescheduled with an exponentially increasing delay."""
+
+        mock_send_messages.side_effect = ConnectionResetError('Test error')
+        queued = QueuedNotification.objects.first()
+
+        with self.assertLogs('apps.notifications.tasks', level='WARNING'):
+            self.assertEqual(0, deliver_queued_notifications())
+
+        queued.refresh_from_db()
+        self.assertEqual(QueuedNotification.StatusChoices.QUEUED, queued.status)
+        self.assertEqual(1, queued.attempts)
+        self.assertEqual('Test error', queued.error)
+        self.assertAlmostEqual(60, (queued.next_attempt - timezone.now()).total_seconds(), delta=5)
+
+        # The second failure doubles the retry delay
+        QueuedNotification.objects.update(next_attempt=timezone.now())
+        with self.assertLogs('apps.notifications.tasks', level='WARNING'):
+            deliver_queued_notifications()
+
+        queued.refresh_from_db()
+        self.assertEqual(2, queued.attempts)
+        self.assertAlmostEqual(120, (queued.next_attempt - timezone.now()).total_seconds(), delta=5)
+        self.assertFalse(Notification.objects.exists())
+
+    @patch.object(EmailBackend, 'send_messages')
+    def test_failed_after_max_attempts(self, mock_send_messages: Mock) -> None:
+        """Test notifications are marked as failed once the maximum number of attempts is reached."""
+
+        mock_send_messages.side_effect = ConnectionResetError('Test error')
+        QueuedNotification.objects.update(attempts=2)
+
+        with self.assertLogs('apps.notifications.tasks', level='ERROR'):
+            deliver_queued_notifications()
+
+        statuses = set(QueuedNotification.objects.values_list('status', flat=True))
+        self.assertEqual({QueuedNotification.StatusChoices.FAILED}, statuses)
+
+    @patch.object(EmailBackend, 'send_messages')
+    def test_outcome_kept_after_interruption(self, mock_send_messages: Mock) -> None:
+        """Test delivered notifications stay marked as sent when the worker stops partway through a batch."""
+
+        mock_send_messages.side_effect = [1, WorkerShutdown()]
+        with self.assertRaises(WorkerShutdown):
+            deliver_queued_notifications()
+
+        statuses = list(QueuedNotification.objects.order_by('subject').values_list('status', flat=True))
+        self.assertEqual([QueuedNotification.StatusChoices.SENT] + [QueuedNotification.StatusChoices.QUEUED] * 2, statuses)
+
+    def test_future_notifications_skipped(self) -> None:
+        """Test notifications scheduled for a later retry are not delivered early."""
+
+        QueuedNotification.objects.update(next_attempt=timezone.now() + timedelta(minutes=5))
+        self.assertEqual(0, deliver_queued_notifications())
+        self.assertEqual(0, len(mail.outbox))
@@ -8,6 +8,7 @@ predefined access rules.
 
 from rest_framework import permissions
 
+from apps.users.membership import get_membership
 from apps.users.models import ResearchGroup
 
 __all__ = ['GroupMemberAll', 'GroupMemberReadGroupAdminWrite']
@@ -26,8 +27,11 @@ class CustomPermissionsBase(permissions.BasePermission):
             The research group or None
         """
 
+        group_id = request.data.get('group', None)
+        if group_id is None:
+            return None
+
         try:
-            group_id = request.data.get('group', None)
             return ResearchGroup.objects.get(pk=group_id)
 
         except ResearchGroup.DoesNotExist:
@@ -44,12 +48,12 @@ class GroupMemberAll(CustomPermissionsBase):
             return False
 
         research_group = self.get_research_group(request)
-        return research_group is None or request.user in research_group.get_all_members()
+        return research_group is None or get_membership(request).is_member(research_group)
 
     def has_object_permission(self, request, view, obj):
         """Return whether the incoming HTTP request has permission to access a database record."""
 
-        return request.user in obj.group.get_all_members()
+        return get_membership(request).is_member(obj.group_id)
 
 
 class GroupMemberReadGroupAdminWrite(CustomPermissionsBase):
@@ -62,12 +66,13 @@ class GroupMemberReadGroupAdminWrite(CustomPermissionsBase):
             return False
 
         research_group = self.get_research_group(request)
-        return research_group is None or request.user in research_group.get_privileged_members()
+        return research_group is None or get_membership(request).is_privileged(research_group)
 
     def has_object_permission(self, request, view, obj):
         """Return whether the incoming HTTP request has permission to access a database record."""
 
         read_only = request.method in permissions.SAFE_METHODS
-        is_group_member = request.user in obj.group.get_all_members()
-        is_group_admin = request.user in obj.group.get_privileged_members()
+        membership = get_membership(request)
+        is_group_member = membership.is_member(obj.group_id)
+        is_group_admin = membership.is_privileged(obj.group_id)
         return is_group_admin or (read_only and is_group_member)
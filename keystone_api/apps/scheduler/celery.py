@@ -8,6 +8,7 @@ with the Celery application instance for all applications defined in the
 
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_init, worker_process_shutdown
 
 celery_app = Celery('scheduler')
 celery_app.config_from_object('django.conf:settings', namespace='CELERY')
@@ -24,11 +25,21 @@ celery_app.conf.beat_schedule = {
         'schedule': crontab(hour='0', minute='0'),
         'description': 'This task deletes old log entries according to application settings.'
     },
+    'apps.logging.tasks.create_log_partitions': {
+        'task': 'apps.logging.tasks.create_log_partitions',
+        'schedule': crontab(hour='1', minute='0'),
+        'description': 'This task creates partitions for upcoming log records. This task does nothing if log partitioning is disabled.'
+    },
     'apps.allocations.tasks.limits.update_limits': {
         'task': 'apps.allocations.tasks.limits.update_limits',
-        'schedule': crontab(minute='0'),
+        'schedule': crontab(hour='0', minute='0'),
         'description': 'This task updates all Slurm clusters with the latest user allocation limits.'
     },
+    'apps.allocations.tasks.limits.update_limits_incremental': {
+        'task': 'apps.allocations.tasks.limits.update_limits_incremental',
+        'schedule': crontab(minute='30'),
+        'description': 'This task updates Slurm limits for accounts with allocation changes since the last run.'
+    },
     'apps.allocations.tasks.notifications.notify_upcoming_expirations': {
         'task': 'apps.allocations.tasks.notifications.notify_upcoming_expirations',
         'schedule': crontab(hour='0', minute='0'),
@@ -39,4 +50,38 @@ celery_app.conf.beat_schedule = {
         'schedule': crontab(hour='0', minute='0'),
         'description': 'This task issues notifications informing users when their allocations have expired.'
     },
+    'apps.notifications.tasks.deliver_queued_notifications': {
+        'task': 'apps.notifications.tasks.deliver_queued_notifications',
+        'schedule': crontab(minute='*'),
+        'description': 'This task delivers queued email notifications and retries failed deliveries.'
+    },
+    'apps.notifications.tasks.clear_queued_notifications': {
+        'task': 'apps.notifications.tasks.clear_queued_notifications',
+        'schedule': crontab(hour='0', minute='0'),
+        'description': 'This task deletes delivered and failed notifications from the delivery queue according to application settings.'
+    },
 }
+
+
+@worker_process_init.connect
+def start_worker_log_buffers(**kwargs) -> None:
+    """Buffer log records written by Celery worker processes."""
+
+    from apps.logging.buffers import start_log_buffers
+    start_log_buffers()
+
+
+@worker_process_init.connect
+def load_worker_notification_templates(**kwargs) -> None:
+    """Compile notification templates before a Celery worker process accepts tasks."""
+
+    from apps.notifications.rendering import load_notification_templates
+    load_notification_templates()
+
+
+@worker_process_shutdown.connect
+def stop_worker_log_buffers(**kwargs) -> None:
+    """Save buffered log records before a Celery worker process exits."""
+
+    from apps.logging.buffers import stop_log_buffers
+    stop_log_buffers()
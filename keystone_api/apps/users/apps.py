@@ -18,6 +18,7 @@ class UsersAppConfig(AppConfig):
     name = 'apps.users'
 
     def ready(self):
-        """Register application specific system checks."""
+        """Register application specific system checks and signal handlers."""
 
         register(checks.ldap_dependency_check)
+        from . import membership, signals
@@ -0,0 +1,23 @@
+"""A Django management command for rebuilding research group membership records.
+
+Membership records are maintained automatically as research groups are
+modified. This command regenerates all records from the `pi`, `admins`, and
+`members` fields of each research group and can be used to repair records
+after bulk database changes that bypass model signals.
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.users.models import GroupMembership
+
+
+class Command(BaseCommand):
+    """Rebuild research group membership records."""
+
+    help = 'Rebuild research group membership records from research group data.'
+
+    def handle(self, *args, **options) -> None:
+        """Handle the command execution."""
+
+        created = GroupMembership.objects.rebuild()
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {created} membership records'))
@@ -6,16 +6,16 @@ every database model. Managers are commonly exposed as an attribute of the
 associated model class called `objects`.
 """
 
-from typing import TYPE_CHECKING
+from typing import Iterable, TYPE_CHECKING
 
 from django.contrib.auth import password_validation
 from django.contrib.auth.base_user import BaseUserManager
-from django.db import models
+from django.db import models, transaction
 
 if TYPE_CHECKING:  # pragma: nocover
-    from apps.users.models import User
+    from apps.users.models import ResearchGroup, User
 
-__all__ = ['ResearchGroupManager', 'UserManager']
+__all__ = ['GroupMembershipManager', 'ResearchGroupManager', 'UserManager']
 
 
 class UserManager(BaseUserManager):
@@ -91,4 +91,56 @@ class ResearchGroupManager(models.Manager):
             A filtered queryset.
         """
 
-        return self.get_queryset().filter(models.Q(pi=user.id) | models.Q(admins=user.id) | models.Q(members=user.id))
+        return self.get_queryset().filter(memberships__user=user.id)
+
+
+class GroupMembershipManager(models.Manager):
+    """Object manager for the `GroupMembership` database model."""
+
+    def rebuild(self, groups: 'Iterable[ResearchGroup | int] | None' = None) -> int:
+        """Rebuild membership records from the `pi`, `admins`, and `members` fields of research groups.
+
+        Args:
+            groups: The research groups, or their primary keys, to rebuild records for. Defaults to all groups.
+
+        Returns:
+            The number of membership records created.
+        """
+
+        from apps.users.models import ResearchGroup
+
+        group_ids = None if groups is None else [getattr(group, 'pk', group) for group in groups]
+        research_groups = ResearchGroup.objects.all()
+        if group_ids is not None:
+            research_groups = research_groups.filter(pk__in=group_ids)
+
+        # Apply roles in order of increasing privilege so higher roles take precedence
+        roles = dict()
+        role_links = (
+            (self.model.Role.MEMBER, ResearchGroup.members.through),
+            (self.model.Role.ADMIN, ResearchGroup.admins.through),
+        )
+
+        for role, through in role_links:
+            links = through.objects.all()
+            if group_ids is not None:
+                links = links.filter(researchgroup_id__in=group_ids)
+
+            for group_id, user_id in links.values_list('researchgroup_id', 'user_id'):
+                roles[(user_id, group_id)] = role
+
+        for group_id, pi_id in research_groups.values_list('pk', 'pi_id'):
+            roles[(pi_id, group_id)] = self.model.Role.PI
+
+        with transaction.atomic():
+            existing = self.get_queryset()
+            if group_ids is not None:
+                existing = existing.filter(group_id__in=group_ids)
+
+            existing.delete()
+            created = self.bulk_create(
+                self.model(user_id=user_id, group_id=group_id, role=role)
+                for (user_id, group_id), role in roles.items()
+            )
+
+        return len(created)
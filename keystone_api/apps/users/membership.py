@@ -0,0 +1,122 @@
+"""Resolve research group memberships for permission checks.
+
+Membership resolvers load every research group role held by a user from the
+`GroupMembership` table in a single query and answer subsequent membership
+checks from memory. Resolvers are cached on incoming requests so permission
+checks for multiple records share one database lookup. Cached roles are
+discarded whenever research group memberships are modified by the same process.
+"""
+
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .models import GroupMembership, ResearchGroup, User
+
+__all__ = ['MembershipResolver', 'get_membership']
+
+# Incremented whenever research group memberships change to invalidate cached roles. This lets a
+# request that modifies a group (e.g., adding a member) check permissions against the updated roles.
+# A process-local counter is sufficient since resolvers only live for a single request, and changes
+# made by other processes are loaded by the resolvers of subsequent requests.
+_generation = 0
+
+
+class MembershipResolver:
+    """Resolve the research group roles held by a single user."""
+
+    def __init__(self, user: User) -> None:
+        """Initialize the resolver.
+
+        Args:
+            user: The user to resolve memberships for.
+        """
+
+        self.user = user
+        self._roles: dict[int, str] | None = None
+        self._generation = None
+
+    @property
+    def roles(self) -> dict[int, str]:
+        """A mapping of research group IDs to the user's role in each group."""
+
+        if self._roles is None or self._generation != _generation:
+            self._generation = _generation
+            self._roles = self._load_roles()
+
+        return self._roles
+
+    def _load_roles(self) -> dict[int, str]:
+        """Load the user's research group roles from the database."""
+
+        if not self.user.is_authenticated:
+            return dict()
+
+        return dict(GroupMembership.objects.filter(user=self.user).values_list('group_id', 'role'))
+
+    def is_member(self, group: ResearchGroup | int | None) -> bool:
+        """Return whether the user is a member of a research group with any role.
+
+        Args:
+            group: The research group or its primary key.
+
+        Returns:
+            A boolean indicating group membership.
+        """
+
+        return self._group_id(group) in self.roles
+
+    def is_privileged(self, group: ResearchGroup | int | None) -> bool:
+        """Return whether the user is a PI or admin of a research group.
+
+        Args:
+            group: The research group or its primary key.
+
+        Returns:
+            A boolean indicating admin privileges.
+        """
+
+        return self.roles.get(self._group_id(group)) in (GroupMembership.Role.PI, GroupMembership.Role.ADMIN)
+
+    @staticmethod
+    def _group_id(group: ResearchGroup | int | str | None) -> int | None:
+        """Normalize a research group or group identifier into an integer primary key."""
+
+        if isinstance(group, ResearchGroup):
+            return group.pk
+
+        try:
+            return int(group)
+
+        except (TypeError, ValueError):
+            return None
+
+
+def get_membership(request) -> MembershipResolver:
+    """Return the membership resolver for the user making a request.
+
+    Resolvers are cached on the request object and reused across permission checks.
+
+    Args:
+        request: The incoming HTTP request.
+
+    Returns:
+        A membership resolver for the requesting user.
+    """
+
+    resolver = getattr(request, '_membership_resolver', None)
+    if resolver is None or resolver.user != request.user:
+        resolver = MembershipResolver(request.user)
+        request._membership_resolver = resolver
+
+    return resolver
+
+
+@receiver(m2m_changed, sender=ResearchGroup.admins.through)
+@receiver(m2m_changed, sender=ResearchGroup.members.through)
+@receiver(post_save, sender=ResearchGroup)
+@receiver(post_delete, sender=ResearchGroup)
+def invalidate_memberships(**kwargs) -> None:
+    """Invalidate cached membership roles after research group memberships change."""
+
+    global _generation
+    _generation += 1
@@ -0,0 +1,50 @@
+# Generated by Django 5.1.2 on 2026-10-18 04:05
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def populate_memberships(apps, schema_editor) -> None:
+    """Create membership records for all existing research groups."""
+
+    ResearchGroup = apps.get_model('users', 'ResearchGroup')
+    GroupMembership = apps.get_model('users', 'GroupMembership')
+
+    # Apply roles in order of increasing privilege so higher roles take precedence
+    roles = dict()
+    for role, through in (('member', ResearchGroup.members.through), ('admin', ResearchGroup.admins.through)):
+        for group_id, user_id in through.objects.values_list('researchgroup_id', 'user_id'):
+            roles[(user_id, group_id)] = role
+
+    for group_id, pi_id in ResearchGroup.objects.values_list('pk', 'pi_id'):
+        roles[(pi_id, group_id)] = 'pi'
+
+    GroupMembership.objects.bulk_create(
+        GroupMembership(user_id=user_id, group_id=group_id, role=role)
+        for (user_id, group_id), role in roles.items()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0007_researchgroup_is_active_alter_researchgroup_pi'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GroupMembership',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('role', models.CharField(choices=[('pi', 'Principal Investigator'), ('admin', 'Admin'), ('member', 'Member')], max_length=6)),
+                ('group', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='memberships', to='users.researchgroup')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='group_memberships', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['group', 'role'], name='users_group_group_i_fd17c6_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'group'), name='unique_group_membership')],
+            },
+        ),
+        migrations.RunPython(populate_memberships, migrations.RunPython.noop),
+    ]
@@ -13,7 +13,7 @@ from django.utils import timezone
 
 from .managers import *
 
-__all__ = ['ResearchGroup', 'User']
+__all__ = ['GroupMembership', 'ResearchGroup', 'User']
 
 
 class User(auth_models.AbstractBaseUser, auth_models.PermissionsMixin):
@@ -75,3 +75,35 @@ class ResearchGroup(models.Model):
         """Return the research group's account name."""
 
         return str(self.name)
+
+
+class GroupMembership(models.Model):
+    """Denormalized record of a user's role within a research group.
+
+    Records are maintained automatically from the `pi`, `admins`, and `members`
+    fields of the `ResearchGroup` model. Each user has at most one record per
+    group reflecting their most privileged role.
+    """
+
+    class Role(models.TextChoices):
+        """Enumerated choices for the membership role."""
+
+        PI = 'pi', 'Principal Investigator'
+        ADMIN = 'admin', 'Admin'
+        MEMBER = 'member', 'Member'
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='group_memberships')
+    group = models.ForeignKey(ResearchGroup, on_delete=models.CASCADE, related_name='memberships')
+    role = models.CharField(max_length=6, choices=Role.choices)
+
+    objects = GroupMembershipManager()
+
+    class Meta:
+        """Database model settings."""
+
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'group'], name='unique_group_membership'),
+        ]
+        indexes = [
+            models.Index(fields=['group', 'role']),
+        ]
@@ -10,6 +10,7 @@ from rest_framework import permissions
 from rest_framework.request import Request
 from rest_framework.views import View
 
+from .membership import get_membership
 from .models import *
 
 __all__ = ['IsGroupAdminOrReadOnly', 'IsSelfOrReadOnly']
@@ -37,7 +38,7 @@ class IsGroupAdminOrReadOnly(permissions.BasePermission):
             return True
 
         # Update permissions are only allowed for staff and research group admins
-        return request.user.is_staff or request.user in obj.get_privileged_members()
+        return request.user.is_staff or get_membership(request).is_privileged(obj)
 
 
 class IsSelfOrReadOnly(permissions.BasePermission):
@@ -0,0 +1,41 @@
+"""Signal handlers for reacting to changes in application data.
+
+Signal handlers are connected to database model events (e.g., saves and
+deletes) and are used to trigger side effects without coupling the
+responsible logic to the models themselves.
+"""
+
+from django.db.models.signals import m2m_changed, post_save
+from django.dispatch import receiver
+
+from .models import GroupMembership, ResearchGroup, User
+
+__all__ = ['on_group_membership_change', 'on_research_group_save']
+
+
+@receiver(post_save, sender=ResearchGroup)
+def on_research_group_save(sender: type[ResearchGroup], instance: ResearchGroup, **kwargs) -> None:
+    """Rebuild membership records when a research group is created or its PI changes."""
+
+    GroupMembership.objects.rebuild([instance.pk])
+
+
+@receiver(m2m_changed, sender=ResearchGroup.admins.through)
+@receiver(m2m_changed, sender=ResearchGroup.members.through)
+def on_group_membership_change(
+    sender: type, instance: ResearchGroup | User, action: str, reverse: bool, pk_set: set[int] | None, **kwargs
+) -> None:
+    """Rebuild membership records when users are added to or removed from a research group."""
+
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    if not reverse:
+        GroupMembership.objects.rebuild([instance.pk])
+
+    elif pk_set is not None:
+        GroupMembership.objects.rebuild(pk_set)
+
+    else:
+        # Cleared relationships are rebuilt using the records that still reflect the previous state
+        GroupMembership.objects.rebuild(instance.group_memberships.values_list('group_id', flat=True))
@@ -0,0 +1,46 @@
+"""Unit tests for the `GroupMembershipManager` class."""
+
+from django.test import TestCase
+
+from apps.users.models import GroupMembership, ResearchGroup
+from apps.users.tests.utils import create_test_user
+
+
+class Rebuild(TestCase):
+    """Test the rebuilding of membership records via the `rebuild` method."""
+
+    def setUp(self) -> None:
+        """Create a research group with users in each role."""
+
+        self.pi = create_test_user(username='pi')
+        self.admin = create_test_user(username='admin')
+        self.member = create_test_user(username='member')
+
+        self.group = ResearchGroup.objects.create(name='group', pi=self.pi)
+        self.group.admins.add(self.admin, self.pi)
+        self.group.members.add(self.member, self.admin)
+
+    def assert_roles(self, expected: dict) -> None:
+        """Assert the membership records of the test group match the given usernames and roles."""
+
+        records = GroupMembership.objects.filter(group=self.group).values_list('user__username', 'role')
+        self.assertEqual(expected, dict(records))
+
+    def test_rebuild_all(self) -> None:
+        """Test records are recreated from research group data with the most privileged role per user."""
+
+        GroupMembership.objects.all().delete()
+
+        self.assertEqual(3, GroupMembership.objects.rebuild())
+        self.assert_roles({'pi': 'pi', 'admin': 'admin', 'member': 'member'})
+
+    def test_rebuild_selected_groups(self) -> None:
+        """Test only records for the given groups are rebuilt."""
+
+        other_group = ResearchGroup.objects.create(name='other', pi=self.member)
+        GroupMembership.objects.all().delete()
+
+        GroupMembership.objects.rebuild([other_group])
+
+        self.assert_roles({})
+        self.assertEqual(1, GroupMembership.objects.filter(group=other_group).count())
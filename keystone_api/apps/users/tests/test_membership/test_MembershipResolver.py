@@ -0,0 +1,74 @@
+"""Unit tests for the `MembershipResolver` class."""
+
+from django.contrib.auth.models import AnonymousUser
+from django.test import TestCase
+
+from apps.users.membership import MembershipResolver
+from apps.users.models import ResearchGroup, User
+
+
+class RoleResolution(TestCase):
+    """Test the resolution of research group roles."""
+
+    def setUp(self) -> None:
+        """Create a user with a different role in each of several research groups."""
+
+        self.user = User.objects.create_user(username='user', password='foobar123!')
+        other = User.objects.create_user(username='other', password='foobar123!')
+
+        self.pi_group = ResearchGroup.objects.create(name='pi_group', pi=self.user)
+        self.admin_group = ResearchGroup.objects.create(name='admin_group', pi=other)
+        self.admin_group.admins.add(self.user)
+        self.admin_group.members.add(self.user)
+        self.member_group = ResearchGroup.objects.create(name='member_group', pi=other)
+        self.member_group.members.add(self.user)
+        self.other_group = ResearchGroup.objects.create(name='other_group', pi=other)
+
+    def test_roles(self) -> None:
+        """Test the highest privilege role is returned for each group."""
+
+        roles = MembershipResolver(self.user).roles
+        self.assertEqual(
+            {self.pi_group.pk: 'pi', self.admin_group.pk: 'admin', self.member_group.pk: 'member'},
+            roles
+        )
+
+    def test_membership_checks(self) -> None:
+        """Test membership and privilege checks against groups and group IDs."""
+
+        resolver = MembershipResolver(self.user)
+
+        self.assertTrue(resolver.is_privileged(self.pi_group))
+        self.assertTrue(resolver.is_privileged(str(self.admin_group.pk)))
+        self.assertFalse(resolver.is_privileged(self.member_group.pk))
+        self.assertTrue(resolver.is_member(self.member_group.pk))
+        self.assertFalse(resolver.is_member(self.other_group))
+        self.assertFalse(resolver.is_member(None))
+
+    def test_single_query(self) -> None:
+        """Test repeated membership checks are answered from a single query."""
+
+        resolver = MembershipResolver(self.user)
+        with self.assertNumQueries(1):
+            for group in (self.pi_group, self.admin_group, self.member_group, self.other_group):
+                resolver.is_member(group)
+                resolver.is_privileged(group)
+
+    def test_invalidated_on_membership_change(self) -> None:
+        """Test cached roles are reloaded after group memberships change."""
+
+        resolver = MembershipResolver(self.user)
+        self.assertFalse(resolver.is_member(self.other_group))
+
+        self.other_group.members.add(self.user)
+        self.assertTrue(resolver.is_member(self.other_group))
+
+        self.pi_group.pi = User.objects.get(username='other')
+        self.pi_group.save()
+        self.assertFalse(resolver.is_member(self.pi_group))
+
+    def test_anonymous_user(self) -> None:
+        """Test anonymous users have no memberships."""
+
+        with self.assertNumQueries(0):
+            self.assertEqual(dict(), MembershipResolver(AnonymousUser()).roles)
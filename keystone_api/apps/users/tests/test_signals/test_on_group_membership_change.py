@@ -0,0 +1,58 @@
+"""Unit tests for the `on_group_membership_change` and `on_research_group_save` signal handlers."""
+
+from django.test import TestCase
+
+from apps.users.models import GroupMembership, ResearchGroup
+from apps.users.tests.utils import create_test_user
+
+
+class MembershipSync(TestCase):
+    """Test membership records are kept in sync with research group changes."""
+
+    def setUp(self) -> None:
+        """Create a research group and users."""
+
+        self.pi = create_test_user(username='pi')
+        self.user = create_test_user(username='user')
+        self.group = ResearchGroup.objects.create(name='group', pi=self.pi)
+
+    def get_roles(self) -> dict[str, str]:
+        """Return the recorded roles in the test group keyed by username."""
+
+        return dict(GroupMembership.objects.filter(group=self.group).values_list('user__username', 'role'))
+
+    def test_group_created(self) -> None:
+        """Test a record is created for the PI of a new group."""
+
+        self.assertEqual({'pi': 'pi'}, self.get_roles())
+
+    def test_pi_changed(self) -> None:
+        """Test records are updated when the group PI changes."""
+
+        self.group.pi = self.user
+        self.group.save()
+        self.assertEqual({'user': 'pi'}, self.get_roles())
+
+    def test_members_added_and_removed(self) -> None:
+        """Test records are updated when users are added to or removed from a group."""
+
+        self.group.members.add(self.user)
+        self.assertEqual({'pi': 'pi', 'user': 'member'}, self.get_roles())
+
+        self.group.admins.add(self.user)
+        self.assertEqual({'pi': 'pi', 'user': 'admin'}, self.get_roles())
+
+        self.group.admins.remove(self.user)
+        self.assertEqual({'pi': 'pi', 'user': 'member'}, self.get_roles())
+
+        self.group.members.clear()
+        self.assertEqual({'pi': 'pi'}, self.get_roles())
+
+    def test_reverse_relations(self) -> None:
+        """Test records are updated when memberships are modified from the user side of the relationship."""
+
+        self.user.research_group_admins.add(self.group)
+        self.assertEqual({'pi': 'pi', 'user': 'admin'}, self.get_roles())
+
+        self.user.research_group_admins.clear()
+        self.assertEqual({'pi': 'pi'}, self.get_roles())
@@ -4,6 +4,8 @@ View objects handle the processing of incoming HTTP requests and return the
 appropriately rendered HTML template or other HTTP response.
 """
 
+from django.contrib.auth.models import Group, Permission
+from django.db.models import Prefetch
 from rest_framework import permissions, viewsets
 from rest_framework.serializers import Serializer
 
@@ -17,7 +19,10 @@ __all__ = ['ResearchGroupViewSet', 'UserViewSet']
 class ResearchGroupViewSet(viewsets.ModelViewSet):
     """Manage user membership in research groups."""
 
-    queryset = ResearchGroup.objects.all()
+    queryset = ResearchGroup.objects.prefetch_related(
+        Prefetch('admins', queryset=User.objects.only('id')),
+        Prefetch('members', queryset=User.objects.only('id')),
+    )
     permission_classes = [permissions.IsAuthenticated, IsGroupAdminOrReadOnly]
     serializer_class = ResearchGroupSerializer
 
@@ -25,7 +30,10 @@ class ResearchGroupViewSet(viewsets.ModelViewSet):
 class UserViewSet(viewsets.ModelViewSet):
     """Manage user account data."""
 
-    queryset = User.objects.all()
+    queryset = User.objects.prefetch_related(
+        Prefetch('groups', queryset=Group.objects.only('id')),
+        Prefetch('user_permissions', queryset=Permission.objects.only('id')),
+    )
     permission_classes = [permissions.IsAuthenticated, IsSelfOrReadOnly]
 
     def get_serializer_class(self) -> type[Serializer]:
@@ -2,4 +2,7 @@
 
 from django.core.asgi import get_asgi_application
 
+from apps.logging.buffers import start_log_buffers
+
 application = get_asgi_application()
+start_log_buffers()
@@ -160,6 +160,8 @@ JAZZMIN_SETTINGS = {
 
 # REST API settings
 
+API_MAX_PAGE_SIZE = env.int('API_MAX_PAGE_SIZE', 1000)
+
 REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated'
@@ -178,6 +180,8 @@ REST_FRAMEWORK = {
     'DEFAULT_FILTER_BACKENDS': (
         'plugins.filter.AdvancedFilterBackend',
     ),
+    'DEFAULT_PAGINATION_CLASS': 'plugins.pagination.DefaultPagination',
+    'PAGE_SIZE': env.int('API_PAGE_SIZE', 100),
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
 }
 
@@ -208,6 +212,12 @@ CELERY_RESULT_EXTENDED = True
 # Email server
 
 EMAIL_FROM_ADDRESS = env.str('EMAIL_FROM_ADDRESS', 'noreply@keystone.bot')
+EMAIL_BATCH_SIZE = env.int('EMAIL_BATCH_SIZE', 100)
+EMAIL_RATE_LIMIT = env.float('EMAIL_RATE_LIMIT', 0)
+EMAIL_MAX_ATTEMPTS = env.int('EMAIL_MAX_ATTEMPTS', 5)
+EMAIL_RETRY_BACKOFF = env.int('EMAIL_RETRY_BACKOFF', 60)
+EMAIL_CLAIM_LEASE = env.int('EMAIL_CLAIM_LEASE', 600)
+EMAIL_QUEUE_RETENTION = env.int('EMAIL_QUEUE_RETENTION', timedelta(days=7).total_seconds())
 if _email_path := env.get_value('DEBUG_EMAIL_DIR', default=None):
     EMAIL_BACKEND = 'django.core.mail.backends.filebased.EmailBackend'
     EMAIL_FILE_PATH = _email_path
@@ -296,17 +306,39 @@ CELERY_ENABLE_UTC = True
 DJANGO_CELERY_BEAT_TZ_AWARE = True
 TIME_ZONE = env.str('CONFIG_TIMEZONE', 'UTC')
 
+# Slurm integration
+
+SLURM_COMMAND_TIMEOUT = env.int('SLURM_COMMAND_TIMEOUT', 300)
+SLURM_COMMAND_RETRIES = env.int('SLURM_COMMAND_RETRIES', 2)
+SLURM_MAX_CONCURRENCY = env.int('SLURM_MAX_CONCURRENCY', 4)
+
 # Logging
 
 CONFIG_LOG_RETENTION = env.int('CONFIG_LOG_RETENTION', timedelta(days=30).total_seconds())
 CONFIG_REQUEST_RETENTION = env.int('CONFIG_REQUEST_RETENTION', timedelta(days=30).total_seconds())
+CONFIG_TASK_RETENTION = env.int('CONFIG_TASK_RETENTION', timedelta(days=30).total_seconds())
+CONFIG_PURGE_BATCH_SIZE = env.int('CONFIG_PURGE_BATCH_SIZE', 10_000)
+CONFIG_PURGE_PAUSE = env.float('CONFIG_PURGE_PAUSE', 0.1)
+CONFIG_LOG_PARTITION_INTERVAL = env.str('CONFIG_LOG_PARTITION_INTERVAL', '')
+CONFIG_LOG_BATCH_SIZE = env.int('CONFIG_LOG_BATCH_SIZE', 100)
+CONFIG_LOG_FLUSH_INTERVAL = env.float('CONFIG_LOG_FLUSH_INTERVAL', 5)
+CONFIG_LOG_BUFFER_LIMIT = env.int('CONFIG_LOG_BUFFER_LIMIT', 10_000)
+CONFIG_REQUEST_BODY_LIMIT = env.int('CONFIG_REQUEST_BODY_LIMIT', 10_240)
+CONFIG_REQUEST_LOG_INCLUDE = env.list('CONFIG_REQUEST_LOG_INCLUDE', default=[])
+CONFIG_REQUEST_LOG_EXCLUDE = env.list('CONFIG_REQUEST_LOG_EXCLUDE', default=['^/health/', '^/metrics/'])
+CONFIG_REQUEST_SAMPLE_RATES = {
+    status_class: float(rate) for status_class, rate in env.dict('CONFIG_REQUEST_SAMPLE_RATES', default=dict()).items()
+}
 
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
     "handlers": {
         "db": {
-            "class": "apps.logging.handlers.DBHandler",
+            "class": "apps.logging.handlers.BufferedDBHandler",
+        },
+        "console": {
+            "class": "logging.StreamHandler",
         }
     },
     "loggers": {
@@ -319,5 +351,11 @@ LOGGING = {
             "handlers": ["db"],
             "propagate": False,
         },
+        # Errors saving buffered log records are not written back to the database
+        "apps.logging.buffers": {
+            "level": "WARNING",
+            "handlers": ["console"],
+            "propagate": False,
+        },
     }
 }
@@ -2,4 +2,7 @@
 
 from django.core.wsgi import get_wsgi_application
 
+from apps.logging.buffers import start_log_buffers
+
 application = get_wsgi_application()
+start_log_buffers()
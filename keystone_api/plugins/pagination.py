@@ -0,0 +1,130 @@
+"""Extends Django REST framework with custom pagination styles.
+
+Pagination classes define how large query results are split across multiple
+API responses. This plugin paginates results using database cursors by
+default, which keeps response times constant as tables grow, while still
+allowing clients to request traditional limit/offset pagination.
+"""
+
+from django.conf import settings
+from django.db.models import QuerySet
+from rest_framework import pagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+__all__ = ['CursorPagination', 'DefaultPagination', 'LimitOffsetPagination']
+
+
+class CursorPagination(pagination.CursorPagination):
+    """Cursor based pagination with a configurable page size.
+
+    Results are ordered by the `ordering` attribute of the paginated view
+    and default to the reverse primary key order.
+    """
+
+    ordering = '-pk'
+    page_size_query_param = 'page_size'
+
+    @property
+    def max_page_size(self) -> int:
+        """The maximum page size clients are allowed to request."""
+
+        return settings.API_MAX_PAGE_SIZE
+
+    def get_ordering(self, request: Request, queryset: QuerySet, view: APIView) -> tuple[str, ...]:
+        """Return the field ordering used to build pagination cursors.
+
+        Args:
+            request: The incoming API request.
+            queryset: The queryset being paginated.
+            view: The view handling the request.
+
+        Returns:
+            A tuple of field names to order by.
+        """
+
+        ordering = getattr(view, 'ordering', None) or self.ordering
+        return (ordering,) if isinstance(ordering, str) else tuple(ordering)
+
+
+class LimitOffsetPagination(pagination.LimitOffsetPagination):
+    """Limit/offset based pagination with a configurable page size."""
+
+    @property
+    def max_limit(self) -> int:
+        """The maximum page size clients are allowed to request."""
+
+        return settings.API_MAX_PAGE_SIZE
+
+
+class DefaultPagination(pagination.BasePagination):
+    """Paginate results using cursors, or using limits and offsets when an `offset` parameter is provided."""
+
+    offset_query_param = 'offset'
+
+    def __init__(self) -> None:
+        self.cursor_paginator = CursorPagination()
+        self.offset_paginator = LimitOffsetPagination()
+        self.paginator = self.cursor_paginator
+
+    def paginate_queryset(self, queryset: QuerySet, request: Request, view: APIView = None) -> list | None:
+        """Return a single page of results.
+
+        Args:
+            queryset: The queryset being paginated.
+            request: The incoming API request.
+            view: The view handling the request.
+
+        Returns:
+            The records on the requested page.
+        """
+
+        if self.offset_query_param in request.query_params:
+            self.paginator = self.offset_paginator
+
+        else:
+            self.paginator = self.cursor_paginator
+
+        return self.paginator.paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data: list) -> Response:
+        """Return a response containing a page of serialized results.
+
+        Args:
+            data: The serialized page of results.
+
+        Returns:
+            The paginated API response.
+        """
+
+        return self.paginator.get_paginated_response(data)
+
+    def get_paginated_response_schema(self, schema: dict) -> dict:
+        """Return the OpenAPI schema of a paginated response.
+
+        Args:
+            schema: The schema of the individual records.
+
+        Returns:
+            The schema of the paginated response.
+        """
+
+        return self.cursor_paginator.get_paginated_response_schema(schema)
+
+    def get_schema_operation_parameters(self, view: APIView) -> list[dict]:
+        """Return the OpenAPI schema of the supported query parameters.
+
+        Args:
+            view: The paginated view.
+
+        Returns:
+            A list of query parameter schemas.
+        """
+
+        parameters = self.cursor_paginator.get_schema_operation_parameters(view)
+        names = {parameter['name'] for parameter in parameters}
+        return parameters + [
+            parameter for parameter in self.offset_paginator.get_schema_operation_parameters(view)
+            if parameter['name'] not in names
+        ]
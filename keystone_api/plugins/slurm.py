@@ -1,43 +1,194 @@
 """Plugin providing wrappers around command line calls to a local Slurm installation"""
 
+import asyncio
 import logging
 import re
+from asyncio.subprocess import PIPE
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from shlex import split
-from subprocess import PIPE, Popen
+from typing import Any, Coroutine, TypeVar
+
+from django.conf import settings
 
 log = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
 __all__ = [
+    'ClusterSnapshot',
+    'LimitUpdateSummary',
+    'async_run_commands',
+    'async_subprocess_call',
     'get_cluster_limit',
+    'get_cluster_limits',
+    'get_cluster_snapshot',
     'get_cluster_usage',
+    'get_cluster_usages',
     'get_slurm_account_names',
     'get_slurm_account_principal_investigator',
     'get_slurm_account_users',
+    'limit_requires_update',
+    'run_commands',
     'set_cluster_limit',
+    'set_cluster_limits',
 ]
 
+# Maximum number of accounts modified by a single `sacctmgr` call
+MAX_ACCOUNTS_PER_COMMAND = 100
+
 
-def subprocess_call(args: list[str]) -> str:
-    """Wrapper method for executing shell commands via ``Popen.communicate``
+async def _execute(args: list[str], timeout: float) -> str:
+    """Execute a single shell command and return its output
 
     Args:
         args: A sequence of program arguments
+        timeout: Maximum number of seconds to wait for the command (0 disables the timeout)
 
     Returns:
         The piped output to STDOUT
+
+    Raises:
+        RuntimeError: If the command times out or exits with a nonzero status
     """
 
-    process = Popen(args, stdout=PIPE, stderr=PIPE)
-    out, err = process.communicate()
+    process = await asyncio.create_subprocess_exec(*args, stdout=PIPE, stderr=PIPE)
+
+    try:
+        out, err = await asyncio.wait_for(process.communicate(), timeout=timeout or None)
+
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        raise RuntimeError(f"Timed out after {timeout} seconds executing shell command: {' '.join(args)}")
 
     if process.returncode != 0:
-        message = f"Error executing shell command: {' '.join(args)} \n {err.decode('utf-8').strip()}"
-        log.error(message)
-        raise RuntimeError(message)
+        raise RuntimeError(f"Error executing shell command: {' '.join(args)} \n {err.decode('utf-8').strip()}")
 
     return out.decode("utf-8").strip()
 
 
+async def async_subprocess_call(
+    args: list[str],
+    timeout: float | None = None,
+    retries: int = 0,
+    backoff: float = 1
+) -> str:
+    """Execute a shell command asynchronously with a timeout and optionally retry on failure
+
+    Failed commands are retried using an exponential backoff. Retries are
+    disabled by default and should only be enabled for commands that are safe
+    to repeat (i.e., read-only queries). The default timeout is taken from
+    application settings.
+
+    Args:
+        args: A sequence of program arguments
+        timeout: Maximum number of seconds to wait for each attempt (0 disables the timeout)
+        retries: Number of times to retry a failed command
+        backoff: Number of seconds to wait before the first retry, doubling after each attempt
+
+    Returns:
+        The piped output to STDOUT
+
+    Raises:
+        RuntimeError: If the command fails after all retries are exhausted
+    """
+
+    timeout = settings.SLURM_COMMAND_TIMEOUT if timeout is None else timeout
+
+    for attempt in range(retries + 1):
+        try:
+            return await _execute(args, timeout)
+
+        except RuntimeError as error:
+            if attempt >= retries:
+                log.error(str(error))
+                raise
+
+            delay = backoff * 2 ** attempt
+            log.warning(f"{error}\nRetrying in {delay} seconds (attempt {attempt + 1} of {retries})")
+            await asyncio.sleep(delay)
+
+
+async def async_run_commands(commands: list[list[str]], max_concurrency: int | None = None, **kwargs) -> list[str]:
+    """Execute multiple shell commands concurrently while limiting the number of simultaneous processes
+
+    Args:
+        commands: A list of argument sequences, one per command
+        max_concurrency: Maximum number of commands to run at once (defaults to application settings)
+        **kwargs: Timeout and retry arguments passed to `async_subprocess_call`
+
+    Returns:
+        The piped output to STDOUT for each command in the order they were given
+    """
+
+    semaphore = asyncio.Semaphore(max_concurrency or settings.SLURM_MAX_CONCURRENCY)
+
+    async def run(args: list[str]) -> str:
+        async with semaphore:
+            return await async_subprocess_call(args, **kwargs)
+
+    return list(await asyncio.gather(*(run(args) for args in commands)))
+
+
+def run_commands(commands: list[list[str]], max_concurrency: int | None = None, **kwargs) -> list[str]:
+    """Synchronous wrapper for executing multiple shell commands concurrently
+
+    Args:
+        commands: A list of argument sequences, one per command
+        max_concurrency: Maximum number of commands to run at once (defaults to application settings)
+        **kwargs: Timeout and retry arguments passed to `async_subprocess_call`
+
+    Returns:
+        The piped output to STDOUT for each command in the order they were given
+    """
+
+    return _run_sync(async_run_commands(commands, max_concurrency, **kwargs))
+
+
+def subprocess_call(args: list[str], **kwargs) -> str:
+    """Synchronous wrapper for executing a single shell command
+
+    Args:
+        args: A sequence of program arguments
+        **kwargs: Timeout and retry arguments passed to `async_subprocess_call`
+
+    Returns:
+        The piped output to STDOUT
+    """
+
+    return _run_sync(async_subprocess_call(args, **kwargs))
+
+
+def _query(args: list[str]) -> str:
+    """Execute a read-only shell command, retrying failures according to application settings"""
+
+    return subprocess_call(args, retries=settings.SLURM_COMMAND_RETRIES)
+
+
+def _run_sync(coroutine: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion from synchronous code
+
+    Coroutines are run in a worker thread when called from within a running
+    event loop (e.g., an async view), since `asyncio.run` cannot be nested.
+
+    Args:
+        coroutine: The coroutine to run
+
+    Returns:
+        The value returned by the coroutine
+    """
+
+    try:
+        asyncio.get_running_loop()
+
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
 def get_slurm_account_names(cluster_name: str | None = None) -> set[str]:
     """Return a list of Slurm account names from `sacctmgr`
 
@@ -52,7 +203,7 @@ def get_slurm_account_names(cluster_name: str | None = None) -> set[str]:
     if cluster_name:
         cmd.append(f"cluster={cluster_name}")
 
-    return set(subprocess_call(cmd).split())
+    return set(_query(cmd).split())
 
 
 def get_slurm_account_principal_investigator(account_name: str) -> str:
@@ -67,7 +218,7 @@ def get_slurm_account_principal_investigator(account_name: str) -> str:
     """
 
     cmd = split(f"sacctmgr show -nP account where account={account_name} format=Descr")
-    return subprocess_call(cmd)
+    return _query(cmd)
 
 
 def get_slurm_account_users(account_name: str, cluster_name: str | None = None) -> set[str]:
@@ -85,7 +236,7 @@ def get_slurm_account_users(account_name: str, cluster_name: str | None = None)
     if cluster_name:
         cmd.append(f"cluster={cluster_name}")
 
-    return set(subprocess_call(cmd).split())
+    return set(_query(cmd).split())
 
 
 def set_cluster_limit(account_name: str, cluster_name: str, limit: int) -> None:
@@ -121,7 +272,7 @@ def get_cluster_limit(account_name: str, cluster_name: str) -> int:
     cmd = split(f"sacctmgr show -nP association where account={account_name} cluster={cluster_name} format=GrpTRESMins")
 
     try:
-        limit = re.findall(r'billing=(.*)', subprocess_call(cmd))[0]
+        limit = re.findall(r'billing=(.*)', _query(cmd))[0]
 
     except IndexError:
         log.debug(f"'billing' limit not found in command output from {cmd}, assuming zero for current limit")
@@ -145,7 +296,7 @@ def get_cluster_usage(account_name: str, cluster_name: str) -> int:
     cmd = split(f"sshare -nP -A {account_name} -M {cluster_name} --format=GrpTRESRaw")
 
     try:
-        usage = re.findall(r'billing=(.*),fs', subprocess_call(cmd))[0]
+        usage = re.findall(r'billing=(.*),fs', _query(cmd))[0]
 
     except IndexError:
         log.debug(f"'billing' usage not found in command output from {cmd}, assuming zero for current usage")
@@ -153,3 +304,267 @@ def get_cluster_usage(account_name: str, cluster_name: str) -> int:
 
     usage = int(usage) if usage.isnumeric() else 0
     return usage // 60  # convert from minutes to hours
+
+
+def parse_billing(tres: str) -> int | None:
+    """Return the billing value in a comma delimited TRES string
+
+    Missing or non-numeric billing values (e.g., an unlimited account) are returned as `None`.
+
+    Args:
+        tres: A TRES string (e.g., `cpu=10,mem=100,billing=120`)
+
+    Returns:
+        The integer billing value or `None` if not set
+    """
+
+    match = re.search(r'(?:^|,)billing=(\d+)(?:,|$)', tres)
+    return int(match.group(1)) if match else None
+
+
+def parse_account_records(output: str) -> list[tuple[str, str]]:
+    """Parse account level TRES values from parsable `sacctmgr`/`sshare` output
+
+    Expects lines formatted as `Account|User|TRES`. Records belonging to
+    individual users and lines without field delimiters (e.g., cluster headers)
+    are ignored.
+
+    Args:
+        output: The command output to parse
+
+    Returns:
+        A list of account names paired with their TRES string
+    """
+
+    records = []
+    for line in output.splitlines():
+        fields = line.split('|')
+        if len(fields) < 3:
+            continue
+
+        account_name, user_name, tres = fields[0].strip(), fields[1].strip(), fields[2]
+        if account_name and not user_name:
+            records.append((account_name, tres))
+
+    return records
+
+
+def parse_account_billing(output: str) -> dict[str, int]:
+    """Parse account level billing values in hours from parsable `sacctmgr`/`sshare` output
+
+    Accounts without a billing value are reported as zero.
+
+    Args:
+        output: The command output to parse
+
+    Returns:
+        A dictionary mapping account names to billing values in hours
+    """
+
+    return {
+        account_name: (parse_billing(tres) or 0) // 60  # convert from minutes to hours
+        for account_name, tres in parse_account_records(output)
+    }
+
+
+def parse_account_limits(output: str) -> dict[str, int]:
+    """Parse account level billing limits in minutes from parsable `sacctmgr` output
+
+    Accounts without a billing limit are omitted from the returned values.
+
+    Args:
+        output: The command output to parse
+
+    Returns:
+        A dictionary mapping account names to billing limits in minutes
+    """
+
+    limits = dict()
+    for account_name, tres in parse_account_records(output):
+        if (limit := parse_billing(tres)) is not None:
+            limits[account_name] = limit
+
+    return limits
+
+
+def _cluster_limits_cmd(cluster_name: str) -> list[str]:
+    """Return the command for fetching GrpTRESMins for all accounts on a cluster"""
+
+    return split(f"sacctmgr show -nP association where cluster={cluster_name} format=Account,User,GrpTRESMins")
+
+
+def _cluster_usages_cmd(cluster_name: str) -> list[str]:
+    """Return the command for fetching GrpTRESRaw for all accounts on a cluster"""
+
+    return split(f"sshare -a -nP -M {cluster_name} --format=Account,User,GrpTRESRaw")
+
+
+@dataclass
+class ClusterSnapshot:
+    """In-memory record of the TRES billing limits and usage for every Slurm account on a cluster
+
+    Limits and usage values are stored in hours. Accounts missing from the
+    snapshot are reported as having a limit/usage of zero. Limits are also
+    kept in minutes (Slurm's native unit), omitting accounts without a
+    billing limit, so writes can be compared against the exact stored value.
+    """
+
+    cluster_name: str
+    limits: dict[str, int] = field(default_factory=dict)
+    usage: dict[str, int] = field(default_factory=dict)
+    limit_minutes: dict[str, int] = field(default_factory=dict)
+
+    def get_limit(self, account_name: str) -> int:
+        """Return the TRES billing usage limit in hours for the given account
+
+        Args:
+            account_name: The name of the Slurm account
+
+        Returns:
+            The account's TRES Billing usage limit in hours
+        """
+
+        return self.limits.get(account_name, 0)
+
+    def get_usage(self, account_name: str) -> int:
+        """Return the total billable usage in hours for the given account
+
+        Args:
+            account_name: The name of the Slurm account
+
+        Returns:
+            The account's total (historical + current) billing TRES hours usage
+        """
+
+        return self.usage.get(account_name, 0)
+
+
+def get_cluster_limits(cluster_name: str) -> dict[str, int]:
+    """Return the current TRES Billing usage limit for every Slurm account on a cluster
+
+    Limits are fetched for all accounts using a single `sacctmgr` call.
+    User level associations are ignored.
+
+    Args:
+        cluster_name: The name of the Slurm cluster
+
+    Returns:
+        A dictionary mapping account names to TRES Billing usage limits in hours
+    """
+
+    return parse_account_billing(_query(_cluster_limits_cmd(cluster_name)))
+
+
+def get_cluster_usages(cluster_name: str) -> dict[str, int]:
+    """Return the total billable usage in hours for every Slurm account on a cluster
+
+    Usage values are fetched for all accounts using a single `sshare` call.
+    User level usage records are ignored.
+
+    Args:
+        cluster_name: The name of the Slurm cluster
+
+    Returns:
+        A dictionary mapping account names to total (historical + current) billing TRES hours usage
+    """
+
+    return parse_account_billing(_query(_cluster_usages_cmd(cluster_name)))
+
+
+def get_cluster_snapshot(cluster_name: str) -> ClusterSnapshot:
+    """Return the TRES Billing limits and usage for every Slurm account on a cluster
+
+    The snapshot is built from one `sacctmgr` call and one `sshare` call,
+    regardless of the number of accounts on the cluster. Both calls are
+    executed concurrently.
+
+    Args:
+        cluster_name: The name of the Slurm cluster
+
+    Returns:
+        A snapshot of the current cluster limits and usage
+    """
+
+    limits_out, usage_out = run_commands(
+        [_cluster_limits_cmd(cluster_name), _cluster_usages_cmd(cluster_name)],
+        retries=settings.SLURM_COMMAND_RETRIES
+    )
+    return ClusterSnapshot(
+        cluster_name=cluster_name,
+        limits=parse_account_billing(limits_out),
+        usage=parse_account_billing(usage_out),
+        limit_minutes=parse_account_limits(limits_out)
+    )
+
+
+def limit_requires_update(current_limits: dict[str, int], account_name: str, limit: int) -> bool:
+    """Return whether writing a TRES Billing usage limit would change an account's stored limit
+
+    Comparisons are made in minutes and accounts without a current billing limit always require an update.
+
+    Args:
+        current_limits: The current account limits in minutes
+        account_name: The name of the Slurm account
+        limit: The new TRES usage limit in hours
+
+    Returns:
+        Whether the account's limit differs from the given value
+    """
+
+    return current_limits.get(account_name) != limit * 60
+
+
+@dataclass
+class LimitUpdateSummary:
+    """Summary of the changes made when updating TRES billing limits in bulk"""
+
+    commands: int = 0  # Number of `sacctmgr` calls issued
+    updated: int = 0  # Number of accounts with modified limits
+    skipped: int = 0  # Number of accounts already at the requested limit
+
+
+def set_cluster_limits(
+    cluster_name: str,
+    limits: dict[str, int],
+    current_limits: dict[str, int] | None = None
+) -> LimitUpdateSummary:
+    """Update the TRES Billing usage limits for multiple Slurm accounts on a cluster
+
+    Requested limits are compared against the current limits and only accounts
+    with a changed limit are modified. Accounts being set to the same limit are
+    grouped together and modified using a single `sacctmgr` call. Comparisons
+    are made in minutes and accounts without a current billing limit are
+    always written.
+
+    Args:
+        cluster_name: The name of the Slurm cluster
+        limits: A dictionary mapping account names to new TRES usage limits in hours
+        current_limits: The current account limits in minutes (fetched from Slurm if not provided)
+
+    Returns:
+        A summary of the issued changes
+    """
+
+    if current_limits is None:
+        current_limits = parse_account_limits(_query(_cluster_limits_cmd(cluster_name)))
+
+    # Group accounts that require a change by their new limit
+    summary = LimitUpdateSummary()
+    accounts_by_limit = dict()
+    for account_name, limit in limits.items():
+        if not limit_requires_update(current_limits, account_name, limit):
+            summary.skipped += 1
+            continue
+
+        accounts_by_limit.setdefault(limit, []).append(account_name)
+
+    for limit, account_names in accounts_by_limit.items():
+        for i in range(0, len(account_names), MAX_ACCOUNTS_PER_COMMAND):
+            batch = ','.join(sorted(account_names[i:i + MAX_ACCOUNTS_PER_COMMAND]))
+            cmd = split(f"sacctmgr modify -i account where account={batch} cluster={cluster_name} set GrpTresMins=billing={limit * 60}")
+            subprocess_call(cmd)
+            summary.commands += 1
+
+        summary.updated += len(account_names)
+
+    return summary
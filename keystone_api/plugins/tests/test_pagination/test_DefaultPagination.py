@@ -0,0 +1,55 @@
+"""Unit tests for the `DefaultPagination` class."""
+
+from django.test import override_settings, TestCase
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from apps.users.models import User
+from plugins.pagination import DefaultPagination
+
+
+class Pagination(TestCase):
+    """Test the selection and behavior of pagination styles."""
+
+    def setUp(self) -> None:
+        """Create test users."""
+
+        User.objects.bulk_create(User(username=f'user{i}') for i in range(5))
+        self.queryset = User.objects.all()
+
+    @staticmethod
+    def paginate(queryset, **params) -> tuple[list, dict]:
+        """Paginate a queryset using the given query parameters and return the page and response data."""
+
+        paginator = DefaultPagination()
+        request = Request(APIRequestFactory().get('/users/', params))
+        page = paginator.paginate_queryset(queryset, request, APIView())
+        return page, paginator.get_paginated_response([]).data
+
+    def test_cursor_pagination_default(self) -> None:
+        """Test results are paginated with cursors in reverse primary key order by default."""
+
+        page, data = self.paginate(self.queryset, page_size=2)
+
+        self.assertEqual(list(self.queryset.order_by('-pk')[:2]), page)
+        self.assertIn('cursor=', data['next'])
+        self.assertNotIn('count', data)
+
+    def test_offset_pagination(self) -> None:
+        """Test results are paginated with offsets when an offset is provided."""
+
+        page, data = self.paginate(self.queryset.order_by('pk'), offset=1, limit=2)
+
+        self.assertEqual(list(self.queryset.order_by('pk')[1:3]), page)
+        self.assertEqual(5, data['count'])
+
+    @override_settings(API_MAX_PAGE_SIZE=3)
+    def test_page_size_capped(self) -> None:
+        """Test requested page sizes are capped at the configured maximum."""
+
+        cursor_page, _ = self.paginate(self.queryset, page_size=100)
+        offset_page, _ = self.paginate(self.queryset.order_by('pk'), offset=0, limit=100)
+
+        self.assertEqual(3, len(cursor_page))
+        self.assertEqual(3, len(offset_page))
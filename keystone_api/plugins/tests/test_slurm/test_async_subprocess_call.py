@@ -0,0 +1,81 @@
+"""Unit tests for the `async_subprocess_call` function."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from django.test import override_settings, TestCase
+
+from plugins.slurm import async_subprocess_call, subprocess_call
+
+
+@override_settings(SLURM_COMMAND_TIMEOUT=5, SLURM_COMMAND_RETRIES=0)
+class CommandExecution(TestCase):
+    """Test the execution of shell commands."""
+
+    def test_output_returned(self) -> None:
+        """Test command output is returned with surrounding whitespace removed."""
+
+        output = asyncio.run(async_subprocess_call(['echo', ' hello world ']))
+        self.assertEqual('hello world', output)
+
+    def test_sync_wrapper(self) -> None:
+        """Test the synchronous wrapper returns the command output."""
+
+        self.assertEqual('hello', subprocess_call(['echo', 'hello']))
+
+    def test_error_on_nonzero_exit(self) -> None:
+        """Test a `RuntimeError` is raised when a command exits with a nonzero status."""
+
+        with self.assertLogs('plugins.slurm', level='ERROR'), self.assertRaisesRegex(RuntimeError, 'Error executing.*'):
+            subprocess_call(['false'])
+
+    def test_sync_wrapper_in_event_loop(self) -> None:
+        """Test the synchronous wrapper can be called from within a running event loop."""
+
+        async def call() -> str:
+            return subprocess_call(['echo', 'hello'])
+
+        self.assertEqual('hello', asyncio.run(call()))
+
+    def test_error_on_timeout(self) -> None:
+        """Test a `RuntimeError` is raised when a command exceeds its timeout."""
+
+        with self.assertLogs('plugins.slurm', level='ERROR'), self.assertRaisesRegex(RuntimeError, 'Timed out.*'):
+            asyncio.run(async_subprocess_call(['sleep', '5'], timeout=0.1))
+
+
+@patch('asyncio.sleep', new_callable=AsyncMock)
+class RetryOnFailure(TestCase):
+    """Test failed commands are retried with an exponential backoff."""
+
+    @override_settings(SLURM_COMMAND_RETRIES=3)
+    @patch('plugins.slurm._execute', new_callable=AsyncMock)
+    def test_no_retries_by_default(self, mock_execute: AsyncMock, mock_sleep: AsyncMock) -> None:
+        """Test commands are not retried unless retries are requested."""
+
+        mock_execute.side_effect = RuntimeError('failed')
+        with self.assertLogs('plugins.slurm', level='ERROR'), self.assertRaises(RuntimeError):
+            subprocess_call(['sacctmgr', 'modify'])
+
+        mock_execute.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    def test_retries_exhausted(self, mock_sleep: AsyncMock) -> None:
+        """Test commands are retried the requested number of times before failing."""
+
+        with self.assertLogs('plugins.slurm', level='WARNING'), self.assertRaises(RuntimeError):
+            asyncio.run(async_subprocess_call(['false'], retries=3, backoff=1))
+
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        self.assertEqual([1, 2, 4], delays)
+
+    @patch('plugins.slurm._execute', new_callable=AsyncMock)
+    def test_success_after_retry(self, mock_execute: AsyncMock, mock_sleep: AsyncMock) -> None:
+        """Test the command output is returned when a retry succeeds."""
+
+        mock_execute.side_effect = [RuntimeError('failed'), 'output']
+        with self.assertLogs('plugins.slurm', level='WARNING'):
+            output = asyncio.run(async_subprocess_call(['sacctmgr'], retries=1))
+
+        self.assertEqual('output', output)
+        self.assertEqual(2, mock_execute.call_count)
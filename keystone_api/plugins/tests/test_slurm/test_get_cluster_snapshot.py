@@ -0,0 +1,88 @@
+"""Unit tests for the `get_cluster_snapshot` function."""
+
+from unittest.mock import Mock, patch
+
+from django.test import TestCase
+
+from plugins.slurm import get_cluster_snapshot
+
+SACCTMGR_OUTPUT = '\n'.join([
+    'root||',
+    'account1||billing=6000',
+    'account1|user1|billing=600',
+    'account2||cpu=100,billing=120,mem=50',
+    'account3||',
+])
+
+SSHARE_OUTPUT = '\n'.join([
+    'CLUSTER: cluster1',
+    'root||cpu=0,billing=0,fs/disk=0',
+    ' account1||cpu=100,mem=0,billing=3000,fs/disk=0',
+    '  account1|user1|cpu=100,mem=0,billing=3000,fs/disk=0',
+    ' account2||cpu=100,mem=0,billing=60,fs/disk=0',
+])
+
+
+class ParseSlurmOutput(TestCase):
+    """Test the parsing of account limits and usage from Slurm output."""
+
+    def setUp(self) -> None:
+        """Build a cluster snapshot from mocked command output."""
+
+        def mock_run(commands: list[list[str]], **kwargs) -> list[str]:
+            return [SACCTMGR_OUTPUT if args[0] == 'sacctmgr' else SSHARE_OUTPUT for args in commands]
+
+        with patch('plugins.slurm.run_commands', side_effect=mock_run) as self.mock_run:
+            self.snapshot = get_cluster_snapshot('cluster1')
+
+    def test_single_call_per_command(self) -> None:
+        """Test Slurm is only queried once per command regardless of the number of accounts."""
+
+        self.mock_run.assert_called_once()
+        commands = [args[0] for args in self.mock_run.call_args.args[0]]
+        self.assertCountEqual(['sacctmgr', 'sshare'], commands)
+
+    def test_limits_converted_to_hours(self) -> None:
+        """Test account limits are parsed and converted from minutes to hours."""
+
+        self.assertEqual(100, self.snapshot.get_limit('account1'))
+        self.assertEqual(2, self.snapshot.get_limit('account2'))
+
+    def test_limits_kept_in_minutes(self) -> None:
+        """Test account limits are also kept in minutes, omitting accounts without a billing limit."""
+
+        self.assertEqual({'account1': 6000, 'account2': 120}, self.snapshot.limit_minutes)
+
+    def test_usage_converted_to_hours(self) -> None:
+        """Test account usage is parsed and converted from minutes to hours."""
+
+        self.assertEqual(50, self.snapshot.get_usage('account1'))
+        self.assertEqual(1, self.snapshot.get_usage('account2'))
+
+    def test_missing_values_default_to_zero(self) -> None:
+        """Test accounts without a billing value, or missing entirely, default to zero."""
+
+        self.assertEqual(0, self.snapshot.get_limit('account3'))
+        self.assertEqual(0, self.snapshot.get_usage('account3'))
+        self.assertEqual(0, self.snapshot.get_limit('missing'))
+        self.assertEqual(0, self.snapshot.get_usage('missing'))
+
+    def test_user_records_ignored(self) -> None:
+        """Test user level associations are not treated as accounts."""
+
+        self.assertNotIn('user1', self.snapshot.limits)
+        self.assertNotIn('user1', self.snapshot.usage)
+        self.assertNotIn('CLUSTER: cluster1', self.snapshot.usage)
+
+
+class SnapshotCluster(TestCase):
+    """Test snapshot metadata."""
+
+    @patch('plugins.slurm.run_commands', Mock(return_value=['', '']))
+    def test_cluster_name(self) -> None:
+        """Test the snapshot records the name of the cluster it was taken from."""
+
+        snapshot = get_cluster_snapshot('cluster1')
+        self.assertEqual('cluster1', snapshot.cluster_name)
+        self.assertFalse(snapshot.limits)
+        self.assertFalse(snapshot.usage)
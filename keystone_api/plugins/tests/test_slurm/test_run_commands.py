@@ -0,0 +1,37 @@
+"""Unit tests for the `run_commands` function."""
+
+import asyncio
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from plugins.slurm import run_commands
+
+
+class ConcurrentExecution(TestCase):
+    """Test the concurrent execution of multiple commands."""
+
+    def test_output_order_preserved(self) -> None:
+        """Test command outputs are returned in the same order as the input commands."""
+
+        outputs = run_commands([['echo', str(i)] for i in range(5)], max_concurrency=2, timeout=5, retries=0)
+        self.assertEqual(['0', '1', '2', '3', '4'], outputs)
+
+    def test_concurrency_limit(self) -> None:
+        """Test the number of simultaneously running commands does not exceed the concurrency limit."""
+
+        running = 0
+        max_running = 0
+
+        async def mock_call(args: list[str], **kwargs) -> str:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return ''
+
+        with patch('plugins.slurm.async_subprocess_call', side_effect=mock_call):
+            run_commands([['cmd']] * 10, max_concurrency=3)
+
+        self.assertEqual(3, max_running)
@@ -0,0 +1,114 @@
+"""Unit tests for the `set_cluster_limits` function."""
+
+from unittest.mock import Mock, patch
+
+from django.test import override_settings, TestCase
+
+from plugins.slurm import set_cluster_limits
+
+
+@patch('plugins.slurm.subprocess_call')
+class DiffOnlyUpdates(TestCase):
+    """Test limits are only written for accounts with changed values."""
+
+    def test_unchanged_limits_skipped(self, mock_call: Mock) -> None:
+        """Test no commands are issued when all limits match their current values."""
+
+        summary = set_cluster_limits('cluster1', {'account1': 10, 'account2': 20}, {'account1': 600, 'account2': 1200})
+
+        mock_call.assert_not_called()
+        self.assertEqual(0, summary.commands)
+        self.assertEqual(0, summary.updated)
+        self.assertEqual(2, summary.skipped)
+
+    def test_changed_limits_written(self, mock_call: Mock) -> None:
+        """Test a command is issued for accounts with a changed limit."""
+
+        summary = set_cluster_limits('cluster1', {'account1': 10, 'account2': 30}, {'account1': 600, 'account2': 1200})
+
+        mock_call.assert_called_once()
+        command = ' '.join(mock_call.call_args.args[0])
+        self.assertIn('account=account2 ', command)
+        self.assertIn('cluster=cluster1', command)
+        self.assertIn('GrpTresMins=billing=1800', command)
+        self.assertEqual(1, summary.commands)
+        self.assertEqual(1, summary.updated)
+        self.assertEqual(1, summary.skipped)
+
+    def test_missing_accounts_written(self, mock_call: Mock) -> None:
+        """Test accounts without a current limit are always written."""
+
+        summary = set_cluster_limits('cluster1', {'account1': 10}, {})
+
+        mock_call.assert_called_once()
+        self.assertEqual(1, summary.updated)
+
+    def test_unlimited_accounts_written(self, mock_call: Mock) -> None:
+        """Test accounts without a billing limit are written even when the new limit is zero."""
+
+        mock_call.return_value = 'account1||'
+        summary = set_cluster_limits('cluster1', {'account1': 0})
+
+        self.assertEqual(2, mock_call.call_count)
+        self.assertIn('GrpTresMins=billing=0', ' '.join(mock_call.call_args.args[0]))
+        self.assertEqual(1, summary.commands)
+        self.assertEqual(0, summary.skipped)
+
+    def test_limits_compared_in_minutes(self, mock_call: Mock) -> None:
+        """Test limits are compared in minutes instead of truncated hours."""
+
+        summary = set_cluster_limits('cluster1', {'account1': 100}, {'account1': 6030})
+
+        mock_call.assert_called_once()
+        self.assertIn('GrpTresMins=billing=6000', ' '.join(mock_call.call_args.args[0]))
+        self.assertEqual(1, summary.updated)
+
+    def test_current_limits_fetched(self, mock_call: Mock) -> None:
+        """Test current limits are fetched from Slurm when not provided."""
+
+        mock_call.return_value = 'account1||billing=600'
+        summary = set_cluster_limits('cluster1', {'account1': 10})
+
+        mock_call.assert_called_once()
+        self.assertIn('sacctmgr show', ' '.join(mock_call.call_args.args[0]))
+        self.assertEqual(1, summary.skipped)
+
+
+@patch('plugins.slurm.subprocess_call')
+class BatchedUpdates(TestCase):
+    """Test accounts sharing the same limit are written together."""
+
+    def test_accounts_grouped_by_limit(self, mock_call: Mock) -> None:
+        """Test one command is issued per distinct limit value."""
+
+        limits = {'account1': 10, 'account2': 10, 'account3': 20}
+        summary = set_cluster_limits('cluster1', limits, {})
+
+        commands = [' '.join(call.args[0]) for call in mock_call.call_args_list]
+        self.assertEqual(2, len(commands))
+        self.assertIn('account=account1,account2 ', commands[0])
+        self.assertIn('account=account3 ', commands[1])
+        self.assertEqual(2, summary.commands)
+        self.assertEqual(3, summary.updated)
+
+    @patch('plugins.slurm.MAX_ACCOUNTS_PER_COMMAND', 2)
+    def test_large_groups_split(self, mock_call: Mock) -> None:
+        """Test groups larger than the maximum command size are split across commands."""
+
+        limits = {f'account{i}': 10 for i in range(5)}
+        summary = set_cluster_limits('cluster1', limits, {})
+
+        self.assertEqual(3, mock_call.call_count)
+        self.assertEqual(3, summary.commands)
+        self.assertEqual(5, summary.updated)
+
+    @override_settings(SLURM_COMMAND_RETRIES=2)
+    def test_only_queries_retried(self, mock_call: Mock) -> None:
+        """Test retries are enabled when fetching current limits but not when modifying them."""
+
+        mock_call.return_value = ''
+        set_cluster_limits('cluster1', {'account1': 10})
+
+        query, modify = mock_call.call_args_list
+        self.assertEqual({'retries': 2}, query.kwargs)
+        self.assertEqual({}, modify.kwargs)
@@ -3,8 +3,9 @@
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+from apps.allocations.models import Allocation, AllocationRequest, Cluster
 from apps.users.models import User
-from tests.utils import CustomAsserts
+from tests.utils import CustomAsserts, QueryBudgetTests
 
 
 class EndpointPermissions(APITestCase, CustomAsserts):
@@ -73,3 +74,23 @@ class EndpointPermissions(APITestCase, CustomAsserts):
             trace=status.HTTP_405_METHOD_NOT_ALLOWED,
             post_body={'requested': 1000, 'cluster': 1, 'request': 1}
         )
+
+
+class QueryBudget(APITestCase, QueryBudgetTests):
+    """Test list requests execute a constant number of database queries.
+
+    The number of queries must not exceed the endpoint budget or grow with the number of returned records.
+    """
+
+    endpoint = '/allocations/allocations/'
+    fixtures = ['multi_research_group.yaml']
+    budget = 2
+
+    def create_records(self) -> None:
+        """Create additional allocations for every research group."""
+
+        cluster = Cluster.objects.get(pk=1)
+        for request in AllocationRequest.objects.all():
+            Allocation.objects.bulk_create(
+                Allocation(request=request, cluster=cluster, requested=1000) for _ in range(10)
+            )
@@ -3,8 +3,9 @@
 from rest_framework import status
 from rest_framework.test import APITestCase
 
-from apps.users.models import User
-from tests.utils import CustomAsserts
+from apps.allocations.models import AllocationRequest
+from apps.users.models import ResearchGroup, User
+from tests.utils import CustomAsserts, QueryBudgetTests
 
 
 class EndpointPermissions(APITestCase, CustomAsserts):
@@ -138,3 +139,23 @@ class EndpointPermissions(APITestCase, CustomAsserts):
             trace=status.HTTP_405_METHOD_NOT_ALLOWED,
             post_body={'title': 'foo', 'description': 'bar', 'group': 1}
         )
+
+
+class QueryBudget(APITestCase, QueryBudgetTests):
+    """Test list requests execute a constant number of database queries.
+
+    The number of queries must not exceed the endpoint budget or grow with the number of returned records.
+    """
+
+    endpoint = '/allocations/requests/'
+    fixtures = ['multi_research_group.yaml']
+    budget = 3
+
+    def create_records(self) -> None:
+        """Create additional allocation requests for every research group."""
+
+        users = User.objects.all()
+        for group in ResearchGroup.objects.all():
+            for _ in range(10):
+                request = AllocationRequest.objects.create(title='Request', description='Text', group=group)
+                request.assignees.set(users)
@@ -3,8 +3,9 @@
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+from apps.allocations.models import AllocationRequest, AllocationRequestReview
 from apps.users.models import User
-from tests.utils import CustomAsserts
+from tests.utils import CustomAsserts, QueryBudgetTests
 
 
 class EndpointPermissions(APITestCase, CustomAsserts):
@@ -113,3 +114,23 @@ class ReviewerAssignment(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('reviewer', response.data)
         self.assertEqual('reviewer cannot be set to a different user than the submitter', response.data['reviewer'][0].lower())
+
+
+class QueryBudget(APITestCase, QueryBudgetTests):
+    """Test list requests execute a constant number of database queries.
+
+    The number of queries must not exceed the endpoint budget or grow with the number of returned records.
+    """
+
+    endpoint = '/allocations/reviews/'
+    fixtures = ['multi_research_group.yaml']
+    budget = 2
+
+    def create_records(self) -> None:
+        """Create additional allocation request reviews for every research group."""
+
+        reviewer = User.objects.get(username='staff_user')
+        for request in AllocationRequest.objects.all():
+            AllocationRequestReview.objects.bulk_create(
+                AllocationRequestReview(request=request, reviewer=reviewer, status='AP') for _ in range(10)
+            )
@@ -0,0 +1,11 @@
+"""Performance budgets for API endpoints and notification rendering.
+
+Query counts and rendering correctness are always checked. Wall clock
+budgets depend on the host machine and are only enforced when the
+`BUDGET_TIMING` environment variable is enabled.
+"""
+
+import environ
+
+env = environ.Env()
+TIMING_ENABLED = env.bool('BUDGET_TIMING', False)
@@ -0,0 +1,248 @@
+"""Query count and response time budgets for API endpoints.
+
+Every list and detail endpoint registered with an application router is
+requested against a large synthetic dataset. The number of executed SQL
+queries and the response time of each request are compared against the
+limits defined in `budgets.json`. Endpoints without a defined budget fail
+so new endpoints are budgeted when they are added.
+
+Budgets apply to whichever database backend the tests are run against.
+Response times are only compared against their budget when the
+`BUDGET_TIMING` environment variable is enabled. The size of the dataset
+is set using the `BUDGET_RECORD_COUNT` environment variable. Set the
+`BUDGET_REPORT` environment variable to a file path to write the measured
+values as JSON.
+"""
+
+import json
+import os
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import get_resolver, reverse, URLPattern, URLResolver
+from rest_framework.test import APITestCase
+
+from apps.allocations.models import Allocation, AllocationRequest, AllocationRequestReview, Cluster
+from apps.logging.models import AppLog, RequestLog, TaskResult
+from apps.research_products.models import Grant, Publication
+from apps.users.models import GroupMembership, ResearchGroup, User
+from . import env, TIMING_ENABLED
+
+BUDGET_FILE = Path(__file__).with_name('budgets.json')
+RECORD_COUNT = env.int('BUDGET_RECORD_COUNT', 2_000)  # Number of synthetic records created per database table
+REPEAT = 3  # Number of times each endpoint is requested
+
+
+def get_router_endpoints() -> dict[str, str | None]:
+    """Return the URL names of all list endpoints registered with a router.
+
+    Returns:
+        A dictionary mapping list endpoint names to the name of the corresponding detail endpoint, if any.
+    """
+
+    names = set()
+
+    def collect(resolver: URLResolver, namespace: str) -> None:
+        for pattern in resolver.url_patterns:
+            if isinstance(pattern, URLResolver):
+                collect(pattern, f'{namespace}{pattern.namespace}:' if pattern.namespace else namespace)
+
+            elif isinstance(pattern, URLPattern) and pattern.name and hasattr(pattern.callback, 'actions'):
+                names.add(namespace + pattern.name)
+
+    collect(get_resolver(), '')
+    return {
+        name: name.removesuffix('-list') + '-detail' if name.removesuffix('-list') + '-detail' in names else None
+        for name in sorted(names) if name.endswith('-list')
+    }
+
+
+class EndpointBudgets(APITestCase):
+    """Test API endpoints stay within their query count and response time budgets."""
+
+    budgets: dict[str, dict[str, float]]
+    measurements: dict[str, dict[str, float]] = dict()
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Load endpoint budgets from disk."""
+
+        super().setUpClass()
+        cls.budgets = json.loads(BUDGET_FILE.read_text())
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Write measured values to disk if a report path is configured."""
+
+        if report := os.environ.get('BUDGET_REPORT'):
+            Path(report).write_text(json.dumps(cls.measurements, indent=2, sort_keys=True))
+
+        super().tearDownClass()
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Populate the database with synthetic records."""
+
+        cls.staff_user = User.objects.create(username='budget_staff', is_staff=True)
+        users = User.objects.bulk_create(User(username=f'user{i}', email=f'user{i}@domain.com') for i in range(RECORD_COUNT))
+        clusters = Cluster.objects.bulk_create(Cluster(name=f'cluster{i}') for i in range(5))
+
+        groups = ResearchGroup.objects.bulk_create(
+            ResearchGroup(name=f'group{i}', pi=users[i]) for i in range(RECORD_COUNT // 5)
+        )
+        ResearchGroup.admins.through.objects.bulk_create(
+            ResearchGroup.admins.through(researchgroup=group, user=users[-i - 1]) for i, group in enumerate(groups)
+        )
+        ResearchGroup.members.through.objects.bulk_create(
+            ResearchGroup.members.through(researchgroup=group, user=user)
+            for group in groups for user in users[:20]
+        )
+        GroupMembership.objects.rebuild()
+        cls.member_user = users[0]
+
+        requests = AllocationRequest.objects.bulk_create(
+            AllocationRequest(
+                title=f'request{i}',
+                description='Description text. ' * 50,
+                group=groups[i % len(groups)],
+                active=date.today(),
+                expire=date.today() + timedelta(days=365)
+            ) for i in range(RECORD_COUNT)
+        )
+        AllocationRequest.assignees.through.objects.bulk_create(
+            AllocationRequest.assignees.through(allocationrequest=request, user=user)
+            for request in requests for user in users[:3]
+        )
+        AllocationRequestReview.objects.bulk_create(
+            AllocationRequestReview(request=request, reviewer=cls.staff_user, status='AP') for request in requests
+        )
+        Allocation.objects.bulk_create(
+            Allocation(request=request, cluster=cluster, requested=1000, awarded=1000)
+            for request in requests for cluster in clusters[:2]
+        )
+
+        Grant.objects.bulk_create(
+            Grant(
+                title=f'grant{i}',
+                agency='Agency',
+                amount=1000,
+                grant_number=f'grant-{i}',
+                fiscal_year=2000,
+                start_date=date(2000, 1, 1),
+                end_date=date(2001, 1, 1),
+                group=groups[i % len(groups)]
+            ) for i in range(RECORD_COUNT)
+        )
+        Publication.objects.bulk_create(
+            Publication(
+                title=f'publication{i}',
+                abstract='Abstract text. ' * 50,
+                date=date(2000, 1, 1),
+                journal='Journal',
+                group=groups[i % len(groups)]
+            ) for i in range(RECORD_COUNT)
+        )
+
+        AppLog.objects.bulk_create(
+            AppLog(name='keystone', level='INFO', pathname='/path', lineno=1, message=f'message{i}')
+            for i in range(RECORD_COUNT)
+        )
+        RequestLog.objects.bulk_create(
+            RequestLog(
+                method='GET',
+                endpoint='/endpoint/',
+                response_code=200,
+                body_request='',
+                body_response='{}',
+                user=users[i % len(users)]
+            ) for i in range(RECORD_COUNT)
+        )
+        TaskResult.objects.bulk_create(
+            TaskResult(task_id=f'task{i}', task_name='task', status='SUCCESS') for i in range(RECORD_COUNT)
+        )
+
+    def measure(self, endpoint: str) -> dict:
+        """Request an endpoint and record the number of executed queries and the response time.
+
+        Args:
+            endpoint: The partial URL endpoint to request.
+
+        Returns:
+            A dictionary with the query count, the fastest response time in seconds, and the final response.
+        """
+
+        seconds = float('inf')
+        for _ in range(REPEAT):
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                response = self.client.get(endpoint)
+                seconds = min(seconds, time.perf_counter() - start)
+
+            self.assertLess(response.status_code, 500, f'GET request to {endpoint} returned {response.status_code}')
+
+        return {'queries': len(queries), 'seconds': seconds, 'response': response}
+
+    def assert_within_budget(self, name: str, measurement: dict) -> None:
+        """Assert an endpoint measurement is within the endpoint budget.
+
+        Response times are only checked when timing budgets are enabled.
+
+        Args:
+            name: The URL name of the measured endpoint.
+            measurement: The measured query count and response time.
+        """
+
+        self.assertIn(name, self.budgets, f'No budget is defined for endpoint {name} in {BUDGET_FILE.name}')
+        budget = self.budgets[name]
+
+        self.assertLessEqual(
+            measurement['queries'], budget['queries'],
+            f'{name} executed {measurement["queries"]} queries, exceeding the budget of {budget["queries"]}')
+
+        if not TIMING_ENABLED:
+            return
+
+        self.assertLessEqual(
+            measurement['seconds'], budget['seconds'],
+            f'{name} took {measurement["seconds"]:.3f}s, exceeding the budget of {budget["seconds"]}s')
+
+    def assert_endpoint_budgets(self, user: User, label: str) -> None:
+        """Assert all router endpoints are within budget when requested by the given user.
+
+        Args:
+            user: The user submitting requests.
+            label: A label identifying the user in recorded measurements.
+        """
+
+        self.client.force_authenticate(user=user)
+        for list_name, detail_name in get_router_endpoints().items():
+            results = []
+            with self.subTest(endpoint=list_name):
+                measurement = self.measure(reverse(list_name))
+                self.measurements[f'{label}:{list_name}'] = {k: measurement[k] for k in ('queries', 'seconds')}
+                if measurement['response'].status_code == 200:
+                    results = measurement['response'].json()['results']
+
+                self.assert_within_budget(list_name, measurement)
+
+            # Detail endpoints are measured against the first record visible to the user
+            if detail_name is None or not results:
+                continue
+
+            with self.subTest(endpoint=detail_name):
+                measurement = self.measure(reverse(detail_name, kwargs={'pk': results[0]['id']}))
+                self.measurements[f'{label}:{detail_name}'] = {k: measurement[k] for k in ('queries', 'seconds')}
+                self.assert_within_budget(detail_name, measurement)
+
+    def test_staff_user_budgets(self) -> None:
+        """Test endpoints are within budget for staff users."""
+
+        self.assert_endpoint_budgets(self.staff_user, 'staff')
+
+    def test_group_member_budgets(self) -> None:
+        """Test endpoints are within budget for research group members."""
+
+        self.assert_endpoint_budgets(self.member_user, 'member')
@@ -0,0 +1,86 @@
+"""Rendering throughput benchmark for notification email templates.
+
+Notifications are rendered in a single batch for many recipients and
+compared against the output of the uncached `render_to_string` approach.
+When timing budgets are enabled, the number of renders per second is also
+compared against a minimum throughput. The rate of the uncached approach
+is measured alongside for comparison and included in the failure message.
+"""
+
+import time
+from datetime import date, timedelta
+from unittest import skipUnless
+
+from django.template.loader import render_to_string
+from django.test import SimpleTestCase
+
+from apps.allocations.models import AllocationRequest
+from apps.allocations.shortcuts import build_notifications_upcoming_expiration
+from apps.notifications.rendering import load_notification_templates
+from apps.users.models import User
+from . import TIMING_ENABLED
+
+RENDER_COUNT = 2_000  # Number of notifications rendered per measurement
+MIN_RENDERS_PER_SECOND = 1_000  # Minimum accepted throughput of batch rendering
+
+
+class RenderingThroughput(SimpleTestCase):
+    """Test batch rendering of notifications is correct and stays above the minimum throughput."""
+
+    def setUp(self) -> None:
+        """Create unsaved users and allocation requests to render notifications for."""
+
+        load_notification_templates()
+        self.plan = [
+            (
+                User(username=f'user{i}', first_name='First', last_name=f'Last{i}'),
+                AllocationRequest(id=i, title=f'Request {i}', expire=date.today() + timedelta(days=10)),
+                14
+            ) for i in range(RENDER_COUNT)
+        ]
+
+    def render_uncached(self) -> list[tuple[str, str]]:
+        """Return the HTML and plain text content rendered by resolving templates separately for every user."""
+
+        rendered = []
+        for user, request, _ in self.plan:
+            context = {'user': user, 'request': request, 'days_to_expire': request.get_days_until_expire()}
+            html = render_to_string('upcoming_expiration_email.html', context, using='jinja2')
+            text = render_to_string('upcoming_expiration_email.txt', context, using='jinja2')
+            rendered.append((html, text))
+
+        return rendered
+
+    def measure_uncached(self) -> float:
+        """Return the renders per second achieved without compiled template caching."""
+
+        start = time.perf_counter()
+        self.render_uncached()
+        return RENDER_COUNT / (time.perf_counter() - start)
+
+    def test_cached_output_matches_uncached(self) -> None:
+        """Test batch rendering of compiled templates produces the same content as uncached rendering."""
+
+        notifications, failures = build_notifications_upcoming_expiration(self.plan)
+
+        self.assertEqual([], failures)
+        self.assertEqual(RENDER_COUNT, len(notifications))
+        self.assertEqual(
+            self.render_uncached(),
+            [(notification.html_text, notification.plain_text) for notification in notifications]
+        )
+
+    @skipUnless(TIMING_ENABLED, 'Timing budgets are only checked when BUDGET_TIMING is enabled')
+    def test_renders_per_second(self) -> None:
+        """Test batch rendering of compiled templates meets the minimum throughput."""
+
+        start = time.perf_counter()
+        notifications, failures = build_notifications_upcoming_expiration(self.plan)
+        renders_per_second = RENDER_COUNT / (time.perf_counter() - start)
+
+        self.assertEqual([], failures)
+        self.assertEqual(RENDER_COUNT, len(notifications))
+        self.assertGreaterEqual(
+            renders_per_second, MIN_RENDERS_PER_SECOND,
+            f'Rendered {renders_per_second:.0f} notifications per second (uncached: {self.measure_uncached():.0f})'
+        )
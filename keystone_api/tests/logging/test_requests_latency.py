@@ -0,0 +1,111 @@
+"""Function tests for the `/logs/requests/latency/` endpoint."""
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.logging.models import RequestLog
+from apps.users.models import User
+from tests.utils import CustomAsserts
+
+
+class EndpointPermissions(APITestCase, CustomAsserts):
+    """Test endpoint user permissions.
+
+    Endpoint permissions are tested against the following matrix of HTTP responses.
+
+    | Authentication      | GET | HEAD | OPTIONS | POST | PUT | PATCH | DELETE | TRACE |
+    |---------------------|-----|------|---------|------|-----|-------|--------|-------|
+    | Anonymous User      | 403 | 403  | 403     | 403  | 403 | 403   | 403    | 403   |
+    | Authenticated User  | 403 | 403  | 403     | 403  | 403 | 403   | 403    | 403   |
+    | Staff User          | 200 | 200  | 200     | 405  | 405 | 405   | 405    | 405   |
+    """
+
+    endpoint = '/logs/requests/latency/'
+    fixtures = ['multi_research_group.yaml']
+
+    def test_anonymous_user_permissions(self) -> None:
+        """Test unauthenticated users cannot access resources."""
+
+        self.assert_http_responses(
+            self.endpoint,
+            get=status.HTTP_403_FORBIDDEN,
+            head=status.HTTP_403_FORBIDDEN,
+            options=status.HTTP_403_FORBIDDEN,
+            post=status.HTTP_403_FORBIDDEN,
+            put=status.HTTP_403_FORBIDDEN,
+            patch=status.HTTP_403_FORBIDDEN,
+            delete=status.HTTP_403_FORBIDDEN,
+            trace=status.HTTP_403_FORBIDDEN
+        )
+
+    def test_authenticated_user_permissions(self) -> None:
+        """Test general authenticated users are returned a 403 status code for all request types."""
+
+        user = User.objects.get(username='generic_user')
+        self.client.force_authenticate(user=user)
+
+        self.assert_http_responses(
+            self.endpoint,
+            get=status.HTTP_403_FORBIDDEN,
+            head=status.HTTP_403_FORBIDDEN,
+            options=status.HTTP_403_FORBIDDEN,
+            post=status.HTTP_403_FORBIDDEN,
+            put=status.HTTP_403_FORBIDDEN,
+            patch=status.HTTP_403_FORBIDDEN,
+            delete=status.HTTP_403_FORBIDDEN,
+            trace=status.HTTP_403_FORBIDDEN
+        )
+
+    def test_staff_user_permissions(self) -> None:
+        """Test staff users have read-only permissions."""
+
+        user = User.objects.get(username='staff_user')
+        self.client.force_authenticate(user=user)
+
+        self.assert_http_responses(
+            self.endpoint,
+            get=status.HTTP_200_OK,
+            head=status.HTTP_200_OK,
+            options=status.HTTP_200_OK,
+            post=status.HTTP_405_METHOD_NOT_ALLOWED,
+            put=status.HTTP_405_METHOD_NOT_ALLOWED,
+            patch=status.HTTP_405_METHOD_NOT_ALLOWED,
+            delete=status.HTTP_405_METHOD_NOT_ALLOWED,
+            trace=status.HTTP_405_METHOD_NOT_ALLOWED
+        )
+
+
+class LatencyReport(APITestCase):
+    """Test the content of latency reports."""
+
+    endpoint = '/logs/requests/latency/'
+    fixtures = ['multi_research_group.yaml']
+
+    def setUp(self) -> None:
+        """Authenticate as a staff user."""
+
+        self.client.force_authenticate(user=User.objects.get(username='staff_user'))
+
+    def test_report_contents(self) -> None:
+        """Test the report includes latency percentiles for logged routes."""
+
+        RequestLog.objects.create(
+            endpoint='/users/', route='users/', response_code=200, body_request='', body_response='', duration=0.5
+        )
+
+        response = self.client.get(self.endpoint, {'hours': 1})
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual([{'route': 'users/', 'count': 1, 'p50': 0.5, 'p95': 0.5, 'p99': 0.5}], response.json())
+
+    def test_invalid_window(self) -> None:
+        """Test an invalid time window returns a 400 error."""
+
+        response = self.client.get(self.endpoint, {'hours': 0})
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+
+    def test_window_too_large(self) -> None:
+        """Test time windows larger than the supported maximum return a 400 error."""
+
+        response = self.client.get(self.endpoint, {'hours': 10 ** 12})
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
@@ -5,8 +5,9 @@ from datetime import date
 from rest_framework import status
 from rest_framework.test import APITestCase
 
-from apps.users.models import User
-from tests.utils import CustomAsserts
+from apps.research_products.models import Grant
+from apps.users.models import ResearchGroup, User
+from tests.utils import CustomAsserts, QueryBudgetTests
 
 
 class EndpointPermissions(APITestCase, CustomAsserts):
@@ -146,3 +147,25 @@ class EndpointPermissions(APITestCase, CustomAsserts):
             trace=status.HTTP_405_METHOD_NOT_ALLOWED,
             post_body=self.valid_record_data
         )
+
+
+class QueryBudget(APITestCase, QueryBudgetTests):
+    """Test list requests execute a constant number of database queries.
+
+    The number of queries must not exceed the endpoint budget or grow with the number of returned records.
+    """
+
+    endpoint = '/research/grants/'
+    fixtures = ['multi_research_group.yaml']
+    budget = 2
+
+    def create_records(self) -> None:
+        """Create additional grants for every research group."""
+
+        for group in ResearchGroup.objects.all():
+            Grant.objects.bulk_create(
+                Grant(
+                    title=f'Grant {i}', agency='Agency', amount=1000, grant_number=f'{group.pk}-{i}',
+                    fiscal_year=2001, start_date=date(2000, 1, 1), end_date=date(2000, 1, 31), group=group
+                ) for i in range(10)
+            )
@@ -125,9 +125,9 @@ class CredentialHandling(APITestCase):
 
         response = self.client.get('/users/users/')
         self.assertEqual(status.HTTP_200_OK, response.status_code)
-        self.assertTrue(response.json())
+        self.assertTrue(response.json()['results'])
 
-        for record in response.json():
+        for record in response.json()['results']:
             self.assertNotIn('password', record.keys(), f'Password field found in record: {record}')
 
     def test_passwords_validated(self) -> None:
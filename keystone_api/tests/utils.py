@@ -1,7 +1,12 @@
 """Custom testing utilities used to streamline common tests."""
 
-from django.db import transaction
+from abc import ABC, abstractmethod
+
+from django.db import connection, transaction
 from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from apps.users.models import User
 
 
 class CustomAsserts:
@@ -9,6 +14,7 @@ class CustomAsserts:
 
     client: Client
     assertEqual: callable
+    assertLessEqual: callable
 
     def assert_http_responses(self, endpoint: str, **kwargs) -> None:
         """Execute a series of API calls and assert the returned status matches the given values.
@@ -26,6 +32,28 @@ class CustomAsserts:
             if expected_status is not None:
                 self._assert_http_response(method, endpoint, expected_status, kwargs)
 
+    def assert_query_budget(self, endpoint: str, budget: int) -> int:
+        """Execute a GET request and assert the number of executed database queries is within budget.
+
+        Args:
+            endpoint: The partial URL endpoint to perform requests against.
+            budget: The maximum number of database queries allowed for the request.
+
+        Returns:
+            The number of database queries executed by the request.
+        """
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(endpoint)
+
+        self.assertEqual(response.status_code, 200, f'GET request received {response.status_code} instead of 200')
+        self.assertLessEqual(
+            len(queries), budget,
+            f'GET request executed {len(queries)} queries, exceeding the budget of {budget}:\n'
+            + '\n'.join(query['sql'] for query in queries.captured_queries))
+
+        return len(queries)
+
     def _assert_http_response(self, method, endpoint, expected_status, kwargs):
         """Assert the HTTP response for a specific method matches the expected status.
 
@@ -63,3 +91,41 @@ class CustomAsserts:
         arg_names = ('data', 'headers')
         arg_values = (kwargs.get(f'{method}_body', None), kwargs.get(f'{method}_headers', None))
         return {name: value for name, value in zip(arg_names, arg_values) if arg_values is not None}
+
+
+class QueryBudgetTests(CustomAsserts, ABC):
+    """Reusable tests asserting list requests execute a constant number of database queries.
+
+    The number of queries must not exceed the endpoint budget or grow with the number of returned records.
+    Subclasses define the `endpoint` and query `budget` and must implement `create_records`.
+    """
+
+    endpoint: str
+    budget: int
+
+    @abstractmethod
+    def create_records(self) -> None:
+        """Create additional records returned by the tested endpoint."""
+
+    def assert_constant_queries(self, username: str) -> None:
+        """Assert list requests by the given user execute a constant number of queries.
+
+        Args:
+            username: The name of the user submitting requests.
+        """
+
+        self.client.force_authenticate(user=User.objects.get(username=username))
+
+        initial_queries = self.assert_query_budget(self.endpoint, self.budget)
+        self.create_records()
+        self.assertEqual(initial_queries, self.assert_query_budget(self.endpoint, self.budget))
+
+    def test_staff_user_queries(self) -> None:
+        """Test the number of queries executed for staff users."""
+
+        self.assert_constant_queries('staff_user')
+
+    def test_group_member_queries(self) -> None:
+        """Test the number of queries executed for research group members."""
+
+        self.assert_constant_queries('member_1')